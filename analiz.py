@@ -0,0 +1,297 @@
+import io
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import olcum
+from depo_veri import (CSV_TIPLERI, HareketOzeti, hata_orani_hesapla, parca_toplamlari,
+                       stok_hatalari, tipleri_uygula)
+from fuzzy_system import toplu_performans_degerlendirme
+
+
+class AnalizSonucu:
+    """
+    Rapor metriklerinin tamamı: günlük ÇIKIŞ toplamları, en verimli
+    operatörler, ürün sıralaması ve veri kümesi bilgileri.
+
+    Hesaplama tek yerde yapılır; main.rapor_olustur ve GUI yalnızca bu
+    nesneyi kendi biçimlerinde yazdırır.
+    """
+
+    def __init__(self, ozet, n=3):
+        self.satir_sayisi = ozet.satir_sayisi
+        self.kg_toplam, self.adet_toplam = ozet.gunluk_ozet()
+        self.en_verimli = ozet.verimlilik_raporu(n)
+        self.urun_siralamasi = ozet.urun_siralamasi()
+        self.operator_sayilari = ozet.operator_sayilari
+        self.hata_oranlari = ozet.hata_oranlari()
+        self.operator_sayisi = len(self.operator_sayilari)
+        self.urun_cesidi = len(ozet.urun_ozeti)
+        self.tarih_min = ozet.tarih_min
+        self.tarih_max = ozet.tarih_max
+
+
+def analiz_et(veri, n=3):
+    """
+    DataFrame, HareketOzeti, ArtimliAnaliz veya hazır AnalizSonucu alır ve
+    AnalizSonucu döndürür. DataFrame tek gruplu geçişle
+    (depo_veri.gruplu_toplamlar) özetlenir; diğerleri zaten biriktirilmiş
+    toplamları kullanır.
+    """
+    if isinstance(veri, AnalizSonucu):
+        return veri
+    if isinstance(veri, ArtimliAnaliz):
+        return veri.anlik_goruntu(n)
+    if not isinstance(veri, HareketOzeti):
+        ozet = HareketOzeti()
+        with olcum.bolum('ozetleme'):
+            ozet.parca_ekle(veri)
+        veri = ozet
+    with olcum.bolum('analiz'):
+        return AnalizSonucu(veri, n)
+
+
+# Bu sayıdan az satırlık eklemeler pandas yerine düz döngüyle toplanır;
+# birkaç satır için groupby/bincount kurulum maliyeti satırların kendisinden büyüktür
+KUCUK_PARCA_SINIRI = 1000
+
+
+def _kucuk_parca_toplamlari(df):
+    """
+    Birkaç satırlık bir eklemenin toplamlarını düz Python döngüsüyle çıkarır.
+    Eksik anahtarlı satırlar parca_toplamlari ile aynı şekilde dışarıda kalır.
+    """
+    cikis, urunler, operatorler = {}, {}, {}
+    satirlar = zip(df['Hareket_Turu'].tolist(), df['Urun_Kodu'].tolist(), df['Miktar'].tolist(),
+                   df['Birim'].tolist(), df['Operator_ID'].tolist())
+    for tur, urun, miktar, birim, operator_id in satirlar:
+        # NaN kendisine eşit değildir
+        if operator_id == operator_id:
+            operatorler[operator_id] = operatorler.get(operator_id, 0) + 1
+        if not (tur == tur and urun == urun and birim == birim):
+            continue
+        if miktar != miktar:
+            miktar = 0
+        eski_miktar, eski_sayi = urunler.get(urun, (0, 0))
+        urunler[urun] = (eski_miktar + miktar, eski_sayi + 1)
+        if tur == 'CIKIS':
+            cikis[birim] = cikis.get(birim, 0) + miktar
+    return cikis, urunler, operatorler
+
+
+def _kucuk_parca_stok_hatalari(df, gunler, stok):
+    """
+    stok_hatalari'nın birkaç satırlık eklemeler için düz döngü karşılığı.
+    stok sözlüğünü yerinde günceller; operatör bazında (ÇIKIŞ, hatalı ÇIKIŞ)
+    sayılarını döndürür.
+    """
+    satirlar = sorted(
+        (urun, gun, i, tur, miktar, operator_id)
+        for i, (urun, gun, tur, miktar, operator_id) in enumerate(zip(
+            df['Urun_Kodu'].tolist(), gunler, df['Hareket_Turu'].tolist(),
+            df['Miktar'].tolist(), df['Operator_ID'].tolist()))
+        if urun == urun
+    )
+    cikislar, hatalar = {}, {}
+    for urun, _, _, tur, miktar, operator_id in satirlar:
+        if miktar != miktar:
+            miktar = 0
+        if tur == 'GIRIS':
+            stok[urun] = stok.get(urun, 0) + miktar
+        elif tur == 'CIKIS':
+            stok[urun] = stok.get(urun, 0) - miktar
+            if operator_id == operator_id:
+                cikislar[operator_id] = cikislar.get(operator_id, 0) + 1
+                if stok[urun] < 0:
+                    hatalar[operator_id] = hatalar.get(operator_id, 0) + 1
+    return cikislar, hatalar
+
+
+class ArtimliAnaliz:
+    """
+    Sürekli eklenen hareket kayıtları için artımlı toplayıcı.
+
+    Yeni satırlar geldikçe yalnızca o satırlar özetlenir ve sözlüklerdeki
+    ilgili anahtarlar güncellenir; önceki kayıtlar yeniden taranmaz.
+    İşlem sayıları yalnızca arttığından ilk k operatör listesi de her
+    güncellemede yalnızca değişen operatörlerle karşılaştırılarak korunur.
+    Güncelleme ve anlık görüntü bir kilitle korunur; satırlar başka bir
+    iş parçacığından eklenirken rapor alınabilir.
+    """
+
+    def __init__(self, k=3):
+        self.k = k
+        self._kilit = threading.Lock()
+        self.sifirla()
+
+    def sifirla(self):
+        """Tüm toplamları ve dosya takip konumunu sıfırlar"""
+        self.satir_sayisi = 0
+        self.cikis = {}
+        self.operatorler = {}
+        self.urunler = {}
+        self.tarih_min = None
+        self.tarih_max = None
+        self._lider = {}
+        self.stok = {}
+        self.cikis_sayilari = {}
+        self.hatali_cikislar = {}
+        self._dosya_konumu = 0
+        self._basliklar = None
+
+    def satir_ekle(self, df):
+        """Yeni hareket satırlarını (DataFrame) toplamlara ekler"""
+        if len(df) == 0:
+            return
+        if len(df) < KUCUK_PARCA_SINIRI:
+            cikis, urunler, operator_sayilari = _kucuk_parca_toplamlari(df)
+        else:
+            cikis, operator_sayilari, urunler = parca_toplamlari(df)
+            cikis = cikis.to_dict()
+            urunler = {urun: (satir['Miktar'], satir['Islem_Sayisi'])
+                       for urun, satir in urunler.to_dict('index').items()}
+            operator_sayilari = operator_sayilari.to_dict()
+        tarih = df['Tarih']
+        if not pd.api.types.is_datetime64_any_dtype(tarih):
+            tarih = pd.to_datetime(tarih, format='ISO8601')
+        tarih_min, tarih_max = tarih.min(), tarih.max()
+
+        with self._kilit:
+            # Yürüyen stok önceki eklemelerden devreder; bu yüzden kilit altında hesaplanır
+            if len(df) < KUCUK_PARCA_SINIRI:
+                gunler = tarih.to_numpy().astype('datetime64[D]').astype('int64').tolist()
+                cikislar, hatalar = _kucuk_parca_stok_hatalari(df, gunler, self.stok)
+            else:
+                urunler_parca = df['Urun_Kodu'].dropna().unique()
+                devreden = pd.Series({urun: self.stok.get(urun, 0) for urun in urunler_parca}, dtype='float64')
+                cikislar, hatalar, son_stok = stok_hatalari(df.assign(Tarih=tarih), devreden)
+                cikislar, hatalar = cikislar.to_dict(), hatalar.to_dict()
+                self.stok.update(son_stok.to_dict())
+            for operator_id, sayi in cikislar.items():
+                self.cikis_sayilari[operator_id] = self.cikis_sayilari.get(operator_id, 0) + sayi
+            for operator_id, sayi in hatalar.items():
+                self.hatali_cikislar[operator_id] = self.hatali_cikislar.get(operator_id, 0) + sayi
+
+            self.satir_sayisi += len(df)
+            for birim, miktar in cikis.items():
+                self.cikis[birim] = self.cikis.get(birim, 0) + miktar
+            for urun, (miktar, sayi) in urunler.items():
+                eski_miktar, eski_sayi = self.urunler.get(urun, (0, 0))
+                self.urunler[urun] = (eski_miktar + miktar, eski_sayi + sayi)
+            for operator_id, sayi in operator_sayilari.items():
+                yeni = self.operatorler.get(operator_id, 0) + sayi
+                self.operatorler[operator_id] = yeni
+                self._lideri_guncelle(operator_id, yeni)
+            if self.tarih_min is None or tarih_min < self.tarih_min:
+                self.tarih_min = tarih_min
+            if self.tarih_max is None or tarih_max > self.tarih_max:
+                self.tarih_max = tarih_max
+
+    def _lideri_guncelle(self, operator_id, sayi):
+        """
+        Liderlik tablosunu tek bir operatörün yeni sayısıyla günceller.
+        Sıralama anahtarı (-sayı, operatör); eşitlikte küçük kimlik önde.
+        """
+        if operator_id in self._lider or len(self._lider) < self.k:
+            self._lider[operator_id] = sayi
+            return
+        en_zayif = max(self._lider, key=lambda op: (-self._lider[op], op))
+        if (-sayi, operator_id) < (-self._lider[en_zayif], en_zayif):
+            del self._lider[en_zayif]
+            self._lider[operator_id] = sayi
+
+    def dosyadan_guncelle(self, dosya_yolu):
+        """
+        CSV dosyasına son çağrıdan beri eklenen tam satırları okuyup ekler
+        ve eklenen satır sayısını döndürür. Yarım yazılmış son satır bir
+        sonraki çağrıya bırakılır. Dosya kısalmışsa (döndürülmüş ya da
+        yeniden yazılmışsa) toplamlar sıfırlanıp baştan okunur.
+        """
+        if os.path.getsize(dosya_yolu) < self._dosya_konumu:
+            self.sifirla()
+        with open(dosya_yolu, 'rb') as f:
+            f.seek(self._dosya_konumu)
+            if self._basliklar is None:
+                baslik = f.readline()
+                if not baslik.endswith(b'\n'):
+                    return 0
+                self._basliklar = baslik.decode('utf-8-sig').strip().split(',')
+                self._dosya_konumu = f.tell()
+            veri = f.read()
+        son = veri.rfind(b'\n')
+        if son < 0:
+            return 0
+        self._dosya_konumu += son + 1
+        df = pd.read_csv(io.BytesIO(veri[:son + 1]), names=self._basliklar, dtype=CSV_TIPLERI)
+        self.satir_ekle(tipleri_uygula(df))
+        return len(df)
+
+    # --- HareketOzeti ile aynı arayüz (AnalizSonucu bunları kullanır) ---
+
+    @property
+    def operator_sayilari(self):
+        return pd.Series(self.operatorler, dtype='int64').sort_index()
+
+    @property
+    def urun_ozeti(self):
+        return pd.DataFrame.from_dict(
+            self.urunler, orient='index', columns=['Miktar', 'Islem_Sayisi']
+        ).sort_index()
+
+    def gunluk_ozet(self):
+        """Toplam ÇIKIŞ miktarlarını (KG, ADET) döndürür"""
+        return self.cikis.get('KG', 0), self.cikis.get('ADET', 0)
+
+    def verimlilik_raporu(self, n=3):
+        """En çok hareket yapan n operatörü döndürür (n <= k ise liderlik tablosundan)"""
+        kaynak = self._lider if n <= self.k else self.operatorler
+        sirali = sorted(kaynak.items(), key=lambda oge: (-oge[1], oge[0]))[:n]
+        return pd.Series(dict(sirali), dtype='int64')
+
+    def urun_siralamasi(self):
+        """Ürün özetini toplam miktara göre azalan sırada döndürür"""
+        return self.urun_ozeti.sort_values('Miktar', ascending=False)
+
+    def hata_oranlari(self):
+        """Operatör bazında stoku eksiye düşüren ÇIKIŞ oranı (HareketOzeti ile aynı tanım)"""
+        return hata_orani_hesapla(
+            pd.Series(self.cikis_sayilari, dtype='int64'),
+            pd.Series(self.hatali_cikislar, dtype='int64'),
+            self.operator_sayilari.index,
+        )
+
+    def anlik_goruntu(self, n=None):
+        """O anki toplamlardan rapor yazıcının kullanacağı AnalizSonucu üretir"""
+        with self._kilit:
+            return AnalizSonucu(self, self.k if n is None else n)
+
+
+def tum_operatorleri_skorla(veri, hata_oranlari=None):
+    """
+    Tüm operatörleri tek toplu fuzzy çağrısıyla puanlar ve skora göre
+    sıralı bir tablo döndürür (sütunlar: Islem_Sayisi, Hata_Orani,
+    Performans, Kategori; indeks Operator_ID, Sira 1'den başlar).
+
+    İşlem sayıları analiz sonucundaki tek geçişli operatör sayımından,
+    hata oranları hareket kaydından türetilen stok hatalarından alınır.
+    hata_oranlari operatör kimliğiyle indeksli bir Series olarak verilirse
+    onun yerine kullanılır (listede olmayan operatörler için 0 kabul edilir).
+    """
+    analiz_sonucu = analiz_et(veri)
+    sayilar = analiz_sonucu.operator_sayilari
+    if hata_oranlari is None:
+        hata_oranlari = analiz_sonucu.hata_oranlari
+    hata_oranlari = pd.Series(hata_oranlari).reindex(sayilar.index, fill_value=0.0).to_numpy()
+
+    sonuc = toplu_performans_degerlendirme(sayilar.to_numpy(), hata_oranlari)
+    tablo = pd.DataFrame({
+        'Islem_Sayisi': sayilar.to_numpy(),
+        'Hata_Orani': sonuc['hata_orani'],
+        'Performans': sonuc['performans'],
+        'Kategori': sonuc['kategori'],
+    }, index=pd.Index(sayilar.index, name='Operator_ID'))
+    tablo = tablo.sort_values(['Performans', 'Islem_Sayisi'], ascending=False, kind='stable')
+    tablo.insert(0, 'Sira', np.arange(1, len(tablo) + 1))
+    return tablo
@@ -0,0 +1,279 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import main
+from depo_veri import GUNLUK_UZANTISI, tipli_veri_oku
+from fuzzy_system import (ParalelSkorlayici, fuzzy_performans_degerlendirme,
+                          toplu_performans_degerlendirme, varsayilan_degerlendirici)
+from hareket_gunlugu import csv_den_donustur
+from sentetik_veri import SentetikVeri
+
+# Ölçülen boyutlar (satır veya çağrı sayısı); 10M için --boyut ile verilir
+VARSAYILAN_BOYUTLAR = [1_000, 100_000]
+
+# Tekil fuzzy çağrıları bu sayıyla sınırlanır (10M çağrı saatler sürer);
+# gecikme dağılımı için bu kadar örnek fazlasıyla yeterlidir
+TEKIL_CAGRI_SINIRI = 100_000
+
+
+def _olc(fonksiyon, tekrar):
+    """Fonksiyonu tekrar sayısı kadar çalıştırıp süreleri (saniye) döndürür"""
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        fonksiyon()
+        sureler.append(time.perf_counter() - baslangic)
+    return sureler
+
+
+def _sonuc(ad, boyut, sureler, **ek):
+    """Süre listesinden özet istatistikleri içeren sonuç kaydı üretir"""
+    en_iyi = min(sureler)
+    kayit = {
+        'ad': ad,
+        'boyut': boyut,
+        'tekrar': len(sureler),
+        'min_s': en_iyi,
+        'medyan_s': float(np.median(sureler)),
+        'ortalama_s': float(np.mean(sureler)),
+        'birim_basina_us': en_iyi / max(boyut, 1) * 1e6,
+        'saniyede': boyut / en_iyi if en_iyi > 0 else None,
+    }
+    kayit.update(ek)
+    return kayit
+
+
+def _girdiler(n, tohum=0):
+    """Veriden gelebilecek çözünürlükte (tam sayı işlem, 3 basamak hata) rastgele girdiler"""
+    rng = np.random.default_rng(tohum)
+    islem = rng.integers(0, 51, n)
+    hata = np.round(rng.random(n), 3)
+    return islem, hata
+
+
+def fuzzy_tekil_olc(n, tekrar):
+    """fuzzy_performans_degerlendirme: çağrı başına gecikme yüzdelikleri ve çağrı/s"""
+    n_olculen = min(n, TEKIL_CAGRI_SINIRI)
+    islem, hata = _girdiler(n_olculen)
+    islem, hata = islem.tolist(), hata.tolist()
+    varsayilan_degerlendirici()
+
+    gecikmeler = np.empty(n_olculen)
+    sureler = []
+    for _ in range(tekrar):
+        saat = time.perf_counter
+        toplam_bas = saat()
+        for i in range(n_olculen):
+            bas = saat()
+            fuzzy_performans_degerlendirme(islem[i], hata[i], 'Op-101')
+            gecikmeler[i] = saat() - bas
+        sureler.append(saat() - toplam_bas)
+
+    return _sonuc('fuzzy_tekil', n_olculen, sureler, istenen_boyut=n,
+                  p50_us=float(np.percentile(gecikmeler, 50) * 1e6),
+                  p99_us=float(np.percentile(gecikmeler, 99) * 1e6),
+                  maks_us=float(gecikmeler.max() * 1e6))
+
+
+def fuzzy_toplu_olc(n, tekrar):
+    """toplu_performans_degerlendirme: n skorun tek vektörel çağrıda hesaplanması"""
+    islem, hata = _girdiler(n)
+    varsayilan_degerlendirici()
+    sureler = _olc(lambda: toplu_performans_degerlendirme(islem, hata), tekrar)
+    return _sonuc('fuzzy_toplu', n, sureler)
+
+
+def paralel_olc(n, tekrar, en_fazla_cekirdek):
+    """
+    ParalelSkorlayici: 1..N çekirdekte n skorun süresi. Hızlanma, aynı
+    skorların tek süreçte (toplu_skorlar) hesaplanma süresine göredir.
+    """
+    islem, hata = _girdiler(n)
+    degerlendirici = varsayilan_degerlendirici()
+    sirali = min(_olc(lambda: degerlendirici.toplu_skorlar(islem, hata), tekrar))
+    sonuclar = []
+    for cekirdek in range(1, en_fazla_cekirdek + 1):
+        with ParalelSkorlayici(cekirdek, degerlendirici) as skorlayici:
+            skorlayici.skorla(islem, hata)  # süreçleri başlatır, paylaşılan bloğu ayırır
+            sureler = _olc(lambda: skorlayici.skorla(islem, hata), tekrar)
+        hizlanma = sirali / min(sureler)
+        sonuclar.append(_sonuc(f'fuzzy_paralel_{cekirdek}', n, sureler, cekirdek=cekirdek,
+                               sirali_s=sirali, hizlanma=hizlanma, verim=hizlanma / cekirdek))
+    return sonuclar
+
+
+def csv_okuma_olc(dosya_yolu, n, tekrar):
+    """Tipli CSV ayrıştırma (önbelleksiz), sütunsal önbellekten ve ikili günlükten okuma"""
+    sonuclar = [_sonuc('csv_okuma', n, _olc(lambda: tipli_veri_oku(dosya_yolu, onbellek=False), tekrar),
+                       bayt=os.path.getsize(dosya_yolu))]
+    tipli_veri_oku(dosya_yolu)  # önbelleği oluşturur
+    sonuclar.append(_sonuc('onbellek_okuma', n, _olc(lambda: tipli_veri_oku(dosya_yolu), tekrar)))
+    gunluk_yolu = os.path.splitext(dosya_yolu)[0] + GUNLUK_UZANTISI
+    csv_den_donustur(dosya_yolu, gunluk_yolu)
+    sonuclar.append(_sonuc('gunluk_okuma', n, _olc(lambda: tipli_veri_oku(gunluk_yolu), tekrar),
+                           bayt=os.path.getsize(gunluk_yolu)))
+    return sonuclar
+
+
+def ozet_olc(df, tekrar):
+    """main.gunluk_ozet ve main.verimlilik_raporu (DataFrame girdisiyle)"""
+    n = len(df)
+    return [
+        _sonuc('gunluk_ozet', n, _olc(lambda: main.gunluk_ozet(df), tekrar)),
+        _sonuc('verimlilik_raporu', n, _olc(lambda: main.verimlilik_raporu(df), tekrar)),
+    ]
+
+
+def rapor_olc(df, klasor, tekrar):
+    """main.rapor_olustur: analiz + fuzzy sonucu + metin + dosyaya yazma"""
+    rapor_yolu = os.path.join(klasor, 'analiz_raporu.txt')
+    fuzzy_sonuc = fuzzy_performans_degerlendirme(18, 0.05, 'Op-101')
+
+    def calistir():
+        with contextlib.redirect_stdout(io.StringIO()):
+            main.rapor_olustur(df, fuzzy_sonuc, dosya_yolu=rapor_yolu)
+
+    return _sonuc('rapor_olustur', len(df), _olc(calistir, tekrar))
+
+
+# Soğuk başlangıç ölçümleri: her biri yeni bir Python sürecinde çalışır
+BASLANGIC_KOMUTLARI = {
+    'baslangic_main_help': ['main.py', '--help'],
+    'baslangic_gui_import': ['-c', 'import gui_app'],
+    'baslangic_gui_hazir': ['-c', 'import gui_app; gui_app.warm_up_modules()'],
+}
+
+
+def baslangic_olc(tekrar):
+    """
+    main.py ve GUI modülünün yeni bir süreçte açılış süreleri. gui_import
+    pencerenin açılabildiği ana, gui_hazir arka plan ısınmasının bittiği ana
+    karşılık gelir.
+    """
+    klasor = os.path.dirname(os.path.abspath(__file__))
+    sonuclar = []
+    for ad, argumanlar in BASLANGIC_KOMUTLARI.items():
+        def calistir():
+            subprocess.run([sys.executable, *argumanlar], cwd=klasor, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            sonuclar.append(_sonuc(ad, 1, _olc(calistir, tekrar)))
+        except subprocess.CalledProcessError:
+            # Örn. tkinter kurulu olmayan ortamlarda GUI ölçümleri atlanır
+            continue
+    return sonuclar
+
+
+def _ortam():
+    """Sonuçların hangi commit ve ortamda alındığını kaydeder"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'tarih': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cekirdek': os.cpu_count(),
+    }
+
+
+def _yazdir(kayit):
+    satir = (f"{kayit['ad']:<20} {kayit['boyut']:>12,} {kayit['min_s']:>10.4f} s "
+             f"{kayit['birim_basina_us']:>10.3f} µs/birim")
+    if 'hizlanma' in kayit:
+        satir += f" {kayit['hizlanma']:>6.2f}x (verim {kayit['verim']:.0%})"
+    print(satir)
+
+
+def calistir(boyutlar=VARSAYILAN_BOYUTLAR, tekrar=3, tohum=0, cekirdek=None, yalniz_olcekleme=False):
+    """
+    Tüm ölçümleri verilen boyutlarda çalıştırıp sonuç sözlüğünü döndürür.
+    yalniz_olcekleme ise yalnızca 1..cekirdek çekirdekli skorlama ölçülür.
+    """
+    cekirdek = cekirdek or os.cpu_count() or 1
+    if yalniz_olcekleme:
+        sonuclar = []
+        for n in boyutlar:
+            for kayit in paralel_olc(n, tekrar, cekirdek):
+                _yazdir(kayit)
+                sonuclar.append(kayit)
+        return {'ortam': _ortam(), 'tekrar': tekrar, 'sonuclar': sonuclar}
+
+    sonuclar = baslangic_olc(tekrar)
+    for kayit in sonuclar:
+        print(f"{kayit['ad']:<20} {'':>12} {kayit['min_s']:>10.4f} s")
+    for n in boyutlar:
+        boyut_sonuclari = [fuzzy_tekil_olc(n, tekrar), fuzzy_toplu_olc(n, tekrar),
+                           *paralel_olc(n, tekrar, cekirdek)]
+        with tempfile.TemporaryDirectory(prefix='depo_bench_') as klasor:
+            dosya_yolu = os.path.join(klasor, f'sentetik_{n}.csv')
+            SentetikVeri(n, tohum=tohum).csv_yaz(dosya_yolu)
+            boyut_sonuclari.extend(csv_okuma_olc(dosya_yolu, n, tekrar))
+            df = tipli_veri_oku(dosya_yolu, onbellek=False)
+            boyut_sonuclari.extend(ozet_olc(df, tekrar))
+            boyut_sonuclari.append(rapor_olc(df, klasor, tekrar))
+            del df
+        sonuclar.extend(boyut_sonuclari)
+        for kayit in boyut_sonuclari:
+            _yazdir(kayit)
+    return {'ortam': _ortam(), 'tekrar': tekrar, 'sonuclar': sonuclar}
+
+
+def karsilastir(eski, yeni):
+    """İki sonuç dosyasındaki ortak ölçümlerin süre oranlarını (yeni/eski) yazdırır"""
+    eski_kayitlar = {(k['ad'], k['boyut']): k for k in eski['sonuclar']}
+    print(f"\n{'Ölçüm':<20} {'Boyut':>12} {'Eski (s)':>10} {'Yeni (s)':>10} {'Oran':>7}")
+    print("-" * 63)
+    for kayit in yeni['sonuclar']:
+        onceki = eski_kayitlar.get((kayit['ad'], kayit['boyut']))
+        if onceki is None:
+            continue
+        oran = kayit['min_s'] / onceki['min_s'] if onceki['min_s'] else float('nan')
+        print(f"{kayit['ad']:<20} {kayit['boyut']:>12,} {onceki['min_s']:>10.4f} "
+              f"{kayit['min_s']:>10.4f} {oran:>6.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fuzzy skorlama, veri okuma ve rapor ölçümleri")
+    parser.add_argument('--boyut', type=int, nargs='+', default=VARSAYILAN_BOYUTLAR,
+                        help="satır/çağrı sayıları (örn. --boyut 1000 100000 10000000)")
+    parser.add_argument('--tekrar', type=int, default=3, help="her ölçümün tekrar sayısı (en iyisi raporlanır)")
+    parser.add_argument('--tohum', type=int, default=0, help="sentetik veri tohumu")
+    parser.add_argument('--cekirdek', type=int, default=None,
+                        help="paralel skorlamada ölçülecek en fazla çekirdek (varsayılan: tümü)")
+    parser.add_argument('--olcekleme', action='store_true',
+                        help="yalnızca 1..N çekirdekli fuzzy skorlama ölçeklemesini ölçer")
+    parser.add_argument('--cikti', default='benchmark_sonuclari.json', help="JSON sonuç dosyası")
+    parser.add_argument('--karsilastir', metavar='ESKI_JSON',
+                        help="sonuçları önceki bir çalıştırmanın JSON dosyasıyla karşılaştırır")
+    args = parser.parse_args()
+
+    print(f"{'Ölçüm':<20} {'Boyut':>12} {'Süre':>12} {'Birim başına':>16}")
+    print("-" * 63)
+    sonuc = calistir(args.boyut, args.tekrar, args.tohum, args.cekirdek, args.olcekleme)
+    with open(args.cikti, 'w', encoding='utf-8') as f:
+        json.dump(sonuc, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Sonuçlar '{args.cikti}' dosyasına kaydedildi")
+
+    if args.karsilastir:
+        with open(args.karsilastir, encoding='utf-8') as f:
+            karsilastir(json.load(f), sonuc)
@@ -0,0 +1,696 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import olcum
+
+# Akış halinde okumada bir seferde belleğe alınan satır sayısı
+VARSAYILAN_PARCA_BOYUTU = 200_000
+
+# Özetler için gereken sütunlar
+OZET_SUTUNLARI = ['Tarih', 'Hareket_Turu', 'Urun_Kodu', 'Miktar', 'Birim', 'Operator_ID']
+
+# Düşük kardinaliteli kod sütunları kategorik tutulur (metin yerine küçük tam sayı kodları)
+KATEGORIK_SUTUNLAR = ['Hareket_Turu', 'Birim', 'Urun_Kodu', 'Operator_ID']
+CSV_TIPLERI = {sutun: 'category' for sutun in KATEGORIK_SUTUNLAR}
+
+# İkili hareket günlüğü (hareket_gunlugu.py) dosyalarının uzantısı; bu
+# uzantılı dosyalar CSV yerine günlük olarak okunur
+GUNLUK_UZANTISI = '.hgl'
+
+
+def tipleri_uygula(df):
+    """
+    Hareket tablosuna açık şemayı uygular: kod sütunları kategorik, Tarih
+    datetime64, Miktar sığdığı en küçük tam sayı tipi olur.
+    """
+    for sutun in KATEGORIK_SUTUNLAR:
+        if sutun in df and not isinstance(df[sutun].dtype, pd.CategoricalDtype):
+            df[sutun] = df[sutun].astype('category')
+    if 'Tarih' in df:
+        df['Tarih'] = pd.to_datetime(df['Tarih'], format='ISO8601')
+    if 'Miktar' in df:
+        df['Miktar'] = pd.to_numeric(df['Miktar'], downcast='integer')
+    return df
+
+
+def tipli_veri_oku(dosya_yolu, onbellek=True, mmap=False):
+    """
+    CSV dosyasını şemaya uygun, bellekte kompakt bir tablo olarak okur.
+    Güncel bir sütunsal önbellek varsa CSV yerine oradan okunur; yoksa
+    CSV ayrıştırıldıktan sonra önbelleğe yazılır. Önbellek yalnızca şema
+    sütunlarını (OZET_SUTUNLARI) tutar; CSV'de başka sütunlar da varsa tablo
+    her seferinde CSV'den okunur. İkili hareket günlüğü (.hgl) memmap
+    üzerinden okunur; önbellek kullanılmaz.
+    """
+    if gunluk_mu(dosya_yolu):
+        from hareket_gunlugu import HareketGunlugu
+        with olcum.bolum('gunluk_okuma'):
+            df = HareketGunlugu(dosya_yolu).tablo()
+        olcum.say('satir', len(df))
+        return df
+
+    if onbellek:
+        with olcum.bolum('onbellek_okuma'):
+            df = onbellekten_oku(dosya_yolu, mmap=mmap)
+        if df is not None:
+            olcum.say('satir', len(df))
+            return df
+
+    with olcum.bolum('csv_ayristirma'):
+        df = tipleri_uygula(pd.read_csv(dosya_yolu, dtype=CSV_TIPLERI))
+    olcum.say('satir', len(df))
+    if onbellek and not onbellek_gecerli(dosya_yolu):
+        for _ in _onbellege_yaz(dosya_yolu, [df]):
+            pass
+    return df
+
+
+def _onbellege_yaz(dosya_yolu, parcalar):
+    """
+    Parçaları önbelleğe yazarken aynen geri verir. Yazma hatası okumayı
+    bozmaz: yarım kalan önbellek silinir, parçalar önbelleksiz verilmeye
+    devam eder.
+    """
+    try:
+        yazici = OnbellekYazici(dosya_yolu)
+    except Exception:
+        yazici = None
+    try:
+        for parca in parcalar:
+            if yazici is not None:
+                try:
+                    with olcum.bolum('onbellek_yazma'):
+                        yazici.parca_yaz(parca)
+                except Exception:
+                    yazici.iptal()
+                    yazici = None
+            yield parca
+        if yazici is not None:
+            try:
+                yazici.bitir()
+            except Exception:
+                yazici.iptal()
+    except BaseException:
+        # Okuma hatası veya erken kapatma (ör. ilerleme geri çağrısından iptal)
+        if yazici is not None:
+            yazici.iptal()
+        raise
+
+
+def gunluk_mu(dosya_yolu):
+    """Dosya uzantısı ikili hareket günlüğünü gösteriyorsa True"""
+    return str(dosya_yolu).lower().endswith(GUNLUK_UZANTISI)
+
+
+def satir_basina_bellek(df):
+    """Tablonun satır başına bellek kullanımını (bayt) döndürür"""
+    return df.memory_usage(deep=True).sum() / max(len(df), 1)
+
+
+# --- HIZLI CSV YAZIMI ---
+# Her alanın alabileceği metinler (ayırıcıyla birlikte) bir kez sabit
+# genişlikli bayt tablolarına çevrilir. Blok önce (satır, toplam genişlik)
+# boyutlu bir matrise tablolardan kopyalanır, sonra dolgu baytları tek bir
+# maskeyle atılır. Satır başına Python döngüsü ve to_csv biçimlemesi
+# olmadığı için yazma hızı disk hızına yaklaşır.
+
+def csv_bayt_tablolari(metinler):
+    """
+    Sütun sırasıyla metin listelerinden (bayt tablosu, geçerli bayt maskesi)
+    çiftleri kurar; i. satır, i. kodun ayırıcıyla birlikte CSV metnidir.
+    """
+    tablolar = []
+    for i, degerler in enumerate(metinler):
+        ayirici = '\n' if i == len(metinler) - 1 else ','
+        baytlar = [(m + ayirici).encode('utf-8') for m in degerler]
+        genislik = max(len(b) for b in baytlar)
+        tablo = np.frombuffer(b''.join(b.ljust(genislik, b'\0') for b in baytlar),
+                              dtype=np.uint8).reshape(len(baytlar), genislik)
+        maske = np.arange(genislik) < np.array([len(b) for b in baytlar])[:, None]
+        tablolar.append((tablo, maske))
+    return tablolar
+
+
+def csv_blogu(kodlar, tablolar):
+    """Sütun sırasıyla kod dizilerinden bir bloğun CSV satırlarını tek bayt dizisi olarak kurar"""
+    n = len(kodlar[0])
+    genislik = sum(tablo.shape[1] for tablo, _ in tablolar)
+    matris = np.empty((n, genislik), dtype=np.uint8)
+    gecerli = np.empty((n, genislik), dtype=bool)
+    bas = 0
+    for kod, (tablo, maske) in zip(kodlar, tablolar):
+        son = bas + tablo.shape[1]
+        matris[:, bas:son] = tablo.take(kod, axis=0)
+        gecerli[:, bas:son] = maske.take(kod, axis=0)
+        bas = son
+    # Satır sırasıyla (C düzeni) geçerli baytlar art arda CSV satırlarını verir
+    return matris[gecerli]
+
+
+# Ürün, hareket türü ve birim tek bir birleşik anahtarda sayılır
+KUP_SUTUNLARI = ['Urun_Kodu', 'Hareket_Turu', 'Birim']
+
+
+def _kategorik(seri):
+    """Seriyi (gerekirse dönüştürerek) kategorik olarak döndürür"""
+    return seri if isinstance(seri.dtype, pd.CategoricalDtype) else seri.astype('category')
+
+
+def gruplu_toplamlar(df):
+    """
+    Tablonun tüm rapor toplamlarını tek geçişte çıkarır.
+
+    Kategori kodları birleşik bir anahtara çevrilip np.bincount ile sayılır;
+    boolean maske ya da ardışık groupby gerekmez. Dönen küp (Urun_Kodu,
+    Hareket_Turu, Birim) bazında Miktar toplamı ve işlem sayısını, ikinci
+    değer operatör bazında işlem sayısını içerir. Eksik kodlu satırlar,
+    groupby'da olduğu gibi, gruplara katılmaz.
+    """
+    sutunlar = [_kategorik(df[sutun]) for sutun in KUP_SUTUNLARI]
+    boyutlar = [len(s.cat.categories) + 1 for s in sutunlar]
+    # Kodlar 1 kaydırılır; eksik değerler (-1) 0. hücreye düşer
+    anahtar = np.ravel_multi_index([s.cat.codes.to_numpy() + 1 for s in sutunlar], boyutlar)
+    hucre_sayisi = int(np.prod(boyutlar))
+
+    miktar = df['Miktar'].to_numpy(dtype=np.float64, na_value=0.0)
+    toplam = np.bincount(anahtar, weights=miktar, minlength=hucre_sayisi)
+    sayi = np.bincount(anahtar, minlength=hucre_sayisi)
+
+    dolu = np.flatnonzero(sayi)
+    kodlar = np.unravel_index(dolu, boyutlar)
+    gecerli = np.all([k > 0 for k in kodlar], axis=0)
+    dolu = dolu[gecerli]
+    indeks = pd.MultiIndex.from_arrays(
+        [s.cat.categories.take(k[gecerli] - 1) for s, k in zip(sutunlar, kodlar)],
+        names=KUP_SUTUNLARI,
+    )
+    if pd.api.types.is_integer_dtype(df['Miktar'].dtype):
+        toplam = toplam.astype(np.int64)
+    kup = pd.DataFrame({'Miktar': toplam[dolu], 'Islem_Sayisi': sayi[dolu]}, index=indeks)
+
+    operatorler = _kategorik(df['Operator_ID'])
+    operator_sayilari = np.bincount(
+        operatorler.cat.codes.to_numpy() + 1, minlength=len(operatorler.cat.categories) + 1
+    )[1:]
+    operator_sayilari = pd.Series(operator_sayilari, index=operatorler.cat.categories.copy())
+    return kup, operator_sayilari[operator_sayilari > 0]
+
+
+def parca_toplamlari(df):
+    """
+    Bir parçanın birim bazında ÇIKIŞ toplamlarını, operatör işlem
+    sayılarını ve ürün toplamlarını döndürür. Tüm toplamlar tek geçişte
+    çıkarılır; kalan türetmeler küçük küp üzerinde yapılır.
+    """
+    kup, operator_sayilari = gruplu_toplamlar(df)
+    if 'CIKIS' in kup.index.levels[1]:
+        cikis = kup.xs('CIKIS', level='Hareket_Turu')
+    else:
+        cikis = kup.iloc[:0].droplevel('Hareket_Turu')
+    return (
+        cikis.groupby(level='Birim')['Miktar'].sum(),
+        operator_sayilari,
+        kup.groupby(level='Urun_Kodu').sum(),
+    )
+
+
+def _yuruyen_stok(df, baslangic_stok=None):
+    """
+    Satırları ürün ve tarihe göre (aynı gün içinde dosya sırasıyla) kararlı
+    sıralar ve her satırdan sonraki ürün stokunu hesaplar.
+
+    Döner: (sıra, sıralı satırların stoku, sıralı satırların ÇIKIŞ maskesi,
+    ürün kategorileri, sıralı ürün kodları, ürün grubu başları).
+    """
+    urunler = _kategorik(df['Urun_Kodu'])
+    gun = df['Tarih'].to_numpy().astype('datetime64[D]').astype(np.int64)
+    # Hareket türü, metin yerine kategori koduyla karşılaştırılır
+    turler = _kategorik(df['Hareket_Turu'])
+    kod = {ad: i for i, ad in enumerate(turler.cat.categories)}
+    miktar = df['Miktar'].to_numpy(dtype=np.float64, na_value=0.0)
+    devreden = np.zeros(len(urunler.cat.categories))
+    if baslangic_stok is not None and len(baslangic_stok):
+        devreden = baslangic_stok.reindex(urunler.cat.categories, fill_value=0).to_numpy(dtype=np.float64)
+    sira, stok, cikis, urun_sirali, baslar = _kodlu_yuruyen_stok(
+        urunler.cat.codes.to_numpy(), gun, turler.cat.codes.to_numpy(),
+        kod.get('GIRIS', -2), kod.get('CIKIS', -2), miktar, devreden)
+    return sira, stok, cikis, urunler, urun_sirali, baslar
+
+
+def _kodlu_yuruyen_stok(urun_kodlari, gun, tur_kodlari, giris_kodu, cikis_kodu, miktar, devreden):
+    """
+    _yuruyen_stok'un kod dizileri üzerinde çalışan çekirdeği. Eksik ürün
+    kodu (-1) olan satırlar atlanır; devreden, ürün koduyla indekslenen
+    başlangıç stoklarıdır (ikili hareket günlüğü bunu doğrudan kullanır).
+
+    Döner: (sıra, sıralı satırların stoku, sıralı satırların ÇIKIŞ maskesi,
+    sıralı ürün kodları, ürün grubu başları).
+    """
+    sira = np.lexsort((gun, urun_kodlari))
+    sira = sira[urun_kodlari[sira] >= 0]
+    urun_sirali = urun_kodlari[sira]
+    tur_kodlari = tur_kodlari[sira]
+    cikis = tur_kodlari == cikis_kodu
+    miktar = miktar[sira]
+    degisim = np.where(tur_kodlari == giris_kodu, miktar, np.where(cikis, -miktar, 0.0))
+
+    # Grup (ürün) başlarında kümülatif toplamı sıfırla, devreden stoku ekle
+    kumulatif = np.cumsum(degisim)
+    grup_basi = np.r_[True, urun_sirali[1:] != urun_sirali[:-1]] if len(sira) else np.zeros(0, bool)
+    baslar = np.flatnonzero(grup_basi)
+    grup = np.cumsum(grup_basi) - 1
+    ofset = kumulatif[baslar] - degisim[baslar] - devreden[urun_sirali[baslar]]
+    stok = kumulatif - ofset[grup]
+    return sira, stok, cikis, urun_sirali, baslar
+
+
+def _grup_sonlari(stok, baslar):
+    """Her ürün grubunun son satırının (ürünün son stokunun) sıralı dizideki konumu"""
+    return np.r_[baslar[1:] - 1, len(stok) - 1] if len(stok) else baslar
+
+
+def _son_stok(stok, urunler, urun_sirali, baslar):
+    """Her ürün grubunun son satırı, o ürünün parça sonundaki stokudur"""
+    sonlar = _grup_sonlari(stok, baslar)
+    return pd.Series(stok[sonlar], index=urunler.cat.categories.take(urun_sirali[sonlar]))
+
+
+def stok_hatalari(df, baslangic_stok=None):
+    """
+    Ürün bazında yürüyen stoku hesaplar ve stoku eksiye düşüren ÇIKIŞ'ları
+    operatör bazında sayar.
+
+    Satırlar ürün ve tarihe göre (aynı gün içinde dosya sırasıyla) kararlı
+    sıralanır; yürüyen stok tek bir kümülatif toplamdan, her ürün grubunun
+    başlangıç değeri çıkarılarak bulunur (gruplu cumsum, Python döngüsü
+    yok). GİRİŞ stoğu artırır, ÇIKIŞ azaltır; baslangic_stok (ürün
+    kodlu Series) önceki parçalardan devreden stoktur, yoksa 0 kabul edilir.
+
+    Döner: (operatör bazında ÇIKIŞ sayısı, operatör bazında stoku eksiye
+    düşüren ÇIKIŞ sayısı, parça sonundaki ürün stokları).
+    """
+    sira, stok, cikis, urunler, urun_sirali, baslar = _yuruyen_stok(df, baslangic_stok)
+
+    operatorler = _kategorik(df['Operator_ID'])
+    operator_kodlari = operatorler.cat.codes.to_numpy()[sira]
+    gecerli = operator_kodlari >= 0
+    n_operator = len(operatorler.cat.categories)
+    cikis_sayilari = np.bincount(operator_kodlari[cikis & gecerli], minlength=n_operator)
+    hatali = np.bincount(operator_kodlari[cikis & gecerli & (stok < 0)], minlength=n_operator)
+
+    adlar = operatorler.cat.categories
+    return (
+        pd.Series(cikis_sayilari, index=adlar.copy())[cikis_sayilari > 0],
+        pd.Series(hatali, index=adlar.copy())[cikis_sayilari > 0],
+        _son_stok(stok, urunler, urun_sirali, baslar),
+    )
+
+
+def stok_bayraklari(df, baslangic_stok=None):
+    """
+    stok_hatalari ile aynı yürüyen stoku satır bazında döndürür: ürünü
+    olan ÇIKIŞ satırları ve bunlardan stoku eksiye düşürenler (dosya
+    sırasıyla iki bool dizisi) ile parça sonundaki ürün stokları.
+    """
+    sira, stok, cikis, urunler, urun_sirali, baslar = _yuruyen_stok(df, baslangic_stok)
+    cikis_satiri = np.zeros(len(df), dtype=bool)
+    cikis_satiri[sira[cikis]] = True
+    eksi = np.zeros(len(df), dtype=bool)
+    eksi[sira[cikis & (stok < 0)]] = True
+    return cikis_satiri, eksi, _son_stok(stok, urunler, urun_sirali, baslar)
+
+
+def hata_orani_hesapla(cikis_sayilari, hatali_cikislar, operatorler):
+    """Hatalı ÇIKIŞ / toplam ÇIKIŞ oranını verilen operatör listesine göre döndürür"""
+    oran = hatali_cikislar.reindex(cikis_sayilari.index, fill_value=0) / cikis_sayilari
+    return oran.reindex(operatorler, fill_value=0.0).fillna(0.0).astype('float64')
+
+
+def _birlestir(eski, yeni):
+    """İki toplam serisini/tablosunu anahtar bazında toplar (tam sayı tipi korunur)"""
+    if isinstance(yeni.index, pd.CategoricalIndex):
+        # Parçaların kategori kümeleri farklı olabilir; düz indekse çevir
+        yeni = yeni.set_axis(yeni.index.astype(yeni.index.categories.dtype))
+    if eski is None or len(eski) == 0:
+        return yeni.sort_index()
+    return pd.concat([eski, yeni]).groupby(level=0).sum()
+
+
+class HareketOzeti:
+    """
+    Hareket verisinden parça parça biriktirilen özet değerler.
+
+    Tüm tablo bellekte tutulmaz; her parça okunduktan sonra yalnızca
+    birim bazında ÇIKIŞ toplamları, operatör işlem sayıları ve ürün
+    toplamları güncellenir. Bellek kullanımı parça boyutu ve farklı
+    operatör/ürün sayısıyla sınırlıdır.
+
+    Hata oranı için ürün stokları parçadan parçaya devredilir; parçalar
+    dosya sırasıyla işlendiğinden dosyanın (eklenen hareket kaydı gibi)
+    kabaca tarih sırasında olduğu varsayılır.
+    """
+
+    def __init__(self):
+        self.satir_sayisi = 0
+        self.cikis_toplamlari = pd.Series(dtype='int64')
+        self.operator_sayilari = pd.Series(dtype='int64')
+        self.urun_ozeti = pd.DataFrame({
+            'Miktar': pd.Series(dtype='int64'),
+            'Islem_Sayisi': pd.Series(dtype='int64'),
+        })
+        self.tarih_min = None
+        self.tarih_max = None
+        self.ilk_satirlar = None
+        self.stok = pd.Series(dtype='float64')
+        self.cikis_sayilari = pd.Series(dtype='int64')
+        self.hatali_cikislar = pd.Series(dtype='int64')
+
+    def parca_ekle(self, df):
+        """Bir veri parçasını özet değerlere ekler"""
+        if len(df) == 0:
+            return
+        if self.ilk_satirlar is None:
+            self.ilk_satirlar = df.head().copy()
+        self.satir_sayisi += len(df)
+
+        cikis, operator_sayilari, urunler = parca_toplamlari(df)
+        self.cikis_toplamlari = _birlestir(self.cikis_toplamlari, cikis)
+        self.operator_sayilari = _birlestir(self.operator_sayilari, operator_sayilari)
+        self.urun_ozeti = _birlestir(self.urun_ozeti, urunler)
+
+        # Yürüyen stok ve stoku eksiye düşüren ÇIKIŞ'lar (hata oranı için)
+        cikis_sayilari, hatali, son_stok = stok_hatalari(df, self.stok)
+        self.cikis_sayilari = _birlestir(self.cikis_sayilari, cikis_sayilari)
+        self.hatali_cikislar = _birlestir(self.hatali_cikislar, hatali)
+        self.stok = son_stok.combine_first(self.stok) if len(self.stok) else son_stok.sort_index()
+
+        # Tarih aralığı
+        tarih_min, tarih_max = df['Tarih'].min(), df['Tarih'].max()
+        if self.tarih_min is None or tarih_min < self.tarih_min:
+            self.tarih_min = tarih_min
+        if self.tarih_max is None or tarih_max > self.tarih_max:
+            self.tarih_max = tarih_max
+
+    def birlestir(self, diger):
+        """Başka bir dosyanın/parçanın özetini bu özete ekler (ör. depo bazında toplam)"""
+        if diger.satir_sayisi == 0:
+            return
+        if self.ilk_satirlar is None:
+            self.ilk_satirlar = diger.ilk_satirlar
+        self.satir_sayisi += diger.satir_sayisi
+        self.cikis_toplamlari = _birlestir(self.cikis_toplamlari, diger.cikis_toplamlari)
+        self.operator_sayilari = _birlestir(self.operator_sayilari, diger.operator_sayilari)
+        self.urun_ozeti = _birlestir(self.urun_ozeti, diger.urun_ozeti)
+        # Farklı depoların stokları ve hata sayıları toplanır
+        self.stok = _birlestir(self.stok, diger.stok)
+        self.cikis_sayilari = _birlestir(self.cikis_sayilari, diger.cikis_sayilari)
+        self.hatali_cikislar = _birlestir(self.hatali_cikislar, diger.hatali_cikislar)
+        if self.tarih_min is None or diger.tarih_min < self.tarih_min:
+            self.tarih_min = diger.tarih_min
+        if self.tarih_max is None or diger.tarih_max > self.tarih_max:
+            self.tarih_max = diger.tarih_max
+
+    def gunluk_ozet(self):
+        """Toplam ÇIKIŞ miktarlarını (KG, ADET) döndürür"""
+        return self.cikis_toplamlari.get('KG', 0), self.cikis_toplamlari.get('ADET', 0)
+
+    def verimlilik_raporu(self, n=3):
+        """En çok hareket yapan n operatörü döndürür"""
+        return self.operator_sayilari.sort_values(ascending=False).head(n)
+
+    def hata_oranlari(self):
+        """
+        Operatör bazında hata oranı: ÇIKIŞ'larından ürün stokunu eksiye
+        düşürenlerin payı (hiç ÇIKIŞ yapmayan operatörler için 0).
+        """
+        return hata_orani_hesapla(self.cikis_sayilari, self.hatali_cikislar, self.operator_sayilari.index)
+
+    def operator_ozeti(self, operator_id):
+        """Tek operatörün (işlem sayısı, hata oranı) değerleri; fuzzy girdisi"""
+        return (int(self.operator_sayilari.get(operator_id, 0)),
+                float(self.hata_oranlari().get(operator_id, 0.0)))
+
+    def urun_siralamasi(self):
+        """Ürün özetini toplam miktara göre azalan sırada döndürür"""
+        return self.urun_ozeti.sort_values('Miktar', ascending=False)
+
+
+def akis_ozeti_oku(dosya_yolu, parca_boyutu=VARSAYILAN_PARCA_BOYUTU, onbellek=True,
+                   ilerleme=None):
+    """
+    CSV dosyasını parça parça okuyup HareketOzeti döndürür (tüm tablo
+    belleğe alınmaz). Güncel önbellek varsa parçalar oradan okunur; yoksa
+    CSV'den okunan parçalar aynı geçişte önbelleğe de yazılır.
+
+    ilerleme verilirse her parçadan sonra 0-1 arası tamamlanma oranıyla
+    çağrılır. Geri çağrı bir istisna fırlatarak okumayı iptal edebilir;
+    bu durumda yarım kalan önbellek yazımı silinir.
+
+    İkili hareket günlüğü (.hgl) DataFrame kurulmadan, eşlenen kayıtların
+    kod alanları üzerinden özetlenir (HareketGunlugu.ozet).
+    """
+    if gunluk_mu(dosya_yolu):
+        from hareket_gunlugu import HareketGunlugu
+        gunluk = HareketGunlugu(dosya_yolu)
+        with olcum.bolum('gunluk_ozetleme'):
+            ozet = gunluk.ozet(parca_boyutu, ilerleme)
+        olcum.say('satir', ozet.satir_sayisi)
+        return ozet
+
+    dosya = None
+    if onbellek and onbellek_gecerli(dosya_yolu):
+        toplam = _onbellek_bilgisi(dosya_yolu)['satir_sayisi']
+        parcalar = onbellek_parcalari(dosya_yolu, parca_boyutu)
+        okuma_bolumu = 'onbellek_okuma'
+    else:
+        # İlerleme, dosya tanıtıcısının konumundan (okunan bayt) hesaplanır
+        dosya = open(dosya_yolu, 'rb')
+        toplam = os.fstat(dosya.fileno()).st_size
+        okuyucu = pd.read_csv(
+            dosya, usecols=OZET_SUTUNLARI, dtype=CSV_TIPLERI, chunksize=parca_boyutu
+        )
+        parcalar = (tipleri_uygula(parca) for parca in okuyucu)
+        if onbellek:
+            parcalar = _onbellege_yaz(dosya_yolu, parcalar)
+        okuma_bolumu = 'csv_ayristirma'
+
+    ozet = HareketOzeti()
+    try:
+        while True:
+            # Parçalar tembel üretildiği için okuma süresi next() çağrısında ölçülür
+            with olcum.bolum(okuma_bolumu):
+                parca = next(parcalar, None)
+            if parca is None:
+                break
+            olcum.say('satir', len(parca))
+            with olcum.bolum('ozetleme'):
+                ozet.parca_ekle(parca)
+            if ilerleme is not None:
+                okunan = dosya.tell() if dosya is not None else ozet.satir_sayisi
+                ilerleme(min(okunan / toplam, 1.0) if toplam else 1.0)
+    finally:
+        parcalar.close()
+        if dosya is not None:
+            dosya.close()
+    return ozet
+
+
+# --- SÜTUNSAL ÖNBELLEK ---
+# Ayrıştırılmış ve tiplenmiş veri, kaynak CSV'nin yanındaki .depo_onbellek/
+# klasöründe sütun başına ham ikili dosya olarak saklanır. Önbellek kaynak
+# dosyanın yolu, boyutu ve değişiklik zamanıyla eşleşmezse geçersiz sayılır.
+# Sütunlar np.memmap ile açılabildiğinden okuma metin ayrıştırmadan yapılır.
+
+ONBELLEK_KLASORU = '.depo_onbellek'
+_KOD_TIPI = np.int32
+
+
+def _kaynak_anahtari(dosya_yolu):
+    """Önbellek anahtarı: kaynak dosyanın mutlak yolu, boyutu ve değişiklik zamanı"""
+    durum = os.stat(dosya_yolu)
+    return {
+        'yol': os.path.abspath(dosya_yolu),
+        'boyut': durum.st_size,
+        'degisim': durum.st_mtime_ns,
+    }
+
+
+def onbellek_klasoru(dosya_yolu):
+    """Kaynak dosyaya ait önbellek klasörünün yolu"""
+    yol = os.path.abspath(dosya_yolu)
+    ozet = hashlib.sha1(yol.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(os.path.dirname(yol), ONBELLEK_KLASORU, ozet)
+
+
+def _onbellek_bilgisi(dosya_yolu):
+    """Geçerli önbelleğin meta verisini döndürür; yoksa veya eskiyse None"""
+    meta_yolu = os.path.join(onbellek_klasoru(dosya_yolu), 'meta.json')
+    try:
+        with open(meta_yolu, encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get('kaynak') == _kaynak_anahtari(dosya_yolu) else None
+
+
+def _onbellek_tam(meta):
+    """Önbellek kaynak CSV'nin tüm sütunlarını içeriyorsa True"""
+    return set(meta.get('kaynak_sutunlari', meta['sutunlar'])) <= set(meta['sutunlar'])
+
+
+def onbellek_gecerli(dosya_yolu, tum_sutunlar=False):
+    """
+    Kaynak dosya için güncel bir önbellek olup olmadığını döndürür.
+    tum_sutunlar ise önbelleğin CSV'nin tüm sütunlarını içermesi de aranır
+    (tipli_veri_oku'nun önbellekten okuyabilmesi için).
+    """
+    meta = _onbellek_bilgisi(dosya_yolu)
+    return meta is not None and (not tum_sutunlar or _onbellek_tam(meta))
+
+
+class OnbellekYazici:
+    """
+    Tiplenmiş veri parçalarını sütunsal önbelleğe ekleyerek yazar.
+
+    Yalnızca şema sütunları (OZET_SUTUNLARI) saklanır; CSV'nin diğer
+    sütunları (ör. açıklama metinleri) önbelleğe alınmaz, kaynak başlığı
+    meta veride tutulur. Her parçanın kategori kümesi farklı olabileceğinden
+    kodlar genel bir sözlüğe göre yeniden numaralandırılır. Yazım geçici bir
+    klasörde yapılır ve 'bitir' çağrıldığında tek adımda yerine taşınır.
+    """
+
+    def __init__(self, dosya_yolu):
+        self.kaynak = _kaynak_anahtari(dosya_yolu)
+        self.kaynak_sutunlari = pd.read_csv(dosya_yolu, nrows=0).columns.tolist()
+        self.hedef = onbellek_klasoru(dosya_yolu)
+        # Süreç kimliği yetmez: aynı süreçteki eşzamanlı yazımlar da ayrı geçici klasör alır
+        os.makedirs(os.path.dirname(self.hedef), exist_ok=True)
+        self.gecici = tempfile.mkdtemp(prefix=os.path.basename(self.hedef) + '.tmp-',
+                                       dir=os.path.dirname(self.hedef))
+        self.satir_sayisi = 0
+        self.sutunlar = None
+        self.kategoriler = {}
+        self._dosyalar = {}
+        self._miktar_tam_sayi = True
+        self._tarih_birimi = None
+
+    def parca_yaz(self, df):
+        """Tiplenmiş bir parçayı önbellek dosyalarının sonuna ekler"""
+        if self.sutunlar is None:
+            self.sutunlar = [sutun for sutun in df.columns if sutun in OZET_SUTUNLARI]
+        for sutun in self.sutunlar:
+            deger = df[sutun]
+            if sutun in KATEGORIK_SUTUNLAR:
+                veri = self._genel_kodlar(sutun, deger)
+            elif sutun == 'Tarih':
+                if self._tarih_birimi is None:
+                    self._tarih_birimi = np.datetime_data(deger.to_numpy().dtype)[0]
+                veri = deger.to_numpy(dtype=f'datetime64[{self._tarih_birimi}]').view(np.int64)
+            else:
+                veri = deger.to_numpy(dtype=np.float64)
+                if sutun == 'Miktar' and self._miktar_tam_sayi:
+                    self._miktar_tam_sayi = bool(np.all(veri == np.floor(veri)))
+            if sutun not in self._dosyalar:
+                self._dosyalar[sutun] = open(os.path.join(self.gecici, f'{sutun}.bin'), 'wb')
+            self._dosyalar[sutun].write(np.ascontiguousarray(veri).tobytes())
+        self.satir_sayisi += len(df)
+
+    def _genel_kodlar(self, sutun, deger):
+        """Parçanın kategori kodlarını genel kategori sözlüğüne göre çevirir"""
+        sozluk = self.kategoriler.setdefault(sutun, {})
+        for kategori in deger.cat.categories:
+            sozluk.setdefault(kategori, len(sozluk))
+        eslesme = np.array([sozluk[k] for k in deger.cat.categories] + [-1], dtype=_KOD_TIPI)
+        # Eksik değerlerin kodu -1'dir; eslesme[-1] de -1'e karşılık gelir
+        return eslesme[deger.cat.codes.to_numpy()]
+
+    def bitir(self):
+        """Meta veriyi yazar ve önbelleği yerine taşır"""
+        for f in self._dosyalar.values():
+            f.close()
+        meta = {
+            'kaynak': self.kaynak,
+            'satir_sayisi': self.satir_sayisi,
+            'sutunlar': self.sutunlar or [],
+            'kaynak_sutunlari': self.kaynak_sutunlari,
+            'kategoriler': {s: list(k) for s, k in self.kategoriler.items()},
+            'miktar_tam_sayi': self._miktar_tam_sayi,
+            'tarih_birimi': self._tarih_birimi or 'ns',
+        }
+        with open(os.path.join(self.gecici, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        if os.path.isdir(self.hedef):
+            shutil.rmtree(self.hedef, ignore_errors=True)
+        os.replace(self.gecici, self.hedef)
+
+    def iptal(self):
+        """Yarım kalan yazımı siler"""
+        for f in self._dosyalar.values():
+            f.close()
+        shutil.rmtree(self.gecici, ignore_errors=True)
+
+
+def _onbellek_sutunlari(dosya_yolu, meta, mmap):
+    """Önbellekteki ham sütun dizilerini (isteğe bağlı memmap ile) açar"""
+    klasor = onbellek_klasoru(dosya_yolu)
+    diziler = {}
+    for sutun in meta['sutunlar']:
+        if sutun in KATEGORIK_SUTUNLAR:
+            tip = _KOD_TIPI
+        elif sutun == 'Tarih':
+            tip = np.int64
+        else:
+            tip = np.float64
+        yol = os.path.join(klasor, f'{sutun}.bin')
+        if mmap and meta['satir_sayisi'] > 0:
+            diziler[sutun] = np.memmap(yol, dtype=tip, mode='r')
+        else:
+            diziler[sutun] = np.fromfile(yol, dtype=tip)
+    return diziler
+
+
+def _onbellek_tablosu(diziler, meta, bas, son):
+    """Ham sütun dilimlerinden tiplenmiş bir DataFrame kurar"""
+    df = pd.DataFrame(index=pd.RangeIndex(bas, son))
+    for sutun in meta['sutunlar']:
+        dilim = diziler[sutun][bas:son]
+        if sutun in KATEGORIK_SUTUNLAR:
+            kategoriler = meta['kategoriler'].get(sutun, [])
+            # CSV okumasıyla aynı sıralama için kategoriler alfabetik dizilir
+            df[sutun] = pd.Categorical.from_codes(dilim, categories=kategoriler) \
+                .reorder_categories(sorted(kategoriler))
+        elif sutun == 'Tarih':
+            df[sutun] = np.asarray(dilim).view(f"datetime64[{meta['tarih_birimi']}]")
+        elif sutun == 'Miktar' and meta['miktar_tam_sayi']:
+            df[sutun] = pd.to_numeric(np.asarray(dilim, dtype=np.int64), downcast='integer')
+        else:
+            df[sutun] = np.asarray(dilim)
+    return df
+
+
+def onbellekten_oku(dosya_yolu, mmap=False):
+    """
+    Geçerli önbellekten tiplenmiş tabloyu döndürür; önbellek yoksa ya da
+    CSV'nin önbellekte olmayan sütunları varsa None
+    """
+    meta = _onbellek_bilgisi(dosya_yolu)
+    if meta is None or not _onbellek_tam(meta):
+        return None
+    diziler = _onbellek_sutunlari(dosya_yolu, meta, mmap)
+    return _onbellek_tablosu(diziler, meta, 0, meta['satir_sayisi'])
+
+
+def onbellek_parcalari(dosya_yolu, parca_boyutu=VARSAYILAN_PARCA_BOYUTU):
+    """Geçerli önbellekteki tabloyu memmap üzerinden parça parça üretir"""
+    meta = _onbellek_bilgisi(dosya_yolu)
+    if meta is None:
+        raise FileNotFoundError(f"{dosya_yolu} için geçerli önbellek yok")
+    diziler = _onbellek_sutunlari(dosya_yolu, meta, mmap=True)
+    for bas in range(0, meta['satir_sayisi'], parca_boyutu):
+        yield _onbellek_tablosu(diziler, meta, bas, min(bas + parca_boyutu, meta['satir_sayisi']))
@@ -0,0 +1,542 @@
+import argparse
+import io
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+import numpy as np
+import pandas as pd
+
+import olcum
+from depo_veri import CSV_TIPLERI, HareketOzeti, stok_bayraklari, tipleri_uygula
+
+VARSAYILAN_VERITABANI = 'depo.sqlite'
+
+# İçe aktarmada bir seferde ayrıştırılan CSV bloğu (bayt, satır sınırına hizalanır)
+ICE_AKTARMA_BLOGU = 16 << 20
+
+# Miktar sütunları NUMERIC'tir: tam sayılar tam sayı, kesirli miktarlar
+# (ör. 50.5 KG) REAL olarak saklanır ve toplamları kesirli kalır
+_SEMA = """
+CREATE TABLE IF NOT EXISTS hareketler (
+    id INTEGER PRIMARY KEY,
+    Tarih INTEGER,
+    Hareket_Turu TEXT,
+    Urun_Kodu TEXT,
+    Miktar NUMERIC,
+    Birim TEXT,
+    Operator_ID TEXT,
+    Stok_Eksi INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS gunluk_operator (
+    Operator_ID TEXT NOT NULL,
+    Tarih INTEGER NOT NULL,
+    Islem_Sayisi INTEGER NOT NULL,
+    Cikis_Sayisi INTEGER NOT NULL,
+    Hatali_Cikis INTEGER NOT NULL,
+    PRIMARY KEY (Operator_ID, Tarih)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_gunluk_operator_tarih ON gunluk_operator(Tarih);
+CREATE TABLE IF NOT EXISTS gunluk_cikis (
+    Tarih INTEGER NOT NULL,
+    Birim TEXT NOT NULL,
+    Miktar NUMERIC NOT NULL,
+    PRIMARY KEY (Tarih, Birim)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS gunluk_urun (
+    Tarih INTEGER NOT NULL,
+    Urun_Kodu TEXT NOT NULL,
+    Miktar NUMERIC NOT NULL,
+    Islem_Sayisi INTEGER NOT NULL,
+    PRIMARY KEY (Tarih, Urun_Kodu)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS urunler (
+    Urun_Kodu TEXT PRIMARY KEY,
+    Stok REAL NOT NULL,
+    Miktar NUMERIC NOT NULL,
+    Islem_Sayisi INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS kaynaklar (
+    yol TEXT PRIMARY KEY,
+    konum INTEGER NOT NULL,
+    basliklar TEXT,
+    satir_sayisi INTEGER NOT NULL
+);
+"""
+
+_SEMA_TABLOLARI = ('hareketler', 'gunluk_operator', 'gunluk_cikis', 'gunluk_urun', 'urunler', 'kaynaklar')
+
+# Ham hareket tablosunun indeksleri; boş tabloya toplu yüklemede sonradan kurulur
+_HAREKET_INDEKSLERI = {
+    'ix_hareketler_operator': 'hareketler(Operator_ID, Tarih)',
+    'ix_hareketler_urun': 'hareketler(Urun_Kodu, Tarih)',
+    'ix_hareketler_tarih': 'hareketler(Tarih)',
+}
+
+# Toplam tablolarında (gunluk_*) tarihi boş satırların gün numarası. Bu
+# satırlar tüm geçmiş toplamlarına girer, tarih sınırı olan hiçbir aralığa
+# girmez; ham tablodaki Tarih'leri ise NULL'dur.
+TARIHSIZ_GUN = -(2 ** 31)
+
+_HAREKET_SUTUNLARI = ['Tarih', 'Hareket_Turu', 'Urun_Kodu', 'Miktar', 'Birim', 'Operator_ID']
+
+
+def _liste(seri):
+    """Seriyi sqlite3'ün bağlayabileceği düz Python listesine çevirir (eksikler None)"""
+    if seri.hasnans:
+        return seri.astype(object).where(seri.notna(), None).tolist()
+    return seri.astype(object).tolist() if isinstance(seri.dtype, pd.CategoricalDtype) else seri.tolist()
+
+
+def _gun_numarasi(tarih):
+    """Tarihi gün numarasına çevirir (None dokunulmaz)"""
+    if tarih is None:
+        return None
+    return int(np.datetime64(pd.Timestamp(tarih), 'D').astype(np.int64))
+
+
+def _kosul(bas=None, son=None, *ek):
+    """
+    WHERE ifadesi ve parametreleri. ek (sql, parametreler) çiftleri tarih
+    koşullarından önce eklenir. Sınırlar gün olarak dahildir; None sınır
+    koşul eklemez, böylece tüm geçmiş sorguları tarih indeksine zorlanmaz.
+    Sınırlardan biri verildiğinde tarihsiz (TARIHSIZ_GUN) satırlar dışarıda kalır.
+    """
+    kosullar, parametreler = [], []
+    for sql, degerler in ek:
+        kosullar.append(sql)
+        parametreler.extend(degerler)
+    if bas is not None:
+        kosullar.append('Tarih >= ?')
+        parametreler.append(_gun_numarasi(bas))
+    if son is not None:
+        kosullar.append('Tarih <= ?')
+        parametreler.append(_gun_numarasi(son))
+        if bas is None:
+            kosullar.append('Tarih > ?')
+            parametreler.append(TARIHSIZ_GUN)
+    return (' WHERE ' + ' AND '.join(kosullar) if kosullar else ''), tuple(parametreler)
+
+
+def _zaman(gun):
+    return None if gun is None else pd.Timestamp(gun, unit='D')
+
+
+def _miktarlar(degerler, index=None):
+    """Miktar toplamları; hepsi tam sayıysa int64, kesirli değer varsa float64 (önbellekteki gibi)"""
+    seri = pd.Series(degerler, index=index, dtype='float64')
+    if np.array_equal(seri.to_numpy(), np.floor(seri.to_numpy())):
+        return seri.astype('int64')
+    return seri
+
+
+class HareketVeritabani:
+    """
+    Hareket kayıtlarını indeksli bir SQLite dosyasında saklar.
+
+    Ham satırlar Operator_ID, Urun_Kodu ve Tarih indeksli 'hareketler'
+    tablosuna yazılır. İçe aktarma sırasında aynı işlem (transaction)
+    içinde gün bazında operatör, ÇIKIŞ ve ürün toplamları ile ürün stokları
+    güncellenir; rapor sorguları tüm geçmişi taramadan bu küçük tablolardan
+    yanıtlanır. Tek operatörün işlem sayısı ve hata oranı birincil anahtar
+    aralığında (en fazla gün sayısı kadar satır) toplanır.
+
+    Hata oranı için yürüyen stok içe aktarma sırasında hesaplanır ve
+    dosyalar arasında devreder; satırın stoku eksiye düşürüp düşürmediği
+    Stok_Eksi sütununda saklanır. Bu yüzden bir tarih aralığındaki hata
+    oranı, stoku aralık başında sıfırlamaz (TarihIndeksi ile aynı kural).
+    """
+
+    def __init__(self, yol=VARSAYILAN_VERITABANI, salt_okunur=False):
+        """
+        salt_okunur=True ise mevcut dosya yalnızca okumak için açılır: şema
+        oluşturulmaz, dosya değiştirilmez; hareket veritabanı değilse
+        ValueError fırlatılır.
+        """
+        self.yol = yol
+        self._kilit = threading.RLock()
+        # Bağlantı GUI'de arka plan iş parçacıkları arasında paylaşılır; erişim kilitle sıralanır
+        if salt_okunur:
+            if not os.path.isfile(yol):
+                raise FileNotFoundError(yol)
+            self._baglanti = sqlite3.connect(f'file:{urllib.parse.quote(os.path.abspath(yol))}?mode=ro',
+                                             uri=True, isolation_level=None, check_same_thread=False)
+            try:
+                self._sema_kontrol()
+            except BaseException:
+                self._baglanti.close()
+                raise
+            return
+        self._baglanti = sqlite3.connect(yol, isolation_level=None, check_same_thread=False)
+        for pragma in ('journal_mode=WAL', 'synchronous=NORMAL', 'temp_store=MEMORY',
+                       'cache_size=-65536'):
+            self._baglanti.execute(f'PRAGMA {pragma}')
+        self._baglanti.executescript(_SEMA)
+        self._indeksleri_kur()
+
+    def _sema_kontrol(self):
+        """Dosyada hareket veritabanının tüm tablolarının bulunduğunu doğrular"""
+        try:
+            tablolar = {satir[0] for satir in self._baglanti.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        except sqlite3.DatabaseError as hata:
+            raise ValueError(f"{self.yol} bir SQLite veritabanı değil") from hata
+        eksik = set(_SEMA_TABLOLARI) - tablolar
+        if eksik:
+            raise ValueError(f"{self.yol} bir hareket veritabanı değil (eksik tablolar: {', '.join(sorted(eksik))})")
+
+    def kapat(self):
+        with self._kilit:
+            self._baglanti.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.kapat()
+
+    def _sorgu(self, sql, parametreler=()):
+        with self._kilit:
+            return self._baglanti.execute(sql, parametreler).fetchall()
+
+    def _indeksleri_kur(self):
+        for ad, tanim in _HAREKET_INDEKSLERI.items():
+            self._baglanti.execute(f'CREATE INDEX IF NOT EXISTS {ad} ON {tanim}')
+
+    # --- İÇE AKTARMA ---
+
+    def ice_aktar(self, dosya_yolu, ilerleme=None):
+        """
+        CSV dosyasının son içe aktarmadan beri eklenen tam satırlarını
+        tek bir işlemde veritabanına ekler ve eklenen satır sayısını
+        döndürür; dosya zaten aktarılmışsa yalnızca yeni kuyruğu okunur.
+        Yarım yazılmış son satır bir sonraki çağrıya bırakılır. Dosya
+        kısalmışsa (yeniden yazılmışsa) veritabanı tüm kaynaklardan baştan
+        kurulur.
+
+        ilerleme verilirse her bloktan sonra 0-1 arası oranla çağrılır.
+        """
+        yol = os.path.abspath(dosya_yolu)
+        boyut = os.path.getsize(yol)
+        with self._kilit:
+            kayit = self._baglanti.execute(
+                'SELECT konum FROM kaynaklar WHERE yol = ?', (yol,)).fetchone()
+            if kayit is not None and boyut < kayit[0]:
+                return self.yeniden_olustur().get(yol, 0)
+            with olcum.bolum('veritabani_aktarma'):
+                return self._ice_aktar(yol, boyut, ilerleme)
+
+    def yeniden_olustur(self):
+        """
+        Tüm tabloları boşaltıp kayıtlı kaynak dosyaları baştan içe aktarır
+        (artık olmayanlar çıkarılır); dosya başına eklenen satır sayısını döndürür.
+        """
+        with self._kilit:
+            yollar = [satir[0] for satir in self._baglanti.execute('SELECT yol FROM kaynaklar ORDER BY rowid')]
+            self._baglanti.execute('BEGIN')
+            try:
+                for tablo in ('hareketler', 'gunluk_operator', 'gunluk_cikis', 'gunluk_urun', 'urunler'):
+                    self._baglanti.execute(f'DELETE FROM {tablo}')
+                self._baglanti.execute('UPDATE kaynaklar SET konum = 0, basliklar = NULL, satir_sayisi = 0')
+                self._baglanti.execute('COMMIT')
+            except BaseException:
+                self._baglanti.execute('ROLLBACK')
+                raise
+            eklenen = {}
+            with olcum.bolum('veritabani_aktarma'):
+                for yol in yollar:
+                    if os.path.exists(yol):
+                        eklenen[yol] = self._ice_aktar(yol, os.path.getsize(yol))
+                    else:
+                        self._baglanti.execute('DELETE FROM kaynaklar WHERE yol = ?', (yol,))
+            return eklenen
+
+    def _ice_aktar(self, yol, boyut, ilerleme=None):
+        baglanti = self._baglanti
+        kayit = baglanti.execute('SELECT konum, basliklar FROM kaynaklar WHERE yol = ?', (yol,)).fetchone()
+        konum, basliklar = kayit if kayit is not None else (0, None)
+        basliklar = basliklar.split(',') if basliklar else None
+        eklenen = 0
+
+        baglanti.execute('BEGIN')
+        try:
+            # Boş tabloya toplu yüklemede indeksler satırlardan sonra tek seferde kurulur
+            bos = baglanti.execute('SELECT 1 FROM hareketler LIMIT 1').fetchone() is None
+            if bos:
+                for ad in _HAREKET_INDEKSLERI:
+                    baglanti.execute(f'DROP INDEX IF EXISTS {ad}')
+            stok = dict(baglanti.execute('SELECT Urun_Kodu, Stok FROM urunler'))
+
+            with open(yol, 'rb') as f:
+                f.seek(konum)
+                if basliklar is None:
+                    baslik = f.readline()
+                    if baslik.endswith(b'\n'):
+                        basliklar = baslik.decode('utf-8-sig').strip().split(',')
+                        konum = f.tell()
+                kalan = b''
+                while basliklar is not None:
+                    blok = f.read(ICE_AKTARMA_BLOGU)
+                    veri = kalan + blok
+                    if blok:
+                        son = veri.rfind(b'\n') + 1
+                    elif kalan.strip() and kalan.count(b',') == len(basliklar) - 1:
+                        # Dosya satır sonu olmadan bitiyor; son satırın tüm alanları varsa o da alınır
+                        son = len(veri)
+                    else:
+                        break
+                    kalan = veri[son:]
+                    if son:
+                        df = tipleri_uygula(pd.read_csv(io.BytesIO(veri[:son]), names=basliklar,
+                                                        dtype=CSV_TIPLERI))
+                        self._parca_ekle(df, stok)
+                        eklenen += len(df)
+                        konum += son
+                        if ilerleme is not None:
+                            ilerleme(min(konum / max(boyut, 1), 1.0))
+                    if not blok:
+                        break
+
+            baglanti.executemany(
+                'INSERT INTO urunler (Urun_Kodu, Stok, Miktar, Islem_Sayisi) VALUES (?, ?, 0, 0) '
+                'ON CONFLICT(Urun_Kodu) DO UPDATE SET Stok = excluded.Stok',
+                stok.items(),
+            )
+            baglanti.execute(
+                'INSERT INTO kaynaklar (yol, konum, basliklar, satir_sayisi) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(yol) DO UPDATE SET konum = excluded.konum, basliklar = excluded.basliklar, '
+                'satir_sayisi = satir_sayisi + excluded.satir_sayisi',
+                (yol, konum, ','.join(basliklar) if basliklar else None, eklenen),
+            )
+            if bos:
+                self._indeksleri_kur()
+            baglanti.execute('COMMIT')
+        except BaseException:
+            baglanti.execute('ROLLBACK')
+            raise
+        olcum.say('satir', eklenen)
+        return eklenen
+
+    def _parca_ekle(self, df, stok):
+        """Bir bloğu ham tabloya yazar, gün bazındaki toplamları ve stokları günceller"""
+        if len(df) == 0:
+            return
+        baglanti = self._baglanti
+        urunler = df['Urun_Kodu'].dropna().unique()
+        devreden = pd.Series({urun: stok.get(urun, 0.0) for urun in urunler}, dtype='float64')
+        cikis, eksi, son_stok = stok_bayraklari(df, devreden)
+        stok.update(son_stok.to_dict())
+
+        tarih = df['Tarih']
+        gun = pd.Series(tarih.to_numpy().astype('datetime64[D]').astype(np.int64), index=df.index)
+        gun = gun.where(tarih.notna(), TARIHSIZ_GUN)
+        baglanti.executemany(
+            'INSERT INTO hareketler (Tarih, Hareket_Turu, Urun_Kodu, Miktar, Birim, Operator_ID, Stok_Eksi) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            zip(_liste(gun.where(tarih.notna()).astype('Int64')), _liste(df['Hareket_Turu']), _liste(df['Urun_Kodu']),
+                _liste(df['Miktar']), _liste(df['Birim']), _liste(df['Operator_ID']),
+                eksi.astype(np.int8).tolist()),
+        )
+
+        tablo = pd.DataFrame({
+            'Tarih': gun, 'Operator_ID': df['Operator_ID'], 'Urun_Kodu': df['Urun_Kodu'],
+            'Birim': df['Birim'], 'Miktar': df['Miktar'], 'cikis': cikis, 'eksi': eksi,
+            'cikis_turu': (df['Hareket_Turu'] == 'CIKIS').to_numpy(),
+        })
+        operatorler = tablo.groupby(['Operator_ID', 'Tarih'], observed=True).agg(
+            Islem_Sayisi=('cikis', 'size'), Cikis_Sayisi=('cikis', 'sum'), Hatali_Cikis=('eksi', 'sum'),
+        ).reset_index()
+        baglanti.executemany(
+            'INSERT INTO gunluk_operator VALUES (?, ?, ?, ?, ?) ON CONFLICT(Operator_ID, Tarih) DO UPDATE SET '
+            'Islem_Sayisi = Islem_Sayisi + excluded.Islem_Sayisi, '
+            'Cikis_Sayisi = Cikis_Sayisi + excluded.Cikis_Sayisi, '
+            'Hatali_Cikis = Hatali_Cikis + excluded.Hatali_Cikis',
+            zip(*(_liste(operatorler[sutun]) for sutun in
+                  ('Operator_ID', 'Tarih', 'Islem_Sayisi', 'Cikis_Sayisi', 'Hatali_Cikis'))),
+        )
+
+        # Ürün ve ÇIKIŞ toplamları, HareketOzeti'ndeki gibi ürün/tür/birim kodu eksiksiz satırlardan
+        tam = tablo[df['Urun_Kodu'].notna().to_numpy() & df['Hareket_Turu'].notna().to_numpy()
+                    & df['Birim'].notna().to_numpy()]
+        cikislar = tam[tam['cikis_turu']].groupby(['Tarih', 'Birim'], observed=True)['Miktar'].sum().reset_index()
+        baglanti.executemany(
+            'INSERT INTO gunluk_cikis VALUES (?, ?, ?) ON CONFLICT(Tarih, Birim) DO UPDATE SET '
+            'Miktar = Miktar + excluded.Miktar',
+            zip(*(_liste(cikislar[sutun]) for sutun in ('Tarih', 'Birim', 'Miktar'))),
+        )
+        gunluk_urun = tam.groupby(['Tarih', 'Urun_Kodu'], observed=True).agg(
+            Miktar=('Miktar', 'sum'), Islem_Sayisi=('Miktar', 'size'),
+        ).reset_index()
+        baglanti.executemany(
+            'INSERT INTO gunluk_urun VALUES (?, ?, ?, ?) ON CONFLICT(Tarih, Urun_Kodu) DO UPDATE SET '
+            'Miktar = Miktar + excluded.Miktar, Islem_Sayisi = Islem_Sayisi + excluded.Islem_Sayisi',
+            zip(*(_liste(gunluk_urun[sutun]) for sutun in ('Tarih', 'Urun_Kodu', 'Miktar', 'Islem_Sayisi'))),
+        )
+        urun_toplamlari = gunluk_urun.groupby('Urun_Kodu', observed=True)[['Miktar', 'Islem_Sayisi']].sum()
+        baglanti.executemany(
+            'INSERT INTO urunler (Urun_Kodu, Stok, Miktar, Islem_Sayisi) VALUES (?, 0, ?, ?) '
+            'ON CONFLICT(Urun_Kodu) DO UPDATE SET Miktar = Miktar + excluded.Miktar, '
+            'Islem_Sayisi = Islem_Sayisi + excluded.Islem_Sayisi',
+            zip(_liste(urun_toplamlari.index.to_series()), _liste(urun_toplamlari['Miktar']),
+                _liste(urun_toplamlari['Islem_Sayisi'])),
+        )
+
+    # --- SORGULAR ---
+
+    @property
+    def satir_sayisi(self):
+        return self._sorgu('SELECT COALESCE(SUM(satir_sayisi), 0) FROM kaynaklar')[0][0]
+
+    def tarih_araligi(self, bas=None, son=None):
+        """Aralıktaki ilk ve son hareket günü (Tarih indeksinde iki arama)"""
+        where, parametreler = _kosul(bas, son, ('Tarih IS NOT NULL', ()))
+        gunler = [self._sorgu(f'SELECT Tarih FROM hareketler{where} ORDER BY Tarih {yon} LIMIT 1', parametreler)
+                  for yon in ('ASC', 'DESC')]
+        return tuple(_zaman(gun[0][0]) if gun else None for gun in gunler)
+
+    def son_gunler(self, n_gun, bitis=None):
+        """Bitiş günü dahil son n_gun günü kapsayan (bas, son) tarihlerini döndürür"""
+        bitis = self.tarih_araligi()[1] if bitis is None else pd.Timestamp(bitis).normalize()
+        return bitis - pd.Timedelta(days=n_gun - 1), bitis
+
+    def gunluk_ozet(self, bas=None, son=None):
+        """Aralıktaki toplam ÇIKIŞ miktarlarını (KG, ADET) döndürür"""
+        where, parametreler = _kosul(bas, son, ("Birim IN ('KG', 'ADET')", ()))
+        toplamlar = dict(self._sorgu(f'SELECT Birim, SUM(Miktar) FROM gunluk_cikis{where} GROUP BY Birim',
+                                     parametreler))
+        return toplamlar.get('KG', 0), toplamlar.get('ADET', 0)
+
+    def _operator_toplamlari(self, bas=None, son=None):
+        where, parametreler = _kosul(bas, son)
+        satirlar = self._sorgu(
+            'SELECT Operator_ID, SUM(Islem_Sayisi), SUM(Cikis_Sayisi), SUM(Hatali_Cikis) '
+            f'FROM gunluk_operator{where} GROUP BY Operator_ID ORDER BY Operator_ID', parametreler)
+        tablo = pd.DataFrame(satirlar, columns=['Operator_ID', 'Islem_Sayisi', 'Cikis_Sayisi', 'Hatali_Cikis'])
+        return tablo.set_index('Operator_ID').astype('int64')
+
+    def operator_sayilari(self, bas=None, son=None):
+        """Aralıktaki operatör işlem sayıları"""
+        return self._operator_toplamlari(bas, son)['Islem_Sayisi'].rename(None)
+
+    def verimlilik_raporu(self, n=3, bas=None, son=None):
+        """Aralıkta en çok hareket yapan n operatör (eşitlikte küçük kimlik önde)"""
+        where, parametreler = _kosul(bas, son)
+        satirlar = self._sorgu(
+            f'SELECT Operator_ID, SUM(Islem_Sayisi) AS toplam FROM gunluk_operator{where} '
+            'GROUP BY Operator_ID ORDER BY toplam DESC, Operator_ID LIMIT ?', (*parametreler, n))
+        return pd.Series(dict(satirlar), dtype='int64')
+
+    def operator_ozeti(self, operator_id, bas=None, son=None):
+        """Tek operatörün (işlem sayısı, hata oranı) değerleri; birincil anahtar aralığından"""
+        where, parametreler = _kosul(bas, son, ('Operator_ID = ?', (operator_id,)))
+        islem, cikis, hatali = self._sorgu(
+            'SELECT COALESCE(SUM(Islem_Sayisi), 0), COALESCE(SUM(Cikis_Sayisi), 0), '
+            f'COALESCE(SUM(Hatali_Cikis), 0) FROM gunluk_operator{where}', parametreler)[0]
+        return int(islem), (hatali / cikis if cikis else 0.0)
+
+    def _hareketler(self, kosul, limit=None, sira='Tarih, id'):
+        where, parametreler = kosul
+        sql = f'SELECT {", ".join(_HAREKET_SUTUNLARI)} FROM hareketler{where} ORDER BY {sira}'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        df = pd.DataFrame(self._sorgu(sql, parametreler), columns=_HAREKET_SUTUNLARI)
+        # Gün numarası ISO metnine çevrilir (tarihsiz satır boş metin); tipler CSV'den okunmuş gibi uygulanır
+        gun = pd.to_numeric(df['Tarih']).to_numpy(dtype=np.float64, na_value=np.nan)
+        tarihli = ~np.isnan(gun)
+        metin = np.full(len(gun), '', dtype=object)
+        metin[tarihli] = np.datetime_as_string(gun[tarihli].astype(np.int64).astype('datetime64[D]'))
+        df['Tarih'] = metin
+        return tipleri_uygula(df)
+
+    def operator_hareketleri(self, operator_id, bas=None, son=None, limit=None):
+        """Operatörün aralıktaki hareket satırları (Operator_ID, Tarih indeksinden)"""
+        return self._hareketler(_kosul(bas, son, ('Operator_ID = ?', (operator_id,))), limit)
+
+    def urun_hareketleri(self, urun_kodu, bas=None, son=None, limit=None):
+        """Ürünün aralıktaki hareket satırları (Urun_Kodu, Tarih indeksinden)"""
+        return self._hareketler(_kosul(bas, son, ('Urun_Kodu = ?', (urun_kodu,))), limit)
+
+    def ozet(self, bas=None, son=None):
+        """Aralığın HareketOzeti uyumlu özeti; analiz_et ve rapor_olustur ile kullanılır"""
+        with olcum.bolum('veritabani_sorgu'):
+            return VeritabaniOzeti(self, bas, son)
+
+
+class VeritabaniOzeti(HareketOzeti):
+    """
+    HareketVeritabani'nın toplam tablolarından doldurulan HareketOzeti.
+    Aralığın operatör toplamları (işlem, ÇIKIŞ ve hatalı ÇIKIŞ sayıları)
+    özetin içindedir; özet, bağlantı kapatıldıktan sonra da GUI'deki
+    operatör seçimi ve fuzzy değerlendirmesi için kullanılabilir.
+    """
+
+    def __init__(self, veritabani, bas=None, son=None):
+        super().__init__()
+        self.bas, self.son = bas, son
+        where, parametreler = _kosul(bas, son)
+        tum_gecmis = bas is None and son is None
+
+        operatorler = veritabani._operator_toplamlari(bas, son)
+        self.operator_sayilari = operatorler['Islem_Sayisi'].rename(None)
+        cikan = operatorler[operatorler['Cikis_Sayisi'] > 0]
+        self.cikis_sayilari = cikan['Cikis_Sayisi'].rename(None)
+        self.hatali_cikislar = cikan['Hatali_Cikis'].rename(None)
+
+        cikislar = veritabani._sorgu(
+            f'SELECT Birim, SUM(Miktar) FROM gunluk_cikis{where} GROUP BY Birim ORDER BY Birim', parametreler)
+        self.cikis_toplamlari = _miktarlar(dict(cikislar))
+
+        if tum_gecmis:
+            self.satir_sayisi = veritabani.satir_sayisi
+            urunler = veritabani._sorgu(
+                'SELECT Urun_Kodu, Miktar, Islem_Sayisi FROM urunler WHERE Islem_Sayisi > 0 ORDER BY Urun_Kodu')
+        else:
+            self.satir_sayisi = veritabani._sorgu(f'SELECT COUNT(*) FROM hareketler{where}', parametreler)[0][0]
+            urunler = veritabani._sorgu(
+                f'SELECT Urun_Kodu, SUM(Miktar), SUM(Islem_Sayisi) FROM gunluk_urun{where} '
+                'GROUP BY Urun_Kodu ORDER BY Urun_Kodu', parametreler)
+        urun_ozeti = pd.DataFrame(urunler, columns=['Urun_Kodu', 'Miktar', 'Islem_Sayisi']).set_index(
+            'Urun_Kodu').rename_axis(None)
+        self.urun_ozeti = pd.DataFrame({'Miktar': _miktarlar(urun_ozeti['Miktar']),
+                                        'Islem_Sayisi': urun_ozeti['Islem_Sayisi'].astype('int64')})
+        self.stok = pd.Series(dict(veritabani._sorgu('SELECT Urun_Kodu, Stok FROM urunler ORDER BY Urun_Kodu')),
+                              dtype='float64')
+        self.tarih_min, self.tarih_max = veritabani.tarih_araligi(bas, son)
+        if self.satir_sayisi:
+            # Tüm geçmişte dosya sırası, aralıkta tarih sırası (TarihIndeksi ile aynı)
+            self.ilk_satirlar = veritabani._hareketler((where, parametreler), limit=5,
+                                                       sira='id' if tum_gecmis else 'Tarih, id')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hareket CSV'lerini indeksli SQLite veritabanına aktarır ve sorgular")
+    parser.add_argument('veritabani', help="SQLite dosyası (yoksa oluşturulur)")
+    parser.add_argument('dosyalar', nargs='*', help="içe aktarılacak CSV dosyaları (yalnızca yeni satırlar eklenir)")
+    parser.add_argument('--operator', default=None, help="tek operatörün işlem sayısı ve hata oranı")
+    parser.add_argument('--gun', type=int, default=None, help="sorguları son N günle sınırlar")
+    parser.add_argument('--bitis', default=None, help="--gun penceresinin bitiş günü (YYYY-AA-GG)")
+    args = parser.parse_args()
+
+    with HareketVeritabani(args.veritabani) as db:
+        for dosya in args.dosyalar:
+            baslangic = time.perf_counter()
+            eklenen = db.ice_aktar(dosya)
+            sure = time.perf_counter() - baslangic
+            print(f"✓ {dosya}: {eklenen:,} yeni satır, {sure:.2f} s "
+                  f"({eklenen / max(sure, 1e-9):,.0f} satır/s)")
+
+        bas = son = None
+        if args.gun:
+            bas, son = db.son_gunler(args.gun, args.bitis)
+        kg, adet = db.gunluk_ozet(bas, son)
+        print(f"Toplam {db.satir_sayisi:,} satır; ÇIKIŞ {kg} KG, {adet} ADET")
+        for sira, (operator_id, sayi) in enumerate(db.verimlilik_raporu(3, bas, son).items(), 1):
+            print(f"   {sira}. {operator_id}: {sayi} işlem")
+        if args.operator:
+            baslangic = time.perf_counter()
+            islem_sayisi, hata_orani = db.operator_ozeti(args.operator, bas, son)
+            sure = time.perf_counter() - baslangic
+            print(f"{args.operator}: {islem_sayisi} işlem, hata oranı {hata_orani:.3f} "
+                  f"(sorgu {sure * 1e3:.2f} ms)")
@@ -1,102 +1,1003 @@
+import hashlib
+import json
+import os
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
+
+import olcum
+
+
+# Üyelik fonksiyonları ve kurallar bu dosyadan okunur (depo bazında ayarlanabilir)
+VARSAYILAN_KURAL_DOSYASI = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'kurallar.json'
+)
+
+# Toplu değerlendirmede bellek kullanımını sınırlamak için parça boyutu
+TOPLU_PARCA_BOYUTU = 2048
+
+# Debug çıktısında girdi değişkenlerinin anahtar adları (GUI'nin beklediği format)
+_DEBUG_ANAHTARLARI = {
+    'islem_sayisi': 'islem_uyelikleri',
+    'hata_orani': 'hata_uyelikleri',
+}
+
+
+# --- KURAL TABANI ---
+
+def _kirilma_noktalari(tip, parametreler):
+    """trimf/trapmf tanımını parçalı doğrusal (x, y) kırılma noktalarına çevirir"""
+    if tip == 'trimf':
+        a, b, c = parametreler
+        noktalar = [(a, 0.0), (b, 1.0), (c, 0.0)]
+    elif tip == 'trapmf':
+        a, b, c, d = parametreler
+        noktalar = [(a, 0.0), (b, 1.0), (c, 1.0), (d, 0.0)]
+    else:
+        raise ValueError(f"Desteklenmeyen üyelik fonksiyonu: {tip}")
+
+    # Omuz durumunda (ör. a == b) tekrarlanan x değerini atıp tepe değerini koru
+    xp, fp = [], []
+    for x, y in noktalar:
+        if xp and x == xp[-1]:
+            fp[-1] = max(fp[-1], y)
+        else:
+            xp.append(float(x))
+            fp.append(y)
+    return np.array(xp), np.array(fp)
+
+
+def _evren(tanim):
+    """[baslangic, bitis, adim] tanımından evren noktalarını üretir"""
+    bas, son, adim = tanim
+    return np.linspace(bas, son, int(round((son - bas) / adim)) + 1)
+
+
+class KuralTabani:
+    """
+    Kural dosyasının derlenmiş hali.
+
+    Üyelik fonksiyonları kırılma noktalarına, kural koşulları ise girdi
+    terimlerinin düz listesindeki dizinlere çevrilir. Plan bir kez derlenir;
+    tekil motor, toplu motor ve debug aktivasyonları aynı planı kullanır.
+
+    Her kural isteğe bağlı bir 'agirlik' (0-1, varsayılan 1) alabilir; kural
+    aktivasyonu bu değerle çarpılır (scikit-fuzzy'deki ağırlıklı sonuç gibi).
+    Eksik girdi/çıktı değişkeni, tanımsız terim, bilinmeyen operatör, koşulsuz
+    kural, geçersiz ağırlık ya da boş kural listesi ValueError verir; kural
+    hatalarında mesaj kuralın sıra numarasını içerir.
+    """
+
+    GIRDILER = ('islem_sayisi', 'hata_orani')
+    CIKTI = 'performans'
+
+    def __init__(self, tanim, kaynak=None):
+        self.kaynak = kaynak
+        # Tanımın parmak izi: önceden hesaplanmış çıktıların hangi kurallarla üretildiğini belirler
+        self.imza = hashlib.sha1(
+            json.dumps(tanim, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()[:16]
+        degiskenler = tanim.get('degiskenler', {})
+        for ad in self.GIRDILER + (self.CIKTI,):
+            if ad not in degiskenler:
+                raise ValueError(f"Kural tabanında '{ad}' değişkeni tanımlı değil")
+
+        # 1. Girdi terimleri tek bir düz listede toplanır (dizin = üyelik satırı)
+        self.girdi_sinirlari = {}
+        self.girdi_terimleri = {}
+        self.terim_kn = []
+        terim_dizinleri = {}
+        for degisken in self.GIRDILER:
+            evren = _evren(degiskenler[degisken]['evren'])
+            self.girdi_sinirlari[degisken] = (float(evren[0]), float(evren[-1]))
+            self.girdi_terimleri[degisken] = []
+            for terim, (tip, parametreler) in degiskenler[degisken]['terimler'].items():
+                terim_dizinleri[(degisken, terim)] = len(self.terim_kn)
+                self.girdi_terimleri[degisken].append((terim, len(self.terim_kn)))
+                self.terim_kn.append(_kirilma_noktalari(tip, parametreler))
+
+        # 2. Çıktı değişkeni
+        cikti = degiskenler[self.CIKTI]
+        self.cikti_evreni = _evren(cikti['evren'])
+        self.cikti_terimleri = list(cikti['terimler'])
+        self.cikti_kn = [_kirilma_noktalari(tip, p) for tip, p in cikti['terimler'].values()]
+
+        # 3. Kurallar
+        self.kural_aciklamalari = []
+        self.kural_operatorleri = []
+        self.kural_kosullari = []
+        self.kural_sonuclari = []
+        self.kural_agirliklari = []
+        for no, kural in enumerate(tanim.get('kurallar', []), 1):
+            operator = kural.get('operator', 've')
+            if operator not in ('ve', 'veya'):
+                raise ValueError(f"Kural {no}: bilinmeyen operatör '{operator}' (ve/veya olmalı)")
+            kosullar = []
+            for degisken, terim in kural.get('kosullar', []):
+                if (degisken, terim) not in terim_dizinleri:
+                    raise ValueError(f"Kural {no}: tanımsız terim '{degisken}.{terim}'")
+                kosullar.append(terim_dizinleri[(degisken, terim)])
+            if not kosullar:
+                raise ValueError(f"Kural {no}: en az bir koşul gerekli")
+            if kural.get('sonuc') not in self.cikti_terimleri:
+                raise ValueError(f"Kural {no}: tanımsız sonuç terimi '{kural.get('sonuc')}'")
+            agirlik = kural.get('agirlik', 1.0)
+            if isinstance(agirlik, bool) or not isinstance(agirlik, (int, float)) or not 0 <= agirlik <= 1:
+                raise ValueError(f"Kural {no}: ağırlık 0 ile 1 arasında bir sayı olmalı ({agirlik!r})")
+
+            self.kural_aciklamalari.append(kural.get('aciklama', ''))
+            self.kural_operatorleri.append(operator)
+            self.kural_kosullari.append(kosullar)
+            self.kural_sonuclari.append(self.cikti_terimleri.index(kural['sonuc']))
+            self.kural_agirliklari.append(float(agirlik))
+        if not self.kural_kosullari:
+            raise ValueError("Kural tabanında hiç kural yok")
+        # Tüm ağırlıklar 1 ise aktivasyonlar hiç çarpılmaz (skorlar bit düzeyinde değişmez)
+        self.agirliklar = (np.array(self.kural_agirliklari)
+                           if any(a != 1.0 for a in self.kural_agirliklari) else None)
+
+        # 4. Vektörel değerlendirme için dolgulu dizin matrisi. Üyelik
+        # matrisinin sonuna sabit 1 ve 0 satırları eklenir; VE kuralları 1,
+        # VEYA kuralları 0 satırıyla doldurulur ki dolgu sonucu değiştirmesin.
+        self.bir_satiri = len(self.terim_kn)
+        self.sifir_satiri = len(self.terim_kn) + 1
+        genislik = max(len(k) for k in self.kural_kosullari)
+        dolgu = {'ve': self.bir_satiri, 'veya': self.sifir_satiri}
+        self.kosul_matrisi = np.array([
+            k + [dolgu[op]] * (genislik - len(k))
+            for k, op in zip(self.kural_kosullari, self.kural_operatorleri)
+        ], dtype=np.intp)
+        operatorler = np.array(self.kural_operatorleri)
+        self.ve_kurallari = np.flatnonzero(operatorler == 've')
+        self.veya_kurallari = np.flatnonzero(operatorler == 'veya')
+        sonuclar = np.array(self.kural_sonuclari)
+        self.sonuc_gruplari = [
+            np.flatnonzero(sonuclar == t) for t in range(len(self.cikti_terimleri))
+        ]
+
+    @classmethod
+    def dosyadan(cls, dosya_yolu=None):
+        """JSON kural dosyasını okuyup derler"""
+        dosya_yolu = dosya_yolu or VARSAYILAN_KURAL_DOSYASI
+        with open(dosya_yolu, encoding='utf-8') as f:
+            return cls(json.load(f), kaynak=dosya_yolu)
+
+    @property
+    def kural_sayisi(self):
+        return len(self.kural_kosullari)
+
+
+# --- TEKİL DEĞERLENDİRME ---
+
+def _performans_kategorisi(score):
+    """Skoru performans kategorisine çevirir"""
+    if score >= 70: return "YÜKSEK PERFORMANS 🚀"
+    elif score >= 40: return "ORTA PERFORMANS ⚠️"
+    else: return "DÜŞÜK PERFORMANS 🔻"
+
+
+def _toplu_kategoriler(skorlar):
+    """Skor dizisini performans kategorileri dizisine çevirir"""
+    return np.select(
+        [skorlar >= 70, skorlar >= 40],
+        ["YÜKSEK PERFORMANS 🚀", "ORTA PERFORMANS ⚠️"],
+        default="DÜŞÜK PERFORMANS 🔻",
+    )
+
+
+def _interp(x, xp, fp):
+    """np.interp'in tek değer için saf Python karşılığı"""
+    if x <= xp[0]:
+        return fp[0]
+    if x >= xp[-1]:
+        return fp[-1]
+    i = bisect_right(xp, x) - 1
+    return fp[i] + (fp[i + 1] - fp[i]) * (x - xp[i]) / (xp[i + 1] - xp[i])
+
+
+class FuzzyDegerlendirici:
+    """
+    Harici kütüphane kullanmayan Mamdani çıkarım motoru.
+
+    Bulanıklaştırma trimf/trapmf ile, kurallar AND=min / OR=max ile, birleştirme
+    max ile, durulaştırma ağırlık merkezi (centroid) ile yapılır. Tüm tablolar
+    kurulumda derlenmiş kural tabanından bir kez hazırlanır; nesne durum
+    tutmadığı için thread'ler arasında kilitsiz paylaşılabilir.
+
+    Çıktı evreni evren noktaları + kesim noktalarıyla örneklenir. Tekil
+    motorda yalnızca birden fazla terimin örtüştüğü bölgelerdeki evren
+    noktaları tutulur; diğer yerlerde eğri zaten doğrusal olduğundan sonuç
+    değişmez ama her çağrıda işlenen nokta sayısı azalır.
+    """
+
+    def __init__(self, kural_tabani=None):
+        self.kural_tabani = kural_tabani or KuralTabani.dosyadan()
+        kt = self.kural_tabani
+
+        # 1. Girdi üyelik fonksiyonları ve derlenmiş kurallar
+        self._girdiler = [
+            (degisken, kt.girdi_sinirlari[degisken],
+             [(terim, kt.terim_kn[d][0].tolist(), kt.terim_kn[d][1].tolist())
+              for terim, d in kt.girdi_terimleri[degisken]])
+            for degisken in kt.GIRDILER
+        ]
+        self._kurallar = [
+            (min if op == 've' else max, kosullar, sonuc)
+            for op, kosullar, sonuc in zip(kt.kural_operatorleri, kt.kural_kosullari,
+                                           kt.kural_sonuclari)
+        ]
+        self._agirliklar = None if kt.agirliklar is None else kt.kural_agirliklari
+
+        # 2. Çıktı terimleri ve eğimli doğru parçaları
+        self._cikti_kn = [(xp.tolist(), fp.tolist()) for xp, fp in kt.cikti_kn]
+        self._egimli_parcalar = [
+            [(xp[i], fp[i], xp[i + 1], fp[i + 1])
+             for i in range(len(xp) - 1) if fp[i] != fp[i + 1]]
+            for xp, fp in self._cikti_kn
+        ]
+
+        # 3. Sabit örnek noktaları ve her terimin bu noktalardaki üyelik değerleri
+        self._sabit_x = self._sabit_nokta_konumlari()
+        self._sabit_mf = [[_interp(x, xp, fp) for x in self._sabit_x] for xp, fp in self._cikti_kn]
+
+    def _sabit_nokta_konumlari(self):
+        """Kırılma noktaları, evren uçları ve örtüşme bölgelerindeki evren noktaları"""
+        evren = self.kural_tabani.cikti_evreni.tolist()
+        konumlar = {evren[0], evren[-1]}
+        destekler = []
+        for xp, fp in self._cikti_kn:
+            konumlar.update(x for x in xp if evren[0] <= x <= evren[-1])
+            # Üyeliğin sıfırdan büyük olduğu açık aralık (omuzlar sonsuza uzanır)
+            alt = float('-inf') if fp[0] > 0 else xp[0]
+            ust = float('inf') if fp[-1] > 0 else xp[-1]
+            destekler.append((alt, ust))
+
+        for k, x in enumerate(evren):
+            sol = evren[max(k - 1, 0)]
+            sag = evren[min(k + 1, len(evren) - 1)]
+            aktif = sum(1 for alt, ust in destekler if sol < ust and sag > alt)
+            if aktif >= 2:
+                konumlar.add(x)
+        return sorted(konumlar)
+
+    def _uyelik_listesi(self, islem_sayisi_val, hata_orani_val):
+        """Tüm girdi terimlerinin üyelik derecelerini düz liste olarak döndürür"""
+        uyelikler = []
+        for (_, (alt, ust), terimler), deger in zip(self._girdiler, (islem_sayisi_val, hata_orani_val)):
+            deger = min(max(deger, alt), ust)
+            uyelikler.extend(_interp(deger, xp, fp) for _, xp, fp in terimler)
+        return uyelikler
+
+    def _aktivasyonlar(self, uyelikler):
+        """Kural ateşleme dereceleri (AND=min, OR=max), kural ağırlığıyla çarpılmış"""
+        aktivasyonlar = [op(map(uyelikler.__getitem__, kosullar)) for op, kosullar, _ in self._kurallar]
+        if self._agirliklar is not None:
+            aktivasyonlar = [a * w for a, w in zip(aktivasyonlar, self._agirliklar)]
+        return aktivasyonlar
+
+    def uyelikler(self, islem_sayisi_val, hata_orani_val):
+        """Girdilerin terim üyelik derecelerini (0.0 - 1.0) değişken bazında döndürür"""
+        liste = iter(self._uyelik_listesi(islem_sayisi_val, hata_orani_val))
+        return {
+            degisken: {terim: next(liste) for terim, _, _ in terimler}
+            for degisken, _, terimler in self._girdiler
+        }
+
+    def _skor(self, aktivasyonlar):
+        """Kural aktivasyonlarından ağırlık merkezi skorunu hesaplar (alan 0 ise 0)"""
+        # Aynı sonuca giden kurallar max ile birleştirilir
+        kesimler = [0.0] * len(self._cikti_kn)
+        for (_, _, sonuc), aktivasyon in zip(self._kurallar, aktivasyonlar):
+            if aktivasyon > kesimler[sonuc]:
+                kesimler[sonuc] = aktivasyon
+        if max(kesimler) <= 0:
+            return 0
+
+        # Sabit noktalarda kesilmiş terimlerin max birleşimi (kesimi 0 olanlar atlanır)
+        kirpilmis = [
+            [m if m < kesim else kesim for m in mfs]
+            for kesim, mfs in zip(kesimler, self._sabit_mf) if kesim > 0
+        ]
+        birlesim = kirpilmis[0] if len(kirpilmis) == 1 else map(max, *kirpilmis)
+        noktalar = list(zip(self._sabit_x, birlesim))
+
+        # Kesim seviyelerinin eğimli parçaları kestiği noktalar
+        for kesim, parcalar in zip(kesimler, self._egimli_parcalar):
+            for x0, y0, x1, y1 in parcalar:
+                if min(y0, y1) < kesim < max(y0, y1):
+                    x = x0 + (kesim - y0) * (x1 - x0) / (y1 - y0)
+                    y = max(min(k, _interp(x, xp, fp))
+                            for k, (xp, fp) in zip(kesimler, self._cikti_kn))
+                    noktalar.append((x, y))
+        noktalar.sort()
+
+        # Parçalı doğrusal eğri altındaki alan ve moment (yamuk kuralı)
+        alan = moment = 0.0
+        x1, y1 = noktalar[0]
+        for x2, y2 in noktalar:
+            dx = x2 - x1
+            if dx:
+                alan += dx * (y1 + y2)
+                moment += dx * (x1 * (2 * y1 + y2) + x2 * (y1 + 2 * y2))
+            x1, y1 = x2, y2
+        if alan <= 0:
+            return 0
+        return (moment / 6) / (alan / 2)
+
+    def skor_hesapla(self, islem_sayisi_val, hata_orani_val):
+        """Durulaştırılmış performans skorunu döndürür (hesaplanamazsa 0)"""
+        uyelikler = self._uyelik_listesi(islem_sayisi_val, hata_orani_val)
+        return self._skor(self._aktivasyonlar(uyelikler))
+
+    def degerlendir(self, islem_sayisi_val, hata_orani_val, operator_id):
+        """
+        GUI için detaylı debug verisi üreten değerlendirme.
+        Debug aktivasyonları skorla aynı derlenmiş plandan gelir.
+        """
+        uyelikler = self._uyelik_listesi(islem_sayisi_val, hata_orani_val)
+        aktivasyonlar = self._aktivasyonlar(uyelikler)
+        score = self._skor(aktivasyonlar)
+        return self._sonuc_sozlugu(score, uyelikler, aktivasyonlar,
+                                   islem_sayisi_val, hata_orani_val, operator_id)
+
+    def _sonuc_sozlugu(self, score, uyelikler, aktivasyonlar,
+                       islem_sayisi_val, hata_orani_val, operator_id):
+        """Skor, üyelikler ve aktivasyonlardan GUI'nin beklediği sonuç sözlüğünü kurar"""
+        # Değişken bazında üyelik sözlükleri
+        liste = iter(uyelikler)
+        debug = {
+            _DEBUG_ANAHTARLARI[degisken]: {terim: next(liste) for terim, _, _ in terimler}
+            for degisken, _, terimler in self._girdiler
+        }
+        debug['kural_aktivasyonlari'] = {
+            f'kural{i}': aktivasyon for i, aktivasyon in enumerate(aktivasyonlar, 1)
+        }
+
+        # Sonuç Sözlüğü (GUI'nin beklediği format)
+        return {
+            'performans': score,
+            'operator': operator_id,
+            'islem_sayisi': islem_sayisi_val,
+            'hata_orani': hata_orani_val,
+            'kategori': _performans_kategorisi(score),
+            'debug': debug
+        }
+
+    # --- VEKTÖREL TOPLU DEĞERLENDİRME ---
+    # Bulanıklaştırma, min/max kural ateşleme, birleştirme ve ağırlık merkezi
+    # NumPy dizi işlemleriyle tek geçişte yapılır. Çıktı evreni tüm evren
+    # noktaları + kesim seviyelerinin kesişim noktalarıyla örneklenir,
+    # böylece skorlar tekil hesaplamayla aynı çıkar.
+
+    def _uyelik_matrisi(self, islem, hata):
+        """(terim sayısı + 2, n) üyelik matrisi; son iki satır sabit 1 ve 0"""
+        kt = self.kural_tabani
+        matris = np.empty((len(kt.terim_kn) + 2, len(islem)))
+        for degisken, deger in zip(kt.GIRDILER, (islem, hata)):
+            deger = np.clip(deger, *kt.girdi_sinirlari[degisken])
+            for _, dizin in kt.girdi_terimleri[degisken]:
+                matris[dizin] = np.interp(deger, *kt.terim_kn[dizin])
+        matris[kt.bir_satiri] = 1.0
+        matris[kt.sifir_satiri] = 0.0
+        return matris
+
+    def _agirlik_merkezi_toplu(self, kesimler):
+        """
+        Kesilmiş çıktı kümelerinin max birleşiminin ağırlık merkezini hesaplar.
+        Hiçbir kural ateşlenmezse (alan 0) skor 0 döner.
+        """
+        kt = self.kural_tabani
+        n = kesimler.shape[1]
+
+        # Kesim seviyesinin her eğimli doğru parçasını kestiği noktalar
+        ek_noktalar = []
+        for kesim, (xp, fp) in zip(kesimler, kt.cikti_kn):
+            for i in range(len(xp) - 1):
+                if fp[i] != fp[i + 1]:
+                    t = np.clip((kesim - fp[i]) / (fp[i + 1] - fp[i]), 0.0, 1.0)
+                    ek_noktalar.append(xp[i] + t * (xp[i + 1] - xp[i]))
+
+        evren = kt.cikti_evreni
+        x = np.concatenate(
+            [np.broadcast_to(evren, (n, len(evren))), np.column_stack(ek_noktalar)],
+            axis=1,
+        )
+        x.sort(axis=1)
+
+        y = np.zeros_like(x)
+        for kesim, (xp, fp) in zip(kesimler, kt.cikti_kn):
+            np.maximum(y, np.minimum(kesim[:, None], np.interp(x, xp, fp)), out=y)
+
+        # Parçalı doğrusal eğri altındaki alan ve moment (yamuk kuralı, kesin)
+        x1, x2 = x[:, :-1], x[:, 1:]
+        y1, y2 = y[:, :-1], y[:, 1:]
+        dx = x2 - x1
+        alan = (dx * (y1 + y2)).sum(axis=1) / 2
+        moment = (dx * (x1 * (2 * y1 + y2) + x2 * (y1 + 2 * y2))).sum(axis=1) / 6
+        return np.divide(moment, alan, out=np.zeros(n), where=alan > 0)
+
+    def _toplu_parca(self, islem, hata):
+        """Tek bir parça için aktivasyonları ve skorları hesaplar"""
+        kt = self.kural_tabani
+        matris = self._uyelik_matrisi(islem, hata)
+
+        # Kural ateşleme: koşul dizinleriyle satır seçip min (VE) / max (VEYA)
+        aktivasyonlar = np.empty((kt.kural_sayisi, len(islem)))
+        aktivasyonlar[kt.ve_kurallari] = matris[kt.kosul_matrisi[kt.ve_kurallari]].min(axis=1)
+        aktivasyonlar[kt.veya_kurallari] = matris[kt.kosul_matrisi[kt.veya_kurallari]].max(axis=1)
+        if kt.agirliklar is not None:
+            aktivasyonlar *= kt.agirliklar[:, None]
+
+        # Aynı sonuca giden kurallar max ile birleştirilir
+        kesimler = np.zeros((len(kt.cikti_kn), len(islem)))
+        for t, grup in enumerate(kt.sonuc_gruplari):
+            if len(grup):
+                kesimler[t] = aktivasyonlar[grup].max(axis=0)
+
+        return self._agirlik_merkezi_toplu(kesimler), aktivasyonlar
+
+    def toplu_skorlar(self, islem_sayilari, hata_oranlari, cikti=None):
+        """
+        Yalnızca performans skorlarını hesaplar (aktivasyonlar saklanmaz).
+        cikti verilirse skorlar bu diziye yazılır (ör. paylaşılan bellek).
+        """
+        islem_sayilari = np.asarray(islem_sayilari, dtype=float).ravel()
+        hata_oranlari = np.asarray(hata_oranlari, dtype=float).ravel()
+        if islem_sayilari.shape != hata_oranlari.shape:
+            raise ValueError("islem_sayilari ve hata_oranlari aynı uzunlukta olmalı")
+
+        if cikti is None:
+            cikti = np.empty(len(islem_sayilari))
+        for bas in range(0, len(islem_sayilari), TOPLU_PARCA_BOYUTU):
+            son = bas + TOPLU_PARCA_BOYUTU
+            cikti[bas:son] = self._toplu_parca(islem_sayilari[bas:son], hata_oranlari[bas:son])[0]
+        return cikti
+
+    def toplu_degerlendir(self, islem_sayilari, hata_oranlari):
+        """
+        Birden çok operatörü tek vektörel geçişte değerlendirir.
+
+        Dönen sözlükteki 'performans', 'kategori' ve her 'kuralN' aktivasyonu
+        girdilerle aynı uzunlukta NumPy dizileridir.
+        """
+        islem_sayilari = np.asarray(islem_sayilari, dtype=float).ravel()
+        hata_oranlari = np.asarray(hata_oranlari, dtype=float).ravel()
+        if islem_sayilari.shape != hata_oranlari.shape:
+            raise ValueError("islem_sayilari ve hata_oranlari aynı uzunlukta olmalı")
+
+        n = len(islem_sayilari)
+        skorlar = np.zeros(n)
+        aktivasyonlar = np.zeros((self.kural_tabani.kural_sayisi, n))
+        for bas in range(0, n, TOPLU_PARCA_BOYUTU):
+            son = bas + TOPLU_PARCA_BOYUTU
+            skorlar[bas:son], aktivasyonlar[:, bas:son] = self._toplu_parca(
+                islem_sayilari[bas:son], hata_oranlari[bas:son]
+            )
+
+        return {
+            'performans': skorlar,
+            'islem_sayisi': islem_sayilari,
+            'hata_orani': hata_oranlari,
+            'kategori': _toplu_kategoriler(skorlar),
+            'kural_aktivasyonlari': {
+                f'kural{i}': aktivasyon for i, aktivasyon in enumerate(aktivasyonlar, 1)
+            },
+        }
+
+
+_varsayilan_degerlendirici = None
+_kurulum_kilidi = threading.Lock()
+
+
+def varsayilan_degerlendirici():
+    """Modül genelinde paylaşılan değerlendiriciyi (ilk çağrıda kurarak) döndürür"""
+    global _varsayilan_degerlendirici
+    if _varsayilan_degerlendirici is None:
+        with _kurulum_kilidi:
+            if _varsayilan_degerlendirici is None:
+                with olcum.bolum('fuzzy_kurulum'):
+                    _varsayilan_degerlendirici = FuzzyDegerlendirici()
+    return _varsayilan_degerlendirici
+
+
+def kurallari_yukle(dosya_yolu=None):
+    """
+    Kural dosyasını yeniden okur, derler ve varsayılan değerlendiriciyi
+    değiştirir. Devam eden çağrılar eski planla tamamlanır; skor önbelleği
+    açıksa yeni kurallara bağlanarak boşaltılır.
+    """
+    global _varsayilan_degerlendirici
+    with olcum.bolum('fuzzy_kurulum'):
+        yeni = FuzzyDegerlendirici(KuralTabani.dosyadan(dosya_yolu))
+    with _kurulum_kilidi:
+        _varsayilan_degerlendirici = yeni
+        if _skor_onbellegi is not None:
+            _skor_onbellegi.gecersiz_kil(yeni)
+    return yeni
+
 
 def fuzzy_performans_degerlendirme(islem_sayisi_val, hata_orani_val, operator_id):
     """
     GUI için detaylı debug verisi üreten güncellenmiş fonksiyon.
+    Tablolar bir kez hazırlanır, her çağrıda yeniden kullanılır.
+    Skor önbelleği açıksa sonuç önbellekten gelir.
     """
-    
-    # 1. Değişkenleri Tanımla
-    ops = ctrl.Antecedent(np.arange(0, 51, 1), 'islem_sayisi')
-    error = ctrl.Antecedent(np.arange(0, 1.01, 0.01), 'hata_orani')
-    performance = ctrl.Consequent(np.arange(0, 101, 1), 'performans')
-
-    # 2. Üyelik Fonksiyonları (Membership Functions)
-    # İşlem Sayısı
-    ops['dusuk'] = fuzz.trimf(ops.universe, [0, 0, 20])
-    ops['orta'] = fuzz.trimf(ops.universe, [10, 25, 40])
-    ops['yuksek'] = fuzz.trimf(ops.universe, [30, 50, 50])
-
-    # Hata Oranı
-    error['dusuk'] = fuzz.trimf(error.universe, [0, 0, 0.2])
-    error['orta'] = fuzz.trimf(error.universe, [0.1, 0.3, 0.5])
-    error['yuksek'] = fuzz.trapmf(error.universe, [0.4, 0.6, 1.0, 1.0])
-
-    # Performans
-    performance['dusuk'] = fuzz.trimf(performance.universe, [0, 0, 40])
-    performance['orta'] = fuzz.trimf(performance.universe, [30, 50, 70])
-    performance['yuksek'] = fuzz.trimf(performance.universe, [60, 100, 100])
-
-    # 3. Kurallar
-    rule1 = ctrl.Rule(ops['dusuk'] | error['yuksek'], performance['dusuk'])
-    rule2 = ctrl.Rule(ops['orta'] & error['orta'], performance['orta'])
-    rule3 = ctrl.Rule(ops['yuksek'] & error['dusuk'], performance['yuksek'])
-    rule4 = ctrl.Rule(error['dusuk'], performance['yuksek']) # Ekstra teşvik
-
-    # 4. Simülasyon
-    perf_ctrl = ctrl.ControlSystem([rule1, rule2, rule3, rule4])
-    perf_sim = ctrl.ControlSystemSimulation(perf_ctrl)
-
-    perf_sim.input['islem_sayisi'] = islem_sayisi_val
-    perf_sim.input['hata_orani'] = hata_orani_val
+    degerlendirici = _skor_onbellegi
+    if degerlendirici is None:
+        degerlendirici = varsayilan_degerlendirici()
+    olcum.say('fuzzy_cagri')
+    with olcum.bolum('fuzzy_hesaplama'):
+        return degerlendirici.degerlendir(islem_sayisi_val, hata_orani_val, operator_id)
 
-    try:
-        perf_sim.compute()
-        score = perf_sim.output['performans']
-    except:
-        score = 0
-
-    # 5. Performans Kategorisi Belirleme
-    kategori = "BELİRSİZ"
-    if score >= 70: kategori = "YÜKSEK PERFORMANS 🚀"
-    elif score >= 40: kategori = "ORTA PERFORMANS ⚠️"
-    else: kategori = "DÜŞÜK PERFORMANS 🔻"
-
-    # --- KRİTİK KISIM: GUI İÇİN DEBUG VERİLERİNİ HESAPLAMA ---
-    # Scikit-fuzzy'nin arkaplanındaki matematiksel değerleri (üyelik derecelerini)
-    # manuel olarak çekiyoruz ki GUI hata vermesin.
-    
-    # İşlem Sayısı Üyelikleri (0.0 - 1.0 arası)
-    ops_memb = {
-        'dusuk': fuzz.interp_membership(ops.universe, ops['dusuk'].mf, islem_sayisi_val),
-        'orta': fuzz.interp_membership(ops.universe, ops['orta'].mf, islem_sayisi_val),
-        'yuksek': fuzz.interp_membership(ops.universe, ops['yuksek'].mf, islem_sayisi_val),
-    }
-
-    # Hata Oranı Üyelikleri
-    err_memb = {
-        'dusuk': fuzz.interp_membership(error.universe, error['dusuk'].mf, hata_orani_val),
-        'orta': fuzz.interp_membership(error.universe, error['orta'].mf, hata_orani_val),
-        'yuksek': fuzz.interp_membership(error.universe, error['yuksek'].mf, hata_orani_val),
-    }
-
-    # Kural Aktivasyonları (Basit Mantık: AND=min, OR=max)
-    # Kural 1: (Ops Düşük OR Hata Yüksek)
-    r1_act = max(ops_memb['dusuk'], err_memb['yuksek'])
-    # Kural 2: (Ops Orta AND Hata Orta)
-    r2_act = min(ops_memb['orta'], err_memb['orta'])
-    # Kural 3: (Ops Yüksek AND Hata Düşük)
-    r3_act = min(ops_memb['yuksek'], err_memb['dusuk'])
-    # Kural 4: (Hata Düşük)
-    r4_act = err_memb['dusuk']
-
-    # 6. Sonuç Sözlüğü (GUI'nin beklediği format)
-    return {
-        'performans': score,
-        'operator': operator_id,
-        'islem_sayisi': islem_sayisi_val,
-        'hata_orani': hata_orani_val,
-        'kategori': kategori,
-        'debug': {
-            'islem_uyelikleri': ops_memb,
-            'hata_uyelikleri': err_memb,
+
+def toplu_performans_degerlendirme(islem_sayilari, hata_oranlari):
+    """Birden çok operatörü varsayılan değerlendiriciyle tek geçişte değerlendirir"""
+    degerlendirici = _skor_onbellegi
+    if degerlendirici is None:
+        degerlendirici = varsayilan_degerlendirici()
+    olcum.say('fuzzy_toplu_cagri')
+    with olcum.bolum('fuzzy_hesaplama'):
+        return degerlendirici.toplu_degerlendir(islem_sayilari, hata_oranlari)
+
+
+# --- SKOR ÖNBELLEĞİ ---
+
+class SkorOnbellegi:
+    """
+    (islem_sayisi, hata_orani) sonuçlarını saklayan LRU önbellek.
+
+    Varsayılan olarak anahtar girdilerin kendisidir (tam float değerler);
+    sonuçlar önbelleksiz motorla aynıdır. Tekil ve toplu çağrılar aynı kaydı
+    paylaştığından tek fark bu iki motor arasındaki kayan nokta yuvarlamasıdır
+    (1e-12'nin altında). islem_basamak veya
+    hata_basamak verilirse o girdi bu kadar ondalık basamağa yuvarlanır ve
+    skor yuvarlanmış girdiyle hesaplanır; aynı anahtara düşen tüm çağrılar
+    aynı sonucu alır. Bu bir yaklaşıklıktır: skor yüzeyi kural kenarlarında
+    süreksizdir, yuvarlanan girdi başka bir kural bölgesine düşebilir. Örneğin
+    hata_basamak=3 ile (40, 0.1999) önbelleksiz 80.005, önbellekle (40, 0.2)
+    olarak 0 puan alır; kenarlardan uzakta fark, girdinin en fazla yarım
+    basamaklık kaymasının skorda yarattığı farktır ((12, 0.1234567):
+    49.433 yerine 49.509). Kapasite aşılınca en uzun süredir kullanılmayan
+    kayıt atılır. Önbellek bir değerlendiriciye bağlıdır; kurallar değişince
+    gecersiz_kil() ile boşaltılır.
+    """
+
+    def __init__(self, kapasite=65536, islem_basamak=None, hata_basamak=None, degerlendirici=None):
+        if kapasite < 1:
+            raise ValueError("Önbellek kapasitesi en az 1 olmalı")
+        self.kapasite = kapasite
+        self.islem_basamak = islem_basamak
+        self.hata_basamak = hata_basamak
+        # None: nicemleme yok, anahtar girdinin kendisi
+        self._islem_olcek = None if islem_basamak is None else 10.0 ** islem_basamak
+        self._hata_olcek = None if hata_basamak is None else 10.0 ** hata_basamak
+        self.degerlendirici = degerlendirici or varsayilan_degerlendirici()
+        self._kayitlar = OrderedDict()
+        self._kilit = threading.Lock()
+        self.isabet = self.iskalama = self.tahliye = self.gecersiz_kilma = 0
+
+    def anahtar(self, islem_sayisi_val, hata_orani_val):
+        """Girdilerin önbellek anahtarı (nicemleme açıksa tam sayı, değilse girdinin kendisi)"""
+        return (_nicemle(islem_sayisi_val, self._islem_olcek),
+                _nicemle(hata_orani_val, self._hata_olcek))
+
+    def _anahtar_girdileri(self, islem_anahtari, hata_anahtari):
+        """Anahtardan skorun hesaplandığı (gerekirse yuvarlanmış) girdileri döndürür"""
+        return (islem_anahtari if self._islem_olcek is None else islem_anahtari / self._islem_olcek,
+                hata_anahtari if self._hata_olcek is None else hata_anahtari / self._hata_olcek)
+
+    def _getir(self, anahtar):
+        """Kaydı döndürüp en yeni konuma taşır (yoksa None); kilit altında çağrılır"""
+        kayit = self._kayitlar.get(anahtar)
+        if kayit is None:
+            self.iskalama += 1
+        else:
+            self.isabet += 1
+            self._kayitlar.move_to_end(anahtar)
+        return kayit
+
+    def _ekle(self, degerlendirici, anahtar, kayit):
+        """Kaydı ekler, kapasite aşılırsa en eskisini atar; kilit altında çağrılır"""
+        # Hesaplama sırasında kurallar değiştiyse eski sonuç saklanmaz
+        if degerlendirici is not self.degerlendirici:
+            return
+        self._kayitlar[anahtar] = kayit
+        self._kayitlar.move_to_end(anahtar)
+        if len(self._kayitlar) > self.kapasite:
+            self._kayitlar.popitem(last=False)
+            self.tahliye += 1
+
+    def degerlendir(self, islem_sayisi_val, hata_orani_val, operator_id):
+        """
+        FuzzyDegerlendirici.degerlendir ile aynı sözlüğü döndürür; 'islem_sayisi'
+        ve 'hata_orani' verilen (nicemlenmemiş) değerlerdir.
+        """
+        anahtar = self.anahtar(islem_sayisi_val, hata_orani_val)
+        with self._kilit:
+            degerlendirici = self.degerlendirici
+            kayit = self._getir(anahtar)
+
+        # Toplu yoldan gelen kayıtlarda üyelikler yoktur; debug verisi tekil
+        # motorla birebir aynı olsun diye kayıt tekil motorla yeniden hesaplanır
+        if kayit is None or kayit[1] is None:
+            uyelikler = degerlendirici._uyelik_listesi(*self._anahtar_girdileri(*anahtar))
+            aktivasyonlar = degerlendirici._aktivasyonlar(uyelikler)
+            kayit = (degerlendirici._skor(aktivasyonlar), uyelikler, aktivasyonlar)
+            with self._kilit:
+                self._ekle(degerlendirici, anahtar, kayit)
+
+        score, uyelikler, aktivasyonlar = kayit
+        return degerlendirici._sonuc_sozlugu(score, uyelikler, aktivasyonlar,
+                                             islem_sayisi_val, hata_orani_val, operator_id)
+
+    def toplu_degerlendir(self, islem_sayilari, hata_oranlari):
+        """
+        FuzzyDegerlendirici.toplu_degerlendir ile aynı sözlüğü döndürür.
+        Tekrarlanan anahtarlar bir kez aranır, eksikler tek vektörel geçişte
+        hesaplanıp önbelleğe eklenir.
+        """
+        islem_sayilari = np.asarray(islem_sayilari, dtype=float).ravel()
+        hata_oranlari = np.asarray(hata_oranlari, dtype=float).ravel()
+        if islem_sayilari.shape != hata_oranlari.shape:
+            raise ValueError("islem_sayilari ve hata_oranlari aynı uzunlukta olmalı")
+
+        islem_anahtari = _nicemle_dizi(islem_sayilari, self._islem_olcek)
+        hata_anahtari = _nicemle_dizi(hata_oranlari, self._hata_olcek)
+        tekil = np.empty((0, 2), dtype=np.result_type(islem_anahtari, hata_anahtari))
+        ters = np.empty(0, dtype=np.intp)
+        if len(islem_anahtari) and tekil.dtype == np.int64:
+            # İki anahtar tek tam sayıda birleştirilip tekilleştirilir (satır bazlı unique'ten hızlı)
+            hata_alt = hata_anahtari.min()
+            birlesik = ((islem_anahtari - islem_anahtari.min()) * (hata_anahtari.max() - hata_alt + 1)
+                        + (hata_anahtari - hata_alt))
+            _, ilk, ters = np.unique(birlesik, return_index=True, return_inverse=True)
+            tekil = np.column_stack([islem_anahtari[ilk], hata_anahtari[ilk]])
+        elif len(islem_anahtari):
+            tekil, ters = np.unique(np.column_stack([islem_anahtari, hata_anahtari]), axis=0,
+                                    return_inverse=True)
+            ters = ters.ravel()
+        tekil_anahtarlar = list(zip(tekil[:, 0].tolist(), tekil[:, 1].tolist()))
+
+        with self._kilit:
+            degerlendirici = self.degerlendirici
+            kayitlar = [self._getir(a) for a in tekil_anahtarlar]
+        kural_sayisi = degerlendirici.kural_tabani.kural_sayisi
+        skorlar = np.empty(len(tekil))
+        aktivasyonlar = np.empty((kural_sayisi, len(tekil)))
+        eksikler = []
+        for i, kayit in enumerate(kayitlar):
+            if kayit is None:
+                eksikler.append(i)
+            else:
+                skorlar[i] = kayit[0]
+                aktivasyonlar[:, i] = kayit[2]
+
+        if eksikler:
+            eksik = np.array(eksikler)
+            girdiler = self._anahtar_girdileri(tekil[eksik, 0], tekil[eksik, 1])
+            sonuc = degerlendirici.toplu_degerlendir(*girdiler)
+            skorlar[eksik] = sonuc['performans']
+            aktivasyonlar[:, eksik] = np.array(list(sonuc['kural_aktivasyonlari'].values()))
+            with self._kilit:
+                for i in eksikler:
+                    self._ekle(degerlendirici, tekil_anahtarlar[i],
+                               (float(skorlar[i]), None, aktivasyonlar[:, i].tolist()))
+
+        skorlar = skorlar[ters]
+        return {
+            'performans': skorlar,
+            'islem_sayisi': islem_sayilari,
+            'hata_orani': hata_oranlari,
+            'kategori': _toplu_kategoriler(skorlar),
             'kural_aktivasyonlari': {
-                'kural1': r1_act,
-                'kural2': r2_act,
-                'kural3': r3_act,
-                'kural4': r4_act,
-                'kural5': 0.0 # GUI 5 kural bekliyor olabilir, boş gönderelim
+                f'kural{i}': aktivasyon
+                for i, aktivasyon in enumerate(aktivasyonlar[:, ters], 1)
+            },
+        }
+
+    def gecersiz_kil(self, degerlendirici=None):
+        """Tüm kayıtları siler; verilirse önbelleği yeni değerlendiriciye bağlar"""
+        with self._kilit:
+            self._kayitlar.clear()
+            if degerlendirici is not None:
+                self.degerlendirici = degerlendirici
+            self.gecersiz_kilma += 1
+
+    def istatistikler(self):
+        """İsabet/ıskalama/tahliye sayılarını ve doluluk bilgisini döndürür"""
+        with self._kilit:
+            toplam = self.isabet + self.iskalama
+            return {
+                'isabet': self.isabet,
+                'iskalama': self.iskalama,
+                'tahliye': self.tahliye,
+                'gecersiz_kilma': self.gecersiz_kilma,
+                'isabet_orani': self.isabet / toplam if toplam else 0.0,
+                'boyut': len(self._kayitlar),
+                'kapasite': self.kapasite,
             }
+
+    def __len__(self):
+        return len(self._kayitlar)
+
+
+def _nicemle(deger, olcek):
+    # round() yarımları çifte yuvarlar; np.rint de aynı kuralı izler
+    return float(deger) if olcek is None else round(deger * olcek)
+
+
+def _nicemle_dizi(dizi, olcek):
+    return dizi if olcek is None else np.rint(dizi * olcek).astype(np.int64)
+
+
+_skor_onbellegi = None
+
+
+def skor_onbellegini_ac(kapasite=65536, islem_basamak=None, hata_basamak=None):
+    """
+    Modül fonksiyonları (fuzzy_performans_degerlendirme, toplu_performans_
+    degerlendirme) için skor önbelleğini açar ve döndürür. Basamaklar
+    verilmezse sonuçlar önbelleksiz hesapla aynıdır (bkz. SkorOnbellegi).
+    """
+    global _skor_onbellegi
+    varsayilan_degerlendirici()
+    with _kurulum_kilidi:
+        _skor_onbellegi = SkorOnbellegi(kapasite, islem_basamak, hata_basamak,
+                                        _varsayilan_degerlendirici)
+    return _skor_onbellegi
+
+
+def skor_onbellegini_kapat():
+    """Skor önbelleğini kapatır; çağrılar yeniden doğrudan hesaplanır"""
+    global _skor_onbellegi
+    with _kurulum_kilidi:
+        _skor_onbellegi = None
+
+
+def skor_onbellegi():
+    """Açık skor önbelleğini (kapalıysa None) döndürür"""
+    return _skor_onbellegi
+
+
+# --- ÖNCEDEN HESAPLANMIŞ PERFORMANS YÜZEYİ ---
+
+class PerformansYuzeyi:
+    """
+    Performans skorunu (islem_sayisi, hata_orani) ızgarasında bir kez tablolar
+    ve sorguları çift doğrusal (bilinear) enterpolasyonla yanıtlar.
+
+    Varsayılan çözünürlükte işlem sayısı ekseni 1'er adımlıdır; tam sayı
+    işlem sayıları için bu eksende enterpolasyon hatası oluşmaz. Kurallar
+    hiç ateşlenmediğinde skor 0'a düştüğü için yüzeyde süreksizlikler
+    vardır; bu hücrelerde hata büyük olabilir. 'maks_hata' bunu, 'p99_hata'
+    ise noktaların %99'u için geçerli hata sınırını raporlar.
+    """
+
+    def __init__(self, tablo, degerlendirici=None):
+        self.tablo = np.asarray(tablo, dtype=float)
+        if self.tablo.ndim != 2 or min(self.tablo.shape) < 2:
+            raise ValueError("Yüzey tablosu en az 2x2 boyutlu olmalı")
+        self.degerlendirici = degerlendirici or varsayilan_degerlendirici()
+        sinirlar = self.degerlendirici.kural_tabani.girdi_sinirlari
+        self.islem_ekseni = np.linspace(*sinirlar['islem_sayisi'], self.tablo.shape[0])
+        self.hata_ekseni = np.linspace(*sinirlar['hata_orani'], self.tablo.shape[1])
+        self.maks_hata = None
+        self.p99_hata = None
+
+    @classmethod
+    def olustur(cls, islem_cozunurluk=51, hata_cozunurluk=1001, degerlendirici=None):
+        """Yüzeyi toplu motorla tablolar ve tam motora göre maks. hatayı ölçer"""
+        degerlendirici = degerlendirici or varsayilan_degerlendirici()
+        sinirlar = degerlendirici.kural_tabani.girdi_sinirlari
+        islem_ekseni = np.linspace(*sinirlar['islem_sayisi'], islem_cozunurluk)
+        hata_ekseni = np.linspace(*sinirlar['hata_orani'], hata_cozunurluk)
+        islem, hata = np.meshgrid(islem_ekseni, hata_ekseni, indexing='ij')
+        skorlar = degerlendirici.toplu_degerlendir(islem, hata)['performans']
+
+        yuzey = cls(skorlar.reshape(islem.shape), degerlendirici)
+        yuzey.hata_olc()
+        return yuzey
+
+    @classmethod
+    def yukle(cls, dosya_yolu, mmap=False, degerlendirici=None):
+        """
+        kaydet ile yazılmış yüzeyi yükler. Tablo değerlendiricinin
+        kurallarından farklı bir tanımla üretilmişse (kurallar sonradan
+        değişmişse), meta dosyası yoksa ya da tablo boyutu meta veriyle
+        uyuşmuyorsa ValueError verir; yüzey yeniden oluşturulmalıdır.
+        """
+        tablo_yolu, meta_yolu = _yuzey_yollari(dosya_yolu)
+        try:
+            with open(meta_yolu, encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"{tablo_yolu}: yüzey meta dosyası ({meta_yolu}) yok") from None
+        tablo = np.load(tablo_yolu, mmap_mode='r' if mmap else None)
+        yuzey = cls(tablo, degerlendirici)
+
+        if meta.get('kural_imzasi') != yuzey.degerlendirici.kural_tabani.imza:
+            raise ValueError(f"{tablo_yolu}: yüzey başka bir kural tanımıyla üretilmiş; yeniden oluşturun")
+        if meta.get('boyut') != list(tablo.shape):
+            raise ValueError(f"{tablo_yolu}: tablo boyutu {tablo.shape} meta veriyle uyuşmuyor")
+        yuzey.maks_hata = meta.get('maks_hata')
+        yuzey.p99_hata = meta.get('p99_hata')
+        return yuzey
+
+    def kaydet(self, dosya_yolu):
+        """Tabloyu .npy, üretildiği kuralların imzasını yanındaki .json dosyasına yazar"""
+        tablo_yolu, meta_yolu = _yuzey_yollari(dosya_yolu)
+        np.save(tablo_yolu, self.tablo)
+        meta = {
+            'kural_imzasi': self.degerlendirici.kural_tabani.imza,
+            'boyut': list(self.tablo.shape),
+            'maks_hata': self.maks_hata,
+            'p99_hata': self.p99_hata,
         }
-    }
\ No newline at end of file
+        with open(meta_yolu, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def skor(self, islem_sayisi, hata_orani):
+        """Skoru çift doğrusal enterpolasyonla döndürür (skaler veya dizi)"""
+        islem = np.asarray(islem_sayisi, dtype=float)
+        hata = np.asarray(hata_orani, dtype=float)
+        i0, ti = self._hucre(islem, self.islem_ekseni)
+        j0, tj = self._hucre(hata, self.hata_ekseni)
+
+        t = self.tablo
+        sonuc = ((t[i0, j0] * (1 - tj) + t[i0, j0 + 1] * tj) * (1 - ti)
+                 + (t[i0 + 1, j0] * (1 - tj) + t[i0 + 1, j0 + 1] * tj) * ti)
+        return float(sonuc) if sonuc.ndim == 0 else sonuc
+
+    @staticmethod
+    def _hucre(deger, eksen):
+        """Değerin düştüğü hücre indisini ve hücre içi konumunu (0-1) bulur"""
+        konum = (np.clip(deger, eksen[0], eksen[-1]) - eksen[0]) / (eksen[1] - eksen[0])
+        indis = np.minimum(konum.astype(np.intp), len(eksen) - 2)
+        return indis, konum - indis
+
+    def hata_olc(self, ornek_sayisi=20000, tohum=0):
+        """Rastgele noktalarda tam motora göre maksimum mutlak hatayı ölçer"""
+        rng = np.random.default_rng(tohum)
+        islem = rng.uniform(self.islem_ekseni[0], self.islem_ekseni[-1], ornek_sayisi)
+        hata = rng.uniform(self.hata_ekseni[0], self.hata_ekseni[-1], ornek_sayisi)
+        tam = self.degerlendirici.toplu_degerlendir(islem, hata)['performans']
+        fark = np.abs(self.skor(islem, hata) - tam)
+        self.maks_hata = float(fark.max())
+        self.p99_hata = float(np.percentile(fark, 99))
+        return self.maks_hata
+
+
+def _yuzey_yollari(dosya_yolu):
+    """Yüzey tablosunun (.npy) ve meta dosyasının (.json) yollarını döndürür"""
+    dosya_yolu = os.fspath(dosya_yolu)
+    kok = dosya_yolu[:-4] if dosya_yolu.endswith('.npy') else dosya_yolu
+    return kok + '.npy', kok + '.json'
+
+
+# --- ÇOK ÇEKİRDEKLİ SKORLAMA ---
+# Girdiler ve skorlar tek bir multiprocessing.shared_memory bloğunda
+# tutulur: [işlem sayıları | hata oranları | skorlar]. İşçilere yalnızca
+# blok adı ve dilim sınırları gönderilir; diziler pickle ile kopyalanmaz.
+# Her işçi değerlendiriciyi süreç başında bir kez kurar, kendi dilimini
+# skorlayıp sonuçları doğrudan paylaşılan skor dizisine yazar.
+
+# İş dengesi için çekirdek başına düşen dilim sayısı
+PARALEL_DILIM_CARPANI = 4
+
+_isci_degerlendirici = None
+
+
+def _paylasilan_diziler(blok, kapasite):
+    """Bloğu (işlem sayıları, hata oranları, skorlar) float64 dizileri olarak gösterir"""
+    return tuple(np.ndarray(kapasite, dtype=np.float64, buffer=blok.buf, offset=i * kapasite * 8)
+                 for i in range(3))
+
+
+def _isci_baslat(kural_tabani):
+    """İşçi süreçte değerlendiriciyi bir kez kurar"""
+    global _isci_degerlendirici
+    _isci_degerlendirici = FuzzyDegerlendirici(kural_tabani)
+
+
+def _isci_dilimi(blok_adi, kapasite, bas, son):
+    """İşçi süreçte çalışır: [bas, son) dilimini skorlar ve paylaşılan skor dizisine yazar"""
+    from multiprocessing import shared_memory
+    blok = shared_memory.SharedMemory(name=blok_adi)
+    try:
+        islem, hata, skor = _paylasilan_diziler(blok, kapasite)
+        _isci_degerlendirici.toplu_skorlar(islem[bas:son], hata[bas:son], skor[bas:son])
+        # Blok kapatılmadan önce ona bakan diziler bırakılmalı
+        del islem, hata, skor
+    finally:
+        blok.close()
+    return son - bas
+
+
+class ParalelSkorlayici:
+    """
+    Skorları bir süreç havuzunda, paylaşılan bellek üzerinden hesaplar.
+
+    Girdiler dilimlere bölünür; dilim sınırları TOPLU_PARCA_BOYUTU'nun
+    katları olduğundan sonuçlar tek süreçli toplu_skorlar ile bit düzeyinde
+    aynıdır. Havuz ve paylaşılan blok çağrılar arasında yeniden kullanılır
+    (blok yalnızca daha büyük bir girdi geldiğinde büyütülür); iş bitince
+    kapat() çağrılmalı ya da nesne 'with' ile kullanılmalıdır. Skor
+    önbelleği kullanılmaz.
+    """
+
+    def __init__(self, isci_sayisi=None, degerlendirici=None):
+        # Süreç havuzu ve paylaşılan bellek yalnızca paralel modda içe aktarılır
+        from concurrent.futures import ProcessPoolExecutor
+        self.degerlendirici = degerlendirici or varsayilan_degerlendirici()
+        self.isci_sayisi = max(int(isci_sayisi or os.cpu_count() or 1), 1)
+        self._havuz = ProcessPoolExecutor(self.isci_sayisi, initializer=_isci_baslat,
+                                          initargs=(self.degerlendirici.kural_tabani,))
+        self._blok = None
+        self._kapasite = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.kapat()
+
+    def _blok_hazirla(self, n):
+        """Paylaşılan bloğu en az n satırlık olacak şekilde (gerekirse yeniden) ayırır"""
+        from multiprocessing import shared_memory
+        if n <= self._kapasite:
+            return
+        self._blogu_birak()
+        self._blok = shared_memory.SharedMemory(create=True, size=3 * n * 8)
+        self._kapasite = n
+
+    def _blogu_birak(self):
+        if self._blok is not None:
+            self._blok.close()
+            self._blok.unlink()
+            self._blok, self._kapasite = None, 0
+
+    def _dilimler(self, n):
+        """[0, n) aralığını parça boyutunun katı uzunlukta dilimlere böler"""
+        hedef = -(-n // (self.isci_sayisi * PARALEL_DILIM_CARPANI))
+        boyut = max(-(-hedef // TOPLU_PARCA_BOYUTU), 1) * TOPLU_PARCA_BOYUTU
+        return [(bas, min(bas + boyut, n)) for bas in range(0, n, boyut)]
+
+    def skorla(self, islem_sayilari, hata_oranlari):
+        """Girdilerin performans skorlarını (float64 dizi) döndürür"""
+        islem_sayilari = np.asarray(islem_sayilari, dtype=float).ravel()
+        hata_oranlari = np.asarray(hata_oranlari, dtype=float).ravel()
+        if islem_sayilari.shape != hata_oranlari.shape:
+            raise ValueError("islem_sayilari ve hata_oranlari aynı uzunlukta olmalı")
+        n = len(islem_sayilari)
+        if n == 0:
+            return np.zeros(0)
+
+        olcum.say('fuzzy_paralel_cagri')
+        with olcum.bolum('fuzzy_paralel'):
+            self._blok_hazirla(n)
+            islem, hata, skor = _paylasilan_diziler(self._blok, self._kapasite)
+            islem[:n] = islem_sayilari
+            hata[:n] = hata_oranlari
+            isler = [self._havuz.submit(_isci_dilimi, self._blok.name, self._kapasite, bas, son)
+                     for bas, son in self._dilimler(n)]
+            for is_ in isler:
+                is_.result()
+            sonuc = skor[:n].copy()
+            del islem, hata, skor
+        return sonuc
+
+    def kapat(self):
+        """Süreç havuzunu kapatır ve paylaşılan bloğu siler"""
+        self._havuz.shutdown()
+        self._blogu_birak()
+
+
+def paralel_skorla(islem_sayilari, hata_oranlari, isci_sayisi=None):
+    """
+    Skorları geçici bir süreç havuzunda hesaplar. Tekrarlanan çağrılarda
+    havuz kurulumu yinelenmesin diye ParalelSkorlayici kullanılmalıdır.
+    """
+    with ParalelSkorlayici(isci_sayisi) as skorlayici:
+        return skorlayici.skorla(islem_sayilari, hata_oranlari)
@@ -1,9 +1,232 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pandas as pd
 from datetime import datetime
-import random
-from fuzzy_system import fuzzy_performans_degerlendirme
+import queue
+import threading
+
+# pandas, analiz ve fuzzy modülleri burada değil ilk kullanımda içe aktarılır;
+# pencere bunları beklemeden açılır, warm_up_modules arka planda önceden yükler.
+
+
+def warm_up_modules():
+    """Analiz (pandas dahil) ve fuzzy değerlendiricisini arka planda hazırlar"""
+    try:
+        import analiz  # noqa: F401  (depo_veri ve pandas'ı da yükler)
+        from fuzzy_system import varsayilan_degerlendirici
+        varsayilan_degerlendirici()
+    except Exception:
+        # Hata, modülü kullanan ilk işte kullanıcıya gösterilir
+        pass
+
+def format_date(value):
+    """Tarihi YYYY-AA-GG olarak yazar; boş tarih (None/NaT) "-" olur"""
+    # NaT kendisine eşit değildir; pandas'ı içe aktarmadan ayırt edilir
+    if value is None or value != value:
+        return "-"
+    return f"{value:%Y-%m-%d}"
+
+class JobCancelled(Exception):
+    """Arka plan işi kullanıcı tarafından iptal edildiğinde fırlatılır"""
+
+
+class BackgroundJob:
+    """
+    Uzun süren bir işi Tk ana döngüsünü bloklamadan ayrı bir iş parçacığında çalıştırır.
+
+    İş fonksiyonu tek argüman olarak progress(oran, mesaj) geri çağrısını alır;
+    iptal istenmişse bu çağrı JobCancelled fırlatır. İlerleme, sonuç ve hatalar
+    bir kuyruğa yazılır ve root.after ile ana döngüde işlenir; Tk nesnelerine
+    yalnızca ana iş parçacığı dokunur.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, root, work, on_done, on_error, on_progress=None, on_cancel=None):
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self._events = queue.Queue()
+        self._cancel_requested = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self):
+        """İptal ister; iş bir sonraki ilerleme bildiriminde durur"""
+        self._cancel_requested.set()
+
+    def _progress(self, ratio, message=""):
+        """İş parçacığı tarafı: ilerlemeyi bildirir, iptal istenmişse durdurur"""
+        if self._cancel_requested.is_set():
+            raise JobCancelled()
+        self._events.put(('progress', (ratio, message)))
+
+    def _run(self):
+        try:
+            self._events.put(('done', self.work(self._progress)))
+        except JobCancelled:
+            self._events.put(('cancelled', None))
+        except Exception as e:
+            self._events.put(('error', e))
+
+    def _poll(self):
+        """Ana döngü tarafı: kuyruktaki olayları geri çağrılara iletir"""
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                if self.on_progress:
+                    self.on_progress(*payload)
+                continue
+            if kind == 'done':
+                self.on_done(payload)
+            elif kind == 'cancelled':
+                if self.on_cancel:
+                    self.on_cancel()
+            else:
+                self.on_error(payload)
+            return
+        self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+
+class PagedTable:
+    """
+    Bir DataFrame'i ttk.Treeview üzerinde sayfa sayfa gösterir.
+
+    Treeview'a yalnızca görünen sayfanın satırları eklenir; sıralama
+    (sütun başlığına tıklayınca) ve filtre DataFrame üzerinde yapılır.
+    Çizim ve yerleşim maliyeti satır sayısından değil sayfa boyutundan
+    gelir, bu yüzden binlerce ürün/operatörde de sabit kalır.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, parent, page_size=None, bg=None):
+        self.page_size = page_size or self.PAGE_SIZE
+        self.data = None          # Tüm tablo
+        self.view = None          # Filtrelenmiş ve sıralanmış tablo
+        self.columns = {}
+        self.formatters = {}
+        self.filter_column = None
+        self.title = ""
+        self.page = 0
+        self.sort_state = {'column': None, 'ascending': True}
+        self._search_values = None
+        
+        self.frame = tk.Frame(parent, bg=bg)
+        
+        # Filtre satırı
+        toolbar = tk.Frame(self.frame, bg=bg)
+        toolbar.pack(fill=tk.X, pady=(0, 5))
+        self.filter_label = tk.Label(toolbar, text="Filtre:", bg=bg)
+        self.filter_label.pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(toolbar, textvariable=self.filter_var)
+        filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        filter_entry.bind('<Return>', lambda event: self.apply())
+        ttk.Button(toolbar, text="Uygula", command=self.apply).pack(side=tk.LEFT)
+        
+        # Tablo
+        tree_frame = tk.Frame(self.frame, bg=bg)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(tree_frame, show='headings')
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Sayfa gezinme
+        nav = tk.Frame(self.frame, bg=bg)
+        nav.pack(fill=tk.X, pady=(5, 0))
+        self.prev_btn = ttk.Button(nav, text="◀ Önceki", command=lambda: self.show_page(self.page - 1))
+        self.prev_btn.pack(side=tk.LEFT)
+        self.next_btn = ttk.Button(nav, text="Sonraki ▶", command=lambda: self.show_page(self.page + 1))
+        self.next_btn.pack(side=tk.RIGHT)
+        self.page_label = tk.Label(nav, text="", bg=bg)
+        self.page_label.pack(side=tk.LEFT, expand=True)
+    
+    def set_data(self, data, columns, formatters=None, filter_column=None, title=""):
+        """
+        Gösterilecek tabloyu değiştirir. columns {sütun: başlık}, formatters
+        {sütun: değer -> metin}; filtre filter_column (varsayılan ilk sütun)
+        içinde büyük/küçük harf duyarsız arar.
+        """
+        self.data = data
+        self.columns = columns
+        self.formatters = formatters or {}
+        self.filter_column = filter_column or next(iter(columns))
+        self.title = title
+        self.sort_state = {'column': None, 'ascending': True}
+        self._search_values = None
+        self.filter_var.set("")
+        self.filter_label.config(text=f"Filtre ({columns[self.filter_column]}):")
+        
+        self.tree.configure(columns=list(columns))
+        for column, heading in columns.items():
+            self.tree.heading(column, text=heading, command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=90 if column != 'Kategori' else 200, anchor=tk.CENTER)
+        self.apply()
+    
+    def apply(self):
+        """Filtre ve sıralamayı DataFrame üzerinde uygular, ilk sayfayı gösterir"""
+        if self.data is None:
+            return
+        view = self.data
+        text = self.filter_var.get().strip().lower()
+        if text:
+            # Aranacak metinler ilk filtrede bir kez hazırlanır
+            if self._search_values is None:
+                self._search_values = self.data[self.filter_column].astype(str).str.lower()
+            view = view[self._search_values.str.contains(text, regex=False).to_numpy()]
+        column = self.sort_state['column']
+        if column is not None:
+            view = view.sort_values(column, ascending=self.sort_state['ascending'], kind='stable')
+        self.view = view
+        self.show_page(0)
+    
+    def sort_by(self, column):
+        """Aynı başlığa tekrar tıklamak sıralama yönünü değiştirir"""
+        ascending = not self.sort_state['ascending'] if self.sort_state['column'] == column else True
+        self.sort_state = {'column': column, 'ascending': ascending}
+        self.apply()
+    
+    def page_count(self):
+        return max(1, -(-len(self.view) // self.page_size)) if self.view is not None else 1
+    
+    def show_page(self, page):
+        """Yalnızca istenen sayfanın satırlarını Treeview'a ekler"""
+        if self.view is None:
+            return
+        self.page = min(max(page, 0), self.page_count() - 1)
+        start = self.page * self.page_size
+        rows = self.view.iloc[start:start + self.page_size]
+        
+        self.tree.delete(*self.tree.get_children())
+        columns = list(self.columns)
+        formatters = [self.formatters.get(column, str) for column in columns]
+        for row in rows[columns].itertuples(index=False):
+            self.tree.insert('', tk.END, values=[fmt(value) for fmt, value in zip(formatters, row)])
+        
+        self.page_label.config(
+            text=f"Sayfa {self.page + 1}/{self.page_count()} · {len(self.view):,} satır"
+        )
+        self.prev_btn.state(['!disabled' if self.page > 0 else 'disabled'])
+        self.next_btn.state(['!disabled' if self.page < self.page_count() - 1 else 'disabled'])
+    
+    def to_text(self):
+        """Filtrelenmiş/sıralanmış tablonun tamamını düz metin olarak döndürür (kaydetmek için)"""
+        if self.view is None:
+            return ""
+        table = self.view[list(self.columns)].rename(columns=self.columns)
+        return f"{self.title}\n{table.to_string(index=False)}"
+
 
 class DepoAnalızGUI:
     def __init__(self, root):
@@ -24,9 +247,17 @@ class DepoAnalızGUI:
         }
         
         self.root.configure(bg=self.colors['bg'])
-        self.df = None
+        self.summary = None  # Parça parça okunan veri özeti (HareketOzeti)
+        self.job = None  # Çalışan arka plan işi (BackgroundJob)
         
         self.setup_ui()
+        
+        # Pencere çizildikten sonra ağır modüller arka planda yüklenir
+        self.root.after_idle(self.warm_up)
+    
+    def warm_up(self):
+        """Analiz ve fuzzy modüllerini ayrı bir iş parçacığında önceden yükler"""
+        threading.Thread(target=warm_up_modules, daemon=True).start()
     
     def setup_ui(self):
         """Ana UI bileşenlerini oluşturur"""
@@ -39,6 +270,10 @@ class DepoAnalızGUI:
         menubar.add_cascade(label="Tema", menu=theme_menu)
         theme_menu.add_command(label="🌙 Koyu Tema", command=self.apply_dark_theme)
         theme_menu.add_command(label="☀️ Açık Tema", command=self.apply_light_theme)
+
+        rules_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Kurallar", menu=rules_menu)
+        rules_menu.add_command(label="🔄 Kural Dosyasını Yeniden Yükle", command=self.reload_rules)
         
         # Başlık
         header_frame = tk.Frame(self.root, bg=self.colors['primary'], height=80)
@@ -84,7 +319,7 @@ class DepoAnalızGUI:
         control_title.pack(pady=15)
         
         # Dosya yükleme butonu
-        load_btn = tk.Button(
+        self.load_btn = tk.Button(
             parent,
             text="📂 CSV Dosyası Yükle",
             command=self.load_csv,
@@ -96,10 +331,10 @@ class DepoAnalızGUI:
             padx=20,
             pady=10
         )
-        load_btn.pack(pady=10, padx=20, fill=tk.X)
+        self.load_btn.pack(pady=10, padx=20, fill=tk.X)
         
         # Varsayılan dosya butonu
-        default_btn = tk.Button(
+        self.default_btn = tk.Button(
             parent,
             text="📄 Varsayılan Veriyi Kullan",
             command=self.load_default_data,
@@ -111,7 +346,7 @@ class DepoAnalızGUI:
             padx=20,
             pady=10
         )
-        default_btn.pack(pady=10, padx=20, fill=tk.X)
+        self.default_btn.pack(pady=10, padx=20, fill=tk.X)
         
         # Ayırıcı
         ttk.Separator(parent, orient='horizontal').pack(fill=tk.X, padx=20, pady=20)
@@ -127,7 +362,7 @@ class DepoAnalızGUI:
         analysis_title.pack(pady=15)
         
         # Analiz butonları
-        analyze_btn = tk.Button(
+        self.analyze_btn = tk.Button(
             parent,
             text="🔍 Veri Analizini Çalıştır",
             command=self.run_analysis,
@@ -139,10 +374,10 @@ class DepoAnalızGUI:
             padx=20,
             pady=10
         )
-        analyze_btn.pack(pady=10, padx=20, fill=tk.X)
+        self.analyze_btn.pack(pady=10, padx=20, fill=tk.X)
         
         # Fuzzy Logic butonu
-        fuzzy_btn = tk.Button(
+        self.fuzzy_btn = tk.Button(
             parent,
             text="🤖 Fuzzy Logic Değerlendirmesi",
             command=self.run_fuzzy_logic,
@@ -154,7 +389,22 @@ class DepoAnalızGUI:
             padx=20,
             pady=10
         )
-        fuzzy_btn.pack(pady=10, padx=20, fill=tk.X)
+        self.fuzzy_btn.pack(pady=10, padx=20, fill=tk.X)
+        
+        # Tüm operatörleri puanlama butonu
+        self.ranking_btn = tk.Button(
+            parent,
+            text="🏅 Tüm Operatörleri Puanla",
+            command=self.run_ranking,
+            bg=self.colors['primary'],
+            fg=self.colors['white'],
+            font=("Arial", 11, "bold"),
+            relief=tk.FLAT,
+            cursor="hand2",
+            padx=20,
+            pady=10
+        )
+        self.ranking_btn.pack(pady=10, padx=20, fill=tk.X)
         
         # Operatör seçimi
         operator_frame = tk.Frame(parent, bg=self.colors['white'])
@@ -177,7 +427,7 @@ class DepoAnalızGUI:
         # Rapor kaydetme
         ttk.Separator(parent, orient='horizontal').pack(fill=tk.X, padx=20, pady=20)
         
-        save_btn = tk.Button(
+        self.save_btn = tk.Button(
             parent,
             text="💾 Raporu Kaydet",
             command=self.save_report,
@@ -189,7 +439,35 @@ class DepoAnalızGUI:
             padx=20,
             pady=10
         )
-        save_btn.pack(pady=10, padx=20, fill=tk.X)
+        self.save_btn.pack(pady=10, padx=20, fill=tk.X)
+        
+        # Arka plan işi durumu
+        self.action_buttons = [
+            self.load_btn, self.default_btn, self.analyze_btn, self.fuzzy_btn,
+            self.ranking_btn, self.save_btn
+        ]
+        
+        self.status_label = tk.Label(
+            parent,
+            text="Hazır",
+            font=("Arial", 9),
+            bg=self.colors['white'],
+            fg=self.colors['primary']
+        )
+        self.status_label.pack(padx=20, anchor=tk.W)
+        
+        self.progress_bar = ttk.Progressbar(parent, mode='determinate', maximum=100)
+        self.progress_bar.pack(pady=5, padx=20, fill=tk.X)
+        
+        self.cancel_btn = tk.Button(
+            parent,
+            text="⛔ İptal",
+            command=self.cancel_job,
+            state=tk.DISABLED,
+            relief=tk.FLAT,
+            cursor="hand2"
+        )
+        self.cancel_btn.pack(pady=5, padx=20, fill=tk.X)
     
     def create_results_panel(self, parent):
         """Sağ sonuçlar paneli"""
@@ -204,9 +482,18 @@ class DepoAnalızGUI:
         )
         results_title.pack(pady=15)
         
+        # Rapor metni ve sayfalı tablo ayrı sekmelerde
+        self.results_tabs = ttk.Notebook(parent)
+        self.results_tabs.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        
         # Sonuç text alanı
-        text_frame = tk.Frame(parent, bg=self.colors['white'])
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        text_frame = tk.Frame(self.results_tabs, bg=self.colors['white'])
+        self.results_tabs.add(text_frame, text="📝 Rapor")
+        
+        # Sayfalı tablo (önizleme satırları, ürün özeti)
+        self.data_table = PagedTable(self.results_tabs, bg=self.colors['white'])
+        self.results_tabs.add(self.data_table.frame, text="📋 Tablo")
+        self.report_has_table = False  # Kaydedilen rapora tablo da eklenir mi
         
         # Scrollbar
         scrollbar = tk.Scrollbar(text_frame)
@@ -251,107 +538,218 @@ class DepoAnalızGUI:
         self.results_text.insert('1.0', welcome_message)
         self.results_text.config(state=tk.DISABLED)
     
+    def start_job(self, status, work, on_done, error_title, on_error=None):
+        """
+        work(progress) fonksiyonunu arka planda çalıştırır; sonucu ana döngüde
+        on_done'a verir. İş sürerken işlem butonları devre dışı kalır.
+        """
+        if self.job is not None:
+            return
+        
+        def on_failure(error):
+            self.finish_job("Hata")
+            if on_error is not None:
+                on_error(error)
+            else:
+                messagebox.showerror("Hata", f"{error_title}:\n{str(error)}")
+        
+        def on_success(result):
+            self.finish_job("Hazır")
+            on_done(result)
+        
+        for button in self.action_buttons:
+            button.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.progress_bar['value'] = 0
+        self.status_label.config(text=f"⏳ {status}...")
+        
+        self.job = BackgroundJob(
+            self.root,
+            work,
+            on_done=on_success,
+            on_error=on_failure,
+            on_progress=lambda ratio, message="": self.update_progress(status, ratio, message),
+            on_cancel=lambda: self.finish_job("İptal edildi")
+        )
+        self.job.start()
+    
+    def update_progress(self, status, ratio, message=""):
+        """İlerleme çubuğunu ve durum satırını günceller"""
+        self.progress_bar['value'] = ratio * 100
+        self.status_label.config(text=f"⏳ {status}... %{ratio * 100:.0f} {message}".rstrip())
+    
+    def finish_job(self, status):
+        """İş bittiğinde butonları yeniden etkinleştirir"""
+        self.job = None
+        for button in self.action_buttons:
+            button.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.progress_bar['value'] = 0
+        self.status_label.config(text=status)
+    
+    def cancel_job(self):
+        """Çalışan arka plan işini iptal eder"""
+        if self.job is not None:
+            self.job.cancel()
+            self.status_label.config(text="⏳ İptal ediliyor...")
+    
+    def show_result(self, text, table=None):
+        """
+        Sonuç alanının içeriğini değiştirir. table verilirse (PagedTable.set_data
+        argümanları) Tablo sekmesine yüklenir ve rapor kaydedilirken metne eklenir.
+        """
+        self.report_has_table = table is not None
+        if table is not None:
+            self.data_table.set_data(**table)
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete('1.0', tk.END)
+        self.results_text.insert('1.0', text)
+        self.results_text.config(state=tk.DISABLED)
+    
     def load_csv(self):
         """CSV dosyası yükler"""
         file_path = filedialog.askopenfilename(
             title="CSV Dosyası Seçin",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"), ("Hareket günlüğü", "*.hgl"),
+                       ("SQLite veritabanı", "*.sqlite *.db"), ("All files", "*.*")]
         )
         
         if file_path:
-            try:
-                self.df = pd.read_csv(file_path)
-                self.update_operator_list()
-                self.show_message(
-                    f"✅ Başarılı!\n\n{len(self.df)} satır veri yüklendi.",
-                    "success"
-                )
-                self.display_data_preview()
-            except Exception as e:
-                messagebox.showerror("Hata", f"Dosya yüklenemedi:\n{str(e)}")
+            self.start_job(
+                "Veri yükleniyor",
+                lambda progress: self.read_summary(file_path, progress),
+                lambda summary: self.on_data_loaded(
+                    summary, f"✅ Başarılı!\n\n{summary.satir_sayisi} satır veri yüklendi."
+                ),
+                "Dosya yüklenemedi"
+            )
     
     def load_default_data(self):
         """Varsayılan depo_verileri.csv dosyasını yükler"""
-        try:
-            self.df = pd.read_csv('depo_verileri.csv')
-            self.update_operator_list()
-            self.show_message(
-                f"✅ Başarılı!\n\nVarsayılan veri yüklendi ({len(self.df)} satır)",
-                "success"
-            )
-            self.display_data_preview()
-        except FileNotFoundError:
-            messagebox.showerror(
-                "Hata", 
-                "depo_verileri.csv dosyası bulunamadı!\n\n"
-                "Lütfen dosyanın proje klasöründe olduğundan emin olun."
-            )
-        except Exception as e:
-            messagebox.showerror("Hata", f"Veri yüklenemedi:\n{str(e)}")
+        def on_error(error):
+            if isinstance(error, FileNotFoundError):
+                messagebox.showerror(
+                    "Hata", 
+                    "depo_verileri.csv dosyası bulunamadı!\n\n"
+                    "Lütfen dosyanın proje klasöründe olduğundan emin olun."
+                )
+            else:
+                messagebox.showerror("Hata", f"Veri yüklenemedi:\n{str(error)}")
+        
+        self.start_job(
+            "Varsayılan veri yükleniyor",
+            lambda progress: self.read_summary('depo_verileri.csv', progress),
+            lambda summary: self.on_data_loaded(
+                summary, f"✅ Başarılı!\n\nVarsayılan veri yüklendi ({summary.satir_sayisi} satır)"
+            ),
+            "Veri yüklenemedi",
+            on_error
+        )
+    
+    def read_summary(self, file_path, progress):
+        """
+        CSV dosyasını (veya .hgl hareket günlüğünü) parça parça özetler; SQLite deposu seçildiyse özeti
+        indeksli toplam tablolarından alır (arka plan iş parçacığında çalışır)
+        """
+        if file_path.lower().endswith(('.sqlite', '.db')):
+            from depo_veritabani import HareketVeritabani
+            # Seçilen dosya değiştirilmez; özet bağlantı kapandıktan sonra da kullanılır
+            with HareketVeritabani(file_path, salt_okunur=True) as veritabani:
+                return veritabani.ozet()
+        from depo_veri import akis_ozeti_oku
+        return akis_ozeti_oku(file_path, ilerleme=progress)
+    
+    def on_data_loaded(self, summary, message):
+        """Yükleme işi bittiğinde (ana döngüde) özet verisini uygular"""
+        self.summary = summary
+        self.update_operator_list()
+        self.show_message(message, "success")
+        self.display_data_preview()
     
     def update_operator_list(self):
         """Operatör listesini günceller"""
-        if self.df is not None:
-            operators = sorted(self.df['Operator_ID'].unique())
+        if self.summary is not None:
+            operators = list(self.summary.operator_sayilari.index)
             self.operator_combo['values'] = operators
             if operators:
                 self.operator_combo.current(0)
     
     def display_data_preview(self):
-        """Yüklenen verinin önizlemesini gösterir"""
-        if self.df is None:
+        """Yüklenen verinin özetini metin, ilk kayıtlarını tablo olarak gösterir"""
+        if self.summary is None:
+            return
+        if self.summary.satir_sayisi == 0:
+            # Yalnızca başlık satırı olan dosya: tarih aralığı ve ilk kayıtlar yoktur
+            import pandas as pd
+            from depo_veri import OZET_SUTUNLARI
+            self.show_result(
+                "\n⚠️ Dosya boş: başlık satırı dışında hareket kaydı bulunamadı.\n",
+                table={
+                    'data': pd.DataFrame(columns=OZET_SUTUNLARI),
+                    'columns': {column: column for column in OZET_SUTUNLARI},
+                    'title': "İlk Kayıtlar",
+                },
+            )
             return
         
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete('1.0', tk.END)
+        first_day, last_day = format_date(self.summary.tarih_min), format_date(self.summary.tarih_max)
+        date_range = "-" if first_day == "-" else f"{first_day} - {last_day}"
         
         preview = f"""
 ╔════════════════════════════════════════════════════════════╗
 ║                    VERİ ÖNİZLEMESİ                         ║
 ╚════════════════════════════════════════════════════════════╝
 
-📊 Toplam Kayıt Sayısı: {len(self.df)}
-📅 Tarih Aralığı: {self.df['Tarih'].min()} - {self.df['Tarih'].max()}
-👥 Operatör Sayısı: {self.df['Operator_ID'].nunique()}
-📦 Ürün Çeşidi: {self.df['Urun_Kodu'].nunique()}
+📊 Toplam Kayıt Sayısı: {self.summary.satir_sayisi}
+📅 Tarih Aralığı: {date_range}
+👥 Operatör Sayısı: {len(self.summary.operator_sayilari)}
+📦 Ürün Çeşidi: {len(self.summary.urun_ozeti)}
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-İlk 5 Kayıt:
-
-{self.df.head().to_string()}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📋 İlk kayıtlar "Tablo" sekmesindedir.
 
 ✅ Veri başarıyla yüklendi! Analiz butonlarını kullanabilirsiniz.
 """
-        self.results_text.insert('1.0', preview)
-        self.results_text.config(state=tk.DISABLED)
+        first_rows = self.summary.ilk_satirlar
+        self.show_result(preview, table={
+            'data': first_rows,
+            'columns': {column: column for column in first_rows.columns},
+            'formatters': {'Tarih': format_date},
+            'filter_column': 'Operator_ID' if 'Operator_ID' in first_rows else None,
+            'title': "İlk Kayıtlar",
+        })
     
     def run_analysis(self):
-        """Veri analizini çalıştırır"""
-        if self.df is None:
+        """Veri analizini arka planda çalıştırır"""
+        if self.summary is None:
             messagebox.showwarning("Uyarı", "Önce veri yüklemelisiniz!")
             return
         
-        try:
-            # Günlük özet
-            cikis_df = self.df[self.df['Hareket_Turu'] == 'CIKIS']
-            kg_toplam = cikis_df[cikis_df['Birim'] == 'KG']['Miktar'].sum()
-            adet_toplam = cikis_df[cikis_df['Birim'] == 'ADET']['Miktar'].sum()
-            
-            # Verimlilik
-            operator_counts = self.df.groupby('Operator_ID').size().sort_values(ascending=False)
-            top3 = operator_counts.head(3)
-            
-            # Ürün bazlı analiz
-            product_summary = self.df.groupby('Urun_Kodu').agg({
-                'Miktar': 'sum',
-                'Hareket_Turu': 'count'
-            }).sort_values('Miktar', ascending=False)
-            
-            # Sonuçları göster
-            result = f"""
+        summary = self.summary
+        self.start_job(
+            "Analiz yapılıyor",
+            lambda progress: self.build_analysis_report(summary),
+            lambda result: self.show_result(*result),
+            "Analiz yapılırken hata oluştu"
+        )
+    
+    def build_analysis_report(self, summary):
+        """
+        Analiz raporu metnini ve ürün tablosunu üretir (arka plan iş
+        parçacığında çalışır). Ürün sayısı ne olursa olsun metin sabit
+        boyuttadır; ürünler sayfalı tabloda gösterilir.
+        """
+        from analiz import analiz_et
+        
+        # Günlük özet, verimlilik ve ürün bazlı analiz (CLI raporuyla ortak)
+        sonuc = analiz_et(summary)
+        kg_toplam, adet_toplam = sonuc.kg_toplam, sonuc.adet_toplam
+        top3 = sonuc.en_verimli
+        product_summary = sonuc.urun_siralamasi
+        
+        # Rapor metni
+        result = f"""
 ╔════════════════════════════════════════════════════════════╗
 ║                  VERİ ANALİZ RAPORU                        ║
 ╚════════════════════════════════════════════════════════════╝
@@ -364,35 +762,32 @@ class DepoAnalızGUI:
 🏆 VERİMLİLİK RAPORU (En Çok Hareket Yapan Operatörler)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-            for i, (op_id, count) in enumerate(top3.items(), 1):
-                medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉"
-                result += f"   {medal} {i}. {op_id:<10} : {count:>3} işlem\n"
-            
-            result += f"""
+        for i, (op_id, count) in enumerate(top3.items(), 1):
+            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉"
+            result += f"   {medal} {i}. {op_id:<10} : {count:>3} işlem\n"
+        
+        result += f"""
 📦 ÜRÜN BAZLI ÖZET
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-            for product, row in product_summary.iterrows():
-                result += f"   • {product:<12} : {int(row['Miktar']):>6} birim, {int(row['Hareket_Turu']):>3} işlem\n"
-            
-            result += f"""
+   {len(product_summary)} ürün "Tablo" sekmesinde (sayfalı; başlığa tıklayarak
+   sıralayın, ürün koduna göre filtreleyin).
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 ✅ Analiz başarıyla tamamlandı!
 ⏰ Analiz Zamanı: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-            
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete('1.0', tk.END)
-            self.results_text.insert('1.0', result)
-            self.results_text.config(state=tk.DISABLED)
-            
-        except Exception as e:
-            messagebox.showerror("Hata", f"Analiz yapılırken hata oluştu:\n{str(e)}")
+        
+        table = {
+            'data': product_summary.rename_axis('Urun_Kodu').reset_index(),
+            'columns': {'Urun_Kodu': "Ürün", 'Miktar': "Miktar", 'Islem_Sayisi': "İşlem"},
+            'title': "Ürün Bazlı Özet",
+        }
+        return result, table
     
     def run_fuzzy_logic(self):
-        """Fuzzy Logic değerlendirmesini çalıştırır"""
-        if self.df is None:
+        """Fuzzy Logic değerlendirmesini arka planda çalıştırır"""
+        if self.summary is None:
             messagebox.showwarning("Uyarı", "Önce veri yüklemelisiniz!")
             return
         
@@ -401,26 +796,41 @@ class DepoAnalızGUI:
             messagebox.showwarning("Uyarı", "Lütfen bir operatör seçin!")
             return
         
-        try:
-            # Operatör verilerini hesapla
-            op_data = self.df[self.df['Operator_ID'] == operator_id]
-            islem_sayisi = len(op_data)
-            hata_orani = random.uniform(0.05, 0.35)  # Simüle edilmiş
-            
-            # Fuzzy Logic değerlendirmesi
-            fuzzy_result = fuzzy_performans_degerlendirme(
-                islem_sayisi,
-                hata_orani,
-                operator_id
-            )
-            
-            # Performans çubuğu
-            bar_length = 30
-            filled = int((fuzzy_result['performans'] / 100) * bar_length)
-            bar = '█' * filled + '░' * (bar_length - filled)
-            
-            # Sonucu göster
-            result = f"""
+        summary = self.summary
+        self.start_job(
+            "Fuzzy Logic değerlendiriliyor",
+            lambda progress: self.build_fuzzy_report(summary, operator_id),
+            self.show_result,
+            "Fuzzy Logic çalıştırılırken hata oluştu"
+        )
+    
+    def build_fuzzy_report(self, summary, operator_id):
+        """Fuzzy Logic raporu metnini üretir (arka plan iş parçacığında çalışır)"""
+        from fuzzy_system import fuzzy_performans_degerlendirme
+        
+        # Operatör verilerini hesapla
+        islem_sayisi, hata_orani = summary.operator_ozeti(operator_id)
+        
+        # Fuzzy Logic değerlendirmesi
+        fuzzy_result = fuzzy_performans_degerlendirme(
+            islem_sayisi,
+            hata_orani,
+            operator_id
+        )
+        
+        # Performans çubuğu
+        bar_length = 30
+        filled = int((fuzzy_result['performans'] / 100) * bar_length)
+        bar = '█' * filled + '░' * (bar_length - filled)
+        
+        # Kural aktivasyonları (kural sayısı kural dosyasına göre değişebilir)
+        rule_lines = "\n".join(
+            f"   • Kural {i} : {value:.2f}"
+            for i, value in enumerate(fuzzy_result['debug']['kural_aktivasyonlari'].values(), 1)
+        )
+        
+        # Rapor metni
+        result = f"""
 ╔════════════════════════════════════════════════════════════╗
 ║            FUZZY LOGIC PERFORMANS DEĞERLENDİRMESİ         ║
 ╚════════════════════════════════════════════════════════════╝
@@ -434,21 +844,13 @@ class DepoAnalızGUI:
 📊 Fuzzy Logic Analizi
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
    İşlem Sayısı Üyelikleri:
-   • Düşük   : {fuzzy_result['debug']['islem_uyelikleri']['dusuk']:.2f}
-   • Orta    : {fuzzy_result['debug']['islem_uyelikleri']['orta']:.2f}
-   • Yüksek  : {fuzzy_result['debug']['islem_uyelikleri']['yuksek']:.2f}
+{self.format_memberships(fuzzy_result['debug']['islem_uyelikleri'])}
 
    Hata Oranı Üyelikleri:
-   • Düşük   : {fuzzy_result['debug']['hata_uyelikleri']['dusuk']:.2f}
-   • Orta    : {fuzzy_result['debug']['hata_uyelikleri']['orta']:.2f}
-   • Yüksek  : {fuzzy_result['debug']['hata_uyelikleri']['yuksek']:.2f}
+{self.format_memberships(fuzzy_result['debug']['hata_uyelikleri'])}
 
    Aktif Kurallar:
-   • Kural 1 : {fuzzy_result['debug']['kural_aktivasyonlari']['kural1']:.2f}
-   • Kural 2 : {fuzzy_result['debug']['kural_aktivasyonlari']['kural2']:.2f}
-   • Kural 3 : {fuzzy_result['debug']['kural_aktivasyonlari']['kural3']:.2f}
-   • Kural 4 : {fuzzy_result['debug']['kural_aktivasyonlari']['kural4']:.2f}
-   • Kural 5 : {fuzzy_result['debug']['kural_aktivasyonlari']['kural5']:.2f}
+{rule_lines}
 
 🎯 Performans Sonucu
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -464,14 +866,102 @@ class DepoAnalızGUI:
 ✅ Fuzzy Logic değerlendirmesi tamamlandı!
 ⏰ Değerlendirme Zamanı: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-            
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete('1.0', tk.END)
-            self.results_text.insert('1.0', result)
-            self.results_text.config(state=tk.DISABLED)
-            
+        
+        return result
+    
+    def run_ranking(self):
+        """Tüm operatörleri tek toplu fuzzy çağrısıyla arka planda puanlar"""
+        if self.summary is None:
+            messagebox.showwarning("Uyarı", "Önce veri yüklemelisiniz!")
+            return
+        
+        summary = self.summary
+        self.start_job(
+            "Operatörler puanlanıyor",
+            lambda progress: self.score_operators(summary),
+            self.show_ranking,
+            "Operatörler puanlanırken hata oluştu"
+        )
+    
+    def score_operators(self, summary):
+        """Tüm operatörleri puanlar (arka plan iş parçacığında çalışır)"""
+        from analiz import tum_operatorleri_skorla
+        return tum_operatorleri_skorla(summary)
+    
+    def show_ranking(self, ranking):
+        """Sıralama özetini sonuç alanına yazar ve sıralanabilir tabloyu açar"""
+        counts = ranking['Kategori'].value_counts()
+        lines = "\n".join(
+            f"   {row.Sira:>4}. {op_id:<10} : {row.Performans:>6.2f}  {row.Kategori}"
+            for op_id, row in ranking.head(10).iterrows()
+        )
+        categories = "\n".join(f"   • {category:<22}: {count}" for category, count in counts.items())
+        self.show_result(f"""
+╔════════════════════════════════════════════════════════════╗
+║              TÜM OPERATÖRLER - FUZZY SIRALAMA              ║
+╚════════════════════════════════════════════════════════════╝
+
+👥 Puanlanan Operatör: {len(ranking)}
+
+📊 Kategori Dağılımı
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{categories}
+
+🏆 İlk 10 Operatör
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{lines}
+
+💡 Tam liste ayrı pencerededir; sütun başlığına tıklayarak sıralayın.
+⏰ Değerlendirme Zamanı: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+""")
+        self.open_ranking_window(ranking)
+    
+    def open_ranking_window(self, ranking):
+        """Operatör sıralamasını sayfalı, sıralanabilir ve filtrelenebilir bir tabloda gösterir"""
+        window = tk.Toplevel(self.root)
+        window.title("Operatör Sıralaması")
+        window.geometry("700x500")
+        
+        table = PagedTable(window)
+        table.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        table.set_data(
+            ranking.reset_index(),
+            {
+                'Sira': "Sıra",
+                'Operator_ID': "Operatör",
+                'Islem_Sayisi': "İşlem",
+                'Hata_Orani': "Hata %",
+                'Performans': "Skor",
+                'Kategori': "Kategori",
+            },
+            formatters={
+                'Hata_Orani': lambda value: f"{value * 100:.1f}",
+                'Performans': lambda value: f"{value:.2f}",
+            },
+            filter_column='Operator_ID',
+            title="Operatör Sıralaması",
+        )
+    
+    def reload_rules(self):
+        """kurallar.json dosyasını yeniden okur (uygulamayı kapatmadan)"""
+        from fuzzy_system import kurallari_yukle
+        
+        try:
+            evaluator = kurallari_yukle()
+            messagebox.showinfo(
+                "Kurallar",
+                f"Kural dosyası yeniden yüklendi ({evaluator.kural_tabani.kural_sayisi} kural)"
+            )
         except Exception as e:
-            messagebox.showerror("Hata", f"Fuzzy Logic çalıştırılırken hata oluştu:\n{str(e)}")
+            messagebox.showerror("Hata", f"Kural dosyası yüklenemedi:\n{str(e)}")
+    
+    def format_memberships(self, memberships):
+        """Üyelik derecelerini rapor satırlarına çevirir"""
+        labels = {'dusuk': 'Düşük', 'orta': 'Orta', 'yuksek': 'Yüksek'}
+        return "\n".join(
+            f"   • {labels.get(term, term.capitalize()):<7} : {value:.2f}"
+            for term, value in memberships.items()
+        )
     
     def save_report(self):
         """Raporu dosyaya kaydeder"""
@@ -489,6 +979,9 @@ class DepoAnalızGUI:
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(self.results_text.get('1.0', tk.END))
+                    # Metinde yalnızca özeti olan tablo (filtre/sıralamasıyla) tam olarak eklenir
+                    if self.report_has_table:
+                        f.write("\n" + self.data_table.to_text() + "\n")
                 messagebox.showinfo("Başarılı", f"Rapor kaydedildi:\n{file_path}")
             except Exception as e:
                 messagebox.showerror("Hata", f"Rapor kaydedilemedi:\n{str(e)}")
@@ -0,0 +1,412 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from depo_veri import (CSV_TIPLERI, GUNLUK_UZANTISI, OZET_SUTUNLARI, VARSAYILAN_PARCA_BOYUTU,
+                       HareketOzeti, _grup_sonlari, _kategorik, _kodlu_yuruyen_stok, akis_ozeti_oku,
+                       csv_bayt_tablolari, csv_blogu, gunluk_mu, tipleri_uygula)
+
+# --- İKİLİ HAREKET GÜNLÜĞÜ ---
+# depo_verileri.csv şemasındaki hareketler sabit genişlikli 16 baytlık
+# kayıtlar olarak yalnızca sona eklenen bir dosyada tutulur. Kod sütunları
+# (hareket türü, birim, ürün, operatör) dosyanın yanındaki '<yol>.sozluk'
+# sözlüğünde ilk görülme sırasıyla numaralandırılır. Okuyucular dosyayı
+# np.memmap ile açar; özetler metin ayrıştırmadan, eşlenen kayıt dizileri
+# üzerinden hesaplanır.
+
+GUNLUK_IMZASI = b'DEPO-HGL'
+GUNLUK_SURUMU = 1
+
+BASLIK_TIPI = np.dtype([('imza', 'S8'), ('surum', '<u4'), ('kayit_boyutu', '<u4'), ('bos', 'V16')])
+KAYIT_TIPI = np.dtype([
+    ('gun', '<i4'),        # 1970-01-01'den itibaren gün numarası
+    ('tur', 'u1'),         # Hareket_Turu sözlük kodu
+    ('birim', 'u1'),       # Birim sözlük kodu
+    ('operator', '<u2'),   # Operator_ID sözlük kodu
+    ('urun', '<u4'),       # Urun_Kodu sözlük kodu
+    ('miktar', '<i4'),
+])
+
+# Kod sütunlarının kayıttaki alanları; eksik değer tüm bitleri 1 olan koddur,
+# alan işaretli tipe bakıldığında -1 (pandas'ın eksik kategori kodu) okunur
+KOD_ALANLARI = {'Hareket_Turu': 'tur', 'Birim': 'birim', 'Operator_ID': 'operator', 'Urun_Kodu': 'urun'}
+
+# Eksik tarih ve miktar için ayrılmış değer
+EKSIK_DEGER = np.iinfo(np.int32).min
+
+
+def _isaretli(dizi):
+    """İşaretsiz kod alanını aynı genişlikte işaretli tip olarak (kopyasız) gösterir"""
+    return dizi.view(np.dtype(f'i{dizi.dtype.itemsize}'))
+
+
+def _csv_metni(deger):
+    """Değeri CSV alanı olarak yazar (ayırıcı veya tırnak içeriyorsa tırnaklanır)"""
+    if any(k in deger for k in ',"\r\n'):
+        return '"' + deger.replace('"', '""') + '"'
+    return deger
+
+
+class HareketGunlugu:
+    """
+    Yalnızca sona eklenen ikili hareket günlüğü.
+
+    Kayıt: int32 gün, uint8 hareket türü ve birim, sözlük kodlu operatör
+    (uint16) ve ürün (uint32), int32 miktar. Yeni kodlar kayıtlardan önce
+    sözlüğe yazılır; dosyadaki her kaydın kodları bu yüzden sözlükte
+    bulunur. Sona yarım yazılmış bir kayıt okumada yok sayılır. Aynı anda
+    tek yazıcı, istenen sayıda okuyucu olabilir.
+    """
+
+    def __init__(self, yol):
+        self.yol = yol
+        self.sozluk_yolu = yol + '.sozluk'
+        self._kodlar = None
+
+    # --- Okuma ---
+
+    def _baslik_kontrol(self):
+        """Dosya başlığını doğrular; kayıtların başladığı konumu döndürür"""
+        with open(self.yol, 'rb') as f:
+            baslik = np.frombuffer(f.read(BASLIK_TIPI.itemsize), dtype=BASLIK_TIPI)
+        if (len(baslik) == 0 or baslik['imza'][0] != GUNLUK_IMZASI
+                or baslik['surum'][0] != GUNLUK_SURUMU or baslik['kayit_boyutu'][0] != KAYIT_TIPI.itemsize):
+            raise ValueError(f"{self.yol} geçerli bir hareket günlüğü değil")
+        return BASLIK_TIPI.itemsize
+
+    @property
+    def satir_sayisi(self):
+        """Dosyadaki tam kayıt sayısı"""
+        return max(os.path.getsize(self.yol) - BASLIK_TIPI.itemsize, 0) // KAYIT_TIPI.itemsize
+
+    def kayitlar(self):
+        """Tüm kayıtları salt okunur np.memmap (yapılandırılmış dizi) olarak açar"""
+        ofset = self._baslik_kontrol()
+        n = self.satir_sayisi
+        if n == 0:
+            return np.empty(0, dtype=KAYIT_TIPI)
+        return np.memmap(self.yol, dtype=KAYIT_TIPI, mode='r', offset=ofset, shape=(n,))
+
+    def sozluk(self):
+        """Sütun bazında kod sırasıyla sözlük değerleri"""
+        sozluk = {sutun: [] for sutun in KOD_ALANLARI}
+        if not os.path.exists(self.sozluk_yolu):
+            return sozluk
+        with open(self.sozluk_yolu, encoding='utf-8') as f:
+            for satir in f:
+                try:
+                    sutun, deger = json.loads(satir)
+                except ValueError:
+                    break  # yarım yazılmış son satır
+                sozluk[sutun].append(deger)
+        return sozluk
+
+    def tablo(self, bas=0, son=None):
+        """[bas, son) kayıtlarını şemaya uygun (tipli) DataFrame olarak döndürür"""
+        kayitlar = self.kayitlar()[bas:son]
+        return _kayit_tablosu(kayitlar, _sirali_sozluk(self.sozluk()), bas)
+
+    def parcalar(self, parca_boyutu=VARSAYILAN_PARCA_BOYUTU):
+        """Kayıtları memmap üzerinden parça parça tipli DataFrame olarak üretir"""
+        # Sözlük kayıtlar eşlendikten sonra okunur; eşlenen her kaydın kodları içindedir
+        kayitlar = self.kayitlar()
+        sozluk = _sirali_sozluk(self.sozluk())
+        for bas in range(0, len(kayitlar), parca_boyutu):
+            yield _kayit_tablosu(kayitlar[bas:bas + parca_boyutu], sozluk, bas)
+
+    def ozet(self, parca_boyutu=VARSAYILAN_PARCA_BOYUTU, ilerleme=None):
+        """
+        Günlüğün HareketOzeti'ni kayıtlardan DataFrame kurmadan hesaplar.
+
+        Toplamlar parça parça, günlük sözlük kodlarıyla indekslenen diziler
+        üzerinde np.bincount ile biriktirilir; kodlar yalnızca sonuçtaki
+        küçük tablolar için adlara çevrilir. Yürüyen stok, akis_ozeti_oku'nun
+        CSV parçalarında olduğu gibi parçadan parçaya dosya sırasıyla devreder.
+        ilerleme verilirse her parçadan sonra 0-1 arası oranla çağrılır.
+        """
+        kayitlar = self.kayitlar()
+        sozluk = self.sozluk()
+        ozet = HareketOzeti()
+        if len(kayitlar) == 0:
+            return ozet
+        boyut = {sutun: len(degerler) for sutun, degerler in sozluk.items()}
+        tur_kodu = {ad: kod for kod, ad in enumerate(sozluk['Hareket_Turu'])}
+        giris_kodu, cikis_kodu = tur_kodu.get('GIRIS', -2), tur_kodu.get('CIKIS', -2)
+
+        cikis_miktari = np.zeros(boyut['Birim'])
+        cikis_adedi = np.zeros(boyut['Birim'], dtype=np.int64)
+        urun_miktari = np.zeros(boyut['Urun_Kodu'])
+        urun_adedi = np.zeros(boyut['Urun_Kodu'], dtype=np.int64)
+        operator_adedi = np.zeros(boyut['Operator_ID'], dtype=np.int64)
+        cikis_sayilari = np.zeros(boyut['Operator_ID'], dtype=np.int64)
+        hatali_cikislar = np.zeros(boyut['Operator_ID'], dtype=np.int64)
+        stok = np.zeros(boyut['Urun_Kodu'])
+        stoklu = np.zeros(boyut['Urun_Kodu'], dtype=bool)
+        gun_min = gun_max = None
+        eksik_miktar = False
+
+        for bas in range(0, len(kayitlar), parca_boyutu):
+            dilim = kayitlar[bas:bas + parca_boyutu]
+            tur, birim, operator, urun = (_isaretli(dilim[KOD_ALANLARI[sutun]]) for sutun in
+                                          ('Hareket_Turu', 'Birim', 'Operator_ID', 'Urun_Kodu'))
+            gun = np.asarray(dilim['gun'])
+            miktar = np.asarray(dilim['miktar'])
+            eksik = miktar == EKSIK_DEGER
+            eksik_miktar |= bool(eksik.any())
+            miktar = np.where(eksik, 0.0, miktar)
+
+            # gruplu_toplamlar gibi: türü, birimi veya ürünü eksik satırlar toplamlara katılmaz
+            gecerli = (tur >= 0) & (birim >= 0) & (urun >= 0)
+            cikis = gecerli & (tur == cikis_kodu)
+            cikis_miktari += np.bincount(birim[cikis], weights=miktar[cikis], minlength=boyut['Birim'])
+            cikis_adedi += np.bincount(birim[cikis], minlength=boyut['Birim'])
+            urun_miktari += np.bincount(urun[gecerli], weights=miktar[gecerli], minlength=boyut['Urun_Kodu'])
+            urun_adedi += np.bincount(urun[gecerli], minlength=boyut['Urun_Kodu'])
+            operator_adedi += np.bincount(operator[operator >= 0], minlength=boyut['Operator_ID'])
+
+            # Yürüyen stok ve stoku eksiye düşüren ÇIKIŞ'lar (stok_hatalari ile aynı)
+            sira, parca_stoku, cikis, urun_sirali, baslar = _kodlu_yuruyen_stok(
+                urun, gun, tur, giris_kodu, cikis_kodu, miktar, stok)
+            operator_sirali = operator[sira]
+            cikis &= operator_sirali >= 0
+            cikis_sayilari += np.bincount(operator_sirali[cikis], minlength=boyut['Operator_ID'])
+            hatali_cikislar += np.bincount(operator_sirali[cikis & (parca_stoku < 0)],
+                                           minlength=boyut['Operator_ID'])
+            sonlar = _grup_sonlari(parca_stoku, baslar)
+            stok[urun_sirali[sonlar]] = parca_stoku[sonlar]
+            stoklu[urun_sirali[sonlar]] = True
+
+            gunler = gun[gun != EKSIK_DEGER]
+            if len(gunler):
+                gun_min = gunler.min() if gun_min is None else min(gun_min, gunler.min())
+                gun_max = gunler.max() if gun_max is None else max(gun_max, gunler.max())
+            if ilerleme is not None:
+                ilerleme(min(bas + len(dilim), len(kayitlar)) / len(kayitlar))
+
+        # Kodlar yalnızca sonuçtaki küçük tablolar için adlara çevrilir
+        adlar = {sutun: pd.Index(degerler, dtype='str') for sutun, degerler in sozluk.items()}
+        miktar_tipi = np.float64 if eksik_miktar else np.int64
+        ozet.satir_sayisi = len(kayitlar)
+        ozet.ilk_satirlar = self.tablo(0, min(5, parca_boyutu))  # parca_ekle gibi ilk parçanın başı
+        ozet.cikis_toplamlari = pd.Series(
+            cikis_miktari.astype(miktar_tipi), index=adlar['Birim'].rename('Birim'), name='Miktar'
+        )[cikis_adedi > 0].sort_index()
+        ozet.operator_sayilari = pd.Series(operator_adedi, index=adlar['Operator_ID'])[operator_adedi > 0].sort_index()
+        ozet.urun_ozeti = pd.DataFrame(
+            {'Miktar': urun_miktari.astype(miktar_tipi), 'Islem_Sayisi': urun_adedi},
+            index=adlar['Urun_Kodu'].rename('Urun_Kodu'),
+        )[urun_adedi > 0].sort_index()
+        ozet.stok = pd.Series(stok, index=adlar['Urun_Kodu'])[stoklu].sort_index()
+        cikan = cikis_sayilari > 0
+        ozet.cikis_sayilari = pd.Series(cikis_sayilari, index=adlar['Operator_ID'])[cikan].sort_index()
+        ozet.hatali_cikislar = pd.Series(hatali_cikislar, index=adlar['Operator_ID'])[cikan].sort_index()
+        ozet.tarih_min, ozet.tarih_max = (
+            pd.NaT if deger is None else pd.Timestamp(np.datetime64(int(deger), 'D').astype('datetime64[us]'))
+            for deger in (gun_min, gun_max))
+        return ozet
+
+    # --- Yazma ---
+
+    def olustur(self):
+        """Boş bir günlük (yalnızca başlık) oluşturur; varsa eski günlük ve sözlük silinir"""
+        with open(self.yol, 'wb') as f:
+            baslik = np.zeros(1, dtype=BASLIK_TIPI)
+            baslik['imza'], baslik['surum'], baslik['kayit_boyutu'] = \
+                GUNLUK_IMZASI, GUNLUK_SURUMU, KAYIT_TIPI.itemsize
+            f.write(baslik.tobytes())
+        if os.path.exists(self.sozluk_yolu):
+            os.remove(self.sozluk_yolu)
+        self._kodlar = None
+
+    def ekle(self, df):
+        """Hareket tablosunu günlüğün sonuna ekler ve eklenen satır sayısını döndürür"""
+        if not os.path.exists(self.yol) or os.path.getsize(self.yol) == 0:
+            self.olustur()
+        ofset = self._baslik_kontrol()
+        if self._kodlar is None:
+            self._kodlar = {sutun: {deger: kod for kod, deger in enumerate(degerler)}
+                            for sutun, degerler in self.sozluk().items()}
+
+        kayit = np.empty(len(df), dtype=KAYIT_TIPI)
+        kayit['gun'] = self._gunler(df['Tarih'])
+        kayit['miktar'] = self._miktarlar(df['Miktar'])
+        yeni = []
+        try:
+            for sutun, alan in KOD_ALANLARI.items():
+                kayit[alan] = self._genel_kodlar(sutun, _kategorik(df[sutun]), kayit.dtype[alan], yeni)
+        except ValueError:
+            self._kodlar = None  # sözlüğe yazılmamış kodlar unutulur
+            raise
+
+        if yeni:
+            with open(self.sozluk_yolu, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(girdi, ensure_ascii=False) + '\n' for girdi in yeni)
+        with open(self.yol, 'r+b') as f:
+            # Yarım kalmış bir önceki yazımın artığı varsa üzerine yazılır
+            f.seek(ofset + self.satir_sayisi * KAYIT_TIPI.itemsize)
+            f.write(kayit.tobytes())
+            f.truncate()
+        return len(kayit)
+
+    def _genel_kodlar(self, sutun, deger, tip, yeni):
+        """Parçanın kategori kodlarını günlüğün sözlüğüne göre çevirir; yeni değerleri ekler"""
+        sozluk = self._kodlar[sutun]
+        eksik = np.iinfo(tip).max
+        for kategori in deger.cat.categories:
+            if kategori not in sozluk:
+                if len(sozluk) >= np.iinfo(np.dtype(f'i{tip.itemsize}')).max:
+                    raise ValueError(f"{sutun} sözlüğü dolu ({len(sozluk)} farklı değer)")
+                sozluk[kategori] = len(sozluk)
+                yeni.append([sutun, kategori])
+        eslesme = np.array([sozluk[k] for k in deger.cat.categories] + [eksik], dtype=tip)
+        # Eksik değerlerin kodu -1'dir; eslesme[-1] de eksik koduna karşılık gelir
+        return eslesme[deger.cat.codes.to_numpy()]
+
+    @staticmethod
+    def _gunler(tarih):
+        """Tarihleri gün numarasına çevirir (gün içi saat saklanmaz)"""
+        tarih = pd.to_datetime(tarih, format='ISO8601').to_numpy()
+        gun = tarih.astype('datetime64[D]')
+        eksik = np.isnat(tarih)
+        if np.any((gun != tarih) & ~eksik):
+            raise ValueError("hareket günlüğü yalnızca gün çözünürlüğünde tarih saklar")
+        return np.where(eksik, EKSIK_DEGER, gun.astype(np.int64))
+
+    @staticmethod
+    def _miktarlar(miktar):
+        """Miktarları int32'ye çevirir (kesirli veya aralık dışı değerlerde hata verir)"""
+        deger = miktar.to_numpy(dtype=np.float64, na_value=np.nan)
+        eksik = np.isnan(deger)
+        gecerli = deger[~eksik]
+        kesirli = gecerli[gecerli != np.floor(gecerli)]
+        if len(kesirli):
+            raise ValueError(f"hareket günlüğü (.hgl) yalnızca tam sayı miktar saklar, kesirli miktar: {kesirli[0]:g}; "
+                             "kesirli miktarlar için CSV veya SQLite deposu (--db) kullanın")
+        if np.any((gecerli <= EKSIK_DEGER) | (gecerli > np.iinfo(np.int32).max)):
+            raise ValueError("miktar int32 aralığının dışında")
+        return np.where(eksik, EKSIK_DEGER, np.nan_to_num(deger)).astype(np.int32)
+
+
+def _sirali_sozluk(sozluk):
+    """
+    CSV okumasıyla aynı kategori sırası için her sütunun alfabetik
+    değerlerini ve günlük kodundan sıralı koda çeviri tablosunu hazırlar
+    (son eleman eksik değer -1 içindir)
+    """
+    sirali = {}
+    for sutun, degerler in sozluk.items():
+        sira = np.argsort(np.array(degerler, dtype=object), kind='stable') if degerler else np.zeros(0, int)
+        cevir = np.empty(len(degerler) + 1, dtype=np.int32)
+        cevir[sira] = np.arange(len(degerler))
+        cevir[-1] = -1
+        sirali[sutun] = ([degerler[i] for i in sira], cevir)
+    return sirali
+
+
+def _kayit_tablosu(kayitlar, sozluk, bas):
+    """Kayıt diliminden (_sirali_sozluk ile hazırlanmış sözlükle) tiplenmiş bir DataFrame kurar"""
+    df = pd.DataFrame(index=pd.RangeIndex(bas, bas + len(kayitlar)))
+    for sutun in OZET_SUTUNLARI:
+        if sutun in KOD_ALANLARI:
+            degerler, cevir = sozluk[sutun]
+            kodlar = cevir[_isaretli(kayitlar[KOD_ALANLARI[sutun]])]
+            df[sutun] = pd.Categorical.from_codes(kodlar, categories=pd.Index(degerler, dtype='str'))
+        elif sutun == 'Tarih':
+            gun = kayitlar['gun'].astype(np.int64)
+            gun[gun == EKSIK_DEGER] = np.iinfo(np.int64).min  # NaT
+            df[sutun] = gun.view('datetime64[D]').astype('datetime64[us]')
+        else:
+            miktar = np.asarray(kayitlar['miktar'])
+            eksik = miktar == EKSIK_DEGER
+            if eksik.any():
+                df[sutun] = np.where(eksik, np.nan, miktar)
+            else:
+                df[sutun] = pd.to_numeric(miktar.astype(np.int64), downcast='integer')
+    return df
+
+
+# --- DÖNÜŞTÜRÜCÜLER ---
+
+def csv_den_donustur(csv_yolu, gunluk_yolu, parca_boyutu=VARSAYILAN_PARCA_BOYUTU, ekle=False):
+    """
+    CSV dosyasını parça parça okuyup ikili günlüğe yazar (ekle=False ise
+    günlük baştan oluşturulur). Yazılan satır sayısını döndürür.
+    """
+    gunluk = HareketGunlugu(gunluk_yolu)
+    if not ekle or not os.path.exists(gunluk_yolu):
+        gunluk.olustur()
+    satir = 0
+    okuyucu = pd.read_csv(csv_yolu, usecols=OZET_SUTUNLARI, dtype=CSV_TIPLERI, chunksize=parca_boyutu)
+    for parca in okuyucu:
+        satir += gunluk.ekle(tipleri_uygula(parca))
+    return satir
+
+
+def csv_ye_donustur(gunluk_yolu, csv_yolu, parca_boyutu=VARSAYILAN_PARCA_BOYUTU):
+    """
+    Günlüğü depo_verileri.csv şemasında CSV dosyasına yazar ve yazılan bayt
+    sayısını döndürür. Satırlar, sentetik veri yazımındaki gibi, bayt
+    tablolarından kopyalanarak kurulur; to_csv biçimlemesi yapılmaz.
+    """
+    gunluk = HareketGunlugu(gunluk_yolu)
+    kayitlar = gunluk.kayitlar()
+    sozluk = gunluk.sozluk()
+    # Eksik kod (-1) tablonun son satırını, yani boş alanı seçer
+    kod_metinleri = {sutun: [_csv_metni(str(d)) for d in degerler] + [''] for sutun, degerler in sozluk.items()}
+
+    with open(csv_yolu, 'wb') as f:
+        f.write((','.join(OZET_SUTUNLARI) + '\n').encode('utf-8'))
+        for bas in range(0, len(kayitlar), parca_boyutu):
+            dilim = kayitlar[bas:bas + parca_boyutu]
+            # Tarih ve miktar için tablolar parçadaki farklı değerlerden kurulur
+            gunler, gun_kodu = np.unique(dilim['gun'], return_inverse=True)
+            miktarlar, miktar_kodu = np.unique(dilim['miktar'], return_inverse=True)
+            gun_metni = np.datetime_as_string(gunler.astype('datetime64[D]'), unit='D').tolist()
+            metinler = {
+                'Tarih': ['' if g == EKSIK_DEGER else m for g, m in zip(gunler, gun_metni)],
+                'Miktar': ['' if m == EKSIK_DEGER else str(m) for m in miktarlar.tolist()],
+                **kod_metinleri,
+            }
+            kodlar = {'Tarih': gun_kodu, 'Miktar': miktar_kodu}
+            for sutun, alan in KOD_ALANLARI.items():
+                kodlar[sutun] = _isaretli(dilim[alan])
+            tablolar = csv_bayt_tablolari([metinler[sutun] for sutun in OZET_SUTUNLARI])
+            csv_blogu([kodlar[sutun] for sutun in OZET_SUTUNLARI], tablolar).tofile(f)
+        return f.tell()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="İkili hareket günlüğü (.hgl): CSV'den/CSV'ye dönüştürme ve özet")
+    parser.add_argument('girdi', help="CSV dosyası veya .hgl günlüğü")
+    parser.add_argument('cikti', nargs='?', default=None,
+                        help="hedef dosya; uzantısı dönüşüm yönünü belirler (verilmezse günlük özetlenir)")
+    parser.add_argument('--ekle', action='store_true', help="CSV'yi mevcut günlüğün sonuna ekler")
+    parser.add_argument('--parca', type=int, default=VARSAYILAN_PARCA_BOYUTU, help="parça boyutu (satır)")
+    args = parser.parse_args()
+
+    baslangic = time.perf_counter()
+    if args.cikti is not None and gunluk_mu(args.cikti) and not gunluk_mu(args.girdi):
+        satir = csv_den_donustur(args.girdi, args.cikti, args.parca, ekle=args.ekle)
+        sure = time.perf_counter() - baslangic
+        print(f"✓ {satir:,} satır '{args.cikti}' günlüğüne yazıldı: "
+              f"{os.path.getsize(args.cikti) / 1e6:.1f} MB, {sure:.2f} s ({satir / max(sure, 1e-9):,.0f} satır/s)")
+    elif args.cikti is not None and gunluk_mu(args.girdi):
+        bayt = csv_ye_donustur(args.girdi, args.cikti, args.parca)
+        sure = time.perf_counter() - baslangic
+        print(f"✓ '{args.cikti}' yazıldı: {bayt / 1e6:.1f} MB, {sure:.2f} s "
+              f"({bayt / 1e6 / max(sure, 1e-9):.0f} MB/s)")
+    elif args.cikti is None and gunluk_mu(args.girdi):
+        ozet = akis_ozeti_oku(args.girdi, args.parca)
+        sure = time.perf_counter() - baslangic
+        kg, adet = ozet.gunluk_ozet()
+        print(f"Toplam {ozet.satir_sayisi:,} satır ({KAYIT_TIPI.itemsize} bayt/satır), {sure:.2f} s; "
+              f"ÇIKIŞ {kg} KG, {adet} ADET")
+        for sira, (operator_id, sayi) in enumerate(ozet.verimlilik_raporu(3).items(), 1):
+            print(f"   {sira}. {operator_id}: {sayi} işlem")
+    else:
+        parser.error(f"girdi veya çıktıdan biri {GUNLUK_UZANTISI} uzantılı olmalı")
@@ -1,47 +1,137 @@
-import pandas as pd
-import random
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import olcum
+
+# pandas'a bağlı modüller (depo_veri, analiz, tarih_indeksi, fuzzy_system)
+# kullanıldıkları fonksiyonda içe aktarılır; --help ve argüman hataları
+# anında döner, işçi süreçler de yalnızca ihtiyaç duyduklarını yükler.
+
+def _kaynak_adi(dosya_yolu, tum_sutunlar=False):
+    """Verinin nereden okunacağını (günlük, önbellek veya CSV) yazar"""
+    from depo_veri import gunluk_mu, onbellek_gecerli
+    if gunluk_mu(dosya_yolu):
+        return 'günlükten'
+    return 'önbellekten' if onbellek_gecerli(dosya_yolu, tum_sutunlar) else 'CSV\'den'
 
 def veri_oku(dosya_yolu):
-    """CSV dosyasını okur"""
+    """CSV dosyasını tipli (kategorik/datetime/küçük tam sayı) şemayla okur"""
+    from depo_veri import satir_basina_bellek, tipli_veri_oku
     try:
-        df = pd.read_csv(dosya_yolu)
-        print(f"✓ {len(df)} satır veri yüklendi\n")
+        kaynak = _kaynak_adi(dosya_yolu, tum_sutunlar=True)
+        df = tipli_veri_oku(dosya_yolu)
+        print(f"✓ {len(df)} satır veri {kaynak} yüklendi "
+              f"(satır başına {satir_basina_bellek(df):.0f} bayt)\n")
         return df
     except FileNotFoundError:
         print(f"HATA: {dosya_yolu} bulunamadı!")
         return None
 
+def veri_oku_akis(dosya_yolu, parca_boyutu=None):
+    """CSV dosyasını parça parça okuyup özet değerleri biriktirir"""
+    from depo_veri import VARSAYILAN_PARCA_BOYUTU, akis_ozeti_oku
+    try:
+        kaynak = _kaynak_adi(dosya_yolu)
+        ozet = akis_ozeti_oku(dosya_yolu, parca_boyutu or VARSAYILAN_PARCA_BOYUTU)
+        print(f"✓ {ozet.satir_sayisi} satır veri {kaynak} işlendi\n")
+        return ozet
+    except FileNotFoundError:
+        print(f"HATA: {dosya_yolu} bulunamadı!")
+        return None
+
+def veri_oku_pencere(dosya_yolu, n_gun, bitis=None):
+    """CSV dosyasını tarih indeksiyle okuyup son n_gun günün özetini döndürür"""
+    from tarih_indeksi import TarihIndeksi
+    try:
+        indeks = TarihIndeksi.dosyadan(dosya_yolu)
+    except FileNotFoundError:
+        print(f"HATA: {dosya_yolu} bulunamadı!")
+        return None
+    if indeks.satir_sayisi == 0:
+        return indeks.pencere_ozeti()
+    if indeks.son_gun is None and bitis is None:
+        # Tarihli satır yok; tarihsiz satırlar hiçbir pencereye girmez
+        from depo_veri import HareketOzeti
+        print(f"✓ Tarihli satır yok; pencere boş (toplam {indeks.satir_sayisi})\n")
+        return HareketOzeti()
+    bas, son = indeks.son_gunler(n_gun, bitis)
+    ozet = indeks.pencere_ozeti(bas, son)
+    print(f"✓ {bas:%Y-%m-%d} - {son:%Y-%m-%d} aralığında {ozet.satir_sayisi} satır "
+          f"(toplam {indeks.satir_sayisi})\n")
+    return ozet
+
+def veri_oku_db(veritabani_yolu, dosya_yolu, n_gun=None, bitis=None):
+    """
+    CSV dosyasının yeni satırlarını SQLite veritabanına ekler ve özeti
+    (n_gun verilirse son n_gun günün) veritabanının indeksli toplam
+    tablolarından döndürür
+    """
+    from depo_veri import gunluk_mu
+    from depo_veritabani import HareketVeritabani
+    if gunluk_mu(dosya_yolu):
+        print(f"HATA: --db yalnızca CSV dosyalarını içe aktarır ({dosya_yolu})")
+        return None
+    with HareketVeritabani(veritabani_yolu) as veritabani:
+        try:
+            eklenen = veritabani.ice_aktar(dosya_yolu)
+        except FileNotFoundError:
+            print(f"HATA: {dosya_yolu} bulunamadı!")
+            return None
+        bas = son = None
+        if n_gun and veritabani.satir_sayisi:
+            bas, son = veritabani.son_gunler(n_gun, bitis)
+        ozet = veritabani.ozet(bas, son)
+    print(f"✓ {ozet.satir_sayisi} satır veri '{veritabani_yolu}' veritabanından okundu "
+          f"({eklenen} yeni satır eklendi)\n")
+    return ozet
+
 def gunluk_ozet(df):
-    """Toplam ÇIKIŞ miktarlarını hesaplar"""
-    cikis_df = df[df['Hareket_Turu'] == 'CIKIS']
-    
-    kg_toplam = cikis_df[cikis_df['Birim'] == 'KG']['Miktar'].sum()
-    adet_toplam = cikis_df[cikis_df['Birim'] == 'ADET']['Miktar'].sum()
-    
-    return kg_toplam, adet_toplam
+    """Toplam ÇIKIŞ miktarlarını hesaplar (DataFrame, HareketOzeti veya AnalizSonucu)"""
+    from analiz import analiz_et
+    sonuc = analiz_et(df)
+    return sonuc.kg_toplam, sonuc.adet_toplam
 
 def verimlilik_raporu(df):
-    """En çok hareket yapan 3 operatörü bulur"""
-    operator_sayilari = df.groupby('Operator_ID').size().sort_values(ascending=False)
-    return operator_sayilari.head(3)
+    """En çok hareket yapan 3 operatörü bulur (DataFrame, HareketOzeti veya AnalizSonucu)"""
+    from analiz import analiz_et
+    return analiz_et(df).en_verimli
 
-def rapor_olustur(df, fuzzy_sonuc=None):
-    """Tüm sonuçları ekrana ve dosyaya yazar"""
+def operator_degerlendir(ozet, operator_id):
+    """
+    Operatörün işlem sayısını ve hareket kaydından türetilen hata oranını
+    (stoku eksiye düşüren ÇIKIŞ payı) özetten alıp fuzzy değerlendirmesini yapar
+    """
+    from fuzzy_system import fuzzy_performans_degerlendirme
+    islem_sayisi, hata_orani = ozet.operator_ozeti(operator_id)
+    return fuzzy_performans_degerlendirme(islem_sayisi, hata_orani, operator_id)
+
+def rapor_metni_olustur(df, fuzzy_sonuc=None, baslik="BAG TECH DEPO ANALİZ RAPORU"):
+    """Rapor metnini üretir (DataFrame, HareketOzeti veya AnalizSonucu)"""
+    from analiz import analiz_et
+    sonuc = analiz_et(df)
+    with olcum.bolum('rapor_metni'):
+        return _rapor_metni(sonuc, fuzzy_sonuc, baslik)
+
+def _rapor_metni(sonuc, fuzzy_sonuc, baslik):
+    """AnalizSonucu ve fuzzy sonucundan rapor satırlarını biçimler"""
     rapor = []
     rapor.append("=" * 60)
-    rapor.append("BAG TECH DEPO ANALİZ RAPORU")
+    rapor.append(baslik)
     rapor.append("=" * 60)
     rapor.append("")
     
     # Günlük Özet
-    kg, adet = gunluk_ozet(df)
+    kg, adet = sonuc.kg_toplam, sonuc.adet_toplam
     rapor.append("📊 GÜNLÜK ÖZET (Toplam ÇIKIŞ Miktarları)")
     rapor.append(f"   KG Birimi    : {kg} KG")
     rapor.append(f"   ADET Birimi  : {adet} ADET")
     rapor.append("")
     
     # Verimlilik
-    top3 = verimlilik_raporu(df)
+    top3 = sonuc.en_verimli
     rapor.append("🏆 VERİMLİLİK RAPORU (En Çok Hareket Yapan Operatörler)")
     for i, (op_id, sayi) in enumerate(top3.items(), 1):
         rapor.append(f"   {i}. {op_id}: {sayi} işlem")
@@ -57,34 +147,174 @@ def rapor_olustur(df, fuzzy_sonuc=None):
         rapor.append(f"   Kategori      : {fuzzy_sonuc['kategori']}")
     
     rapor.append("=" * 60)
-    
-    # Ekrana yazdır
-    rapor_metni = "\n".join(rapor)
-    print(rapor_metni)
-    
-    # Dosyaya kaydet
-    with open('analiz_raporu.txt', 'w', encoding='utf-8') as f:
-        f.write(rapor_metni)
-    print("\n✓ Rapor 'analiz_raporu.txt' dosyasına kaydedildi")
+    return "\n".join(rapor)
 
-# Ana program
-if __name__ == "__main__":
-    # Veriyi yükle
-    df = veri_oku('depo_verileri.csv')
+def rapor_olustur(df, fuzzy_sonuc=None, dosya_yolu='analiz_raporu.txt'):
+    """Tüm sonuçları ekrana ve dosyaya yazar"""
+    rapor_metni = rapor_metni_olustur(df, fuzzy_sonuc)
     
-    if df is not None:
-        # Fuzzy Logic için simüle veri
-        operator_id = 'Op-101'
-        islem_sayisi = len(df[df['Operator_ID'] == operator_id])
-        hata_orani = random.uniform(0.05, 0.25)  # Simüle edilmiş
+    with olcum.bolum('rapor_yazma'):
+        # Ekrana yazdır
+        print(rapor_metni)
         
-        # Fuzzy sistemi çalıştır (aşağıda yazacağız)
-        from fuzzy_system import fuzzy_performans_degerlendirme
-        fuzzy_sonuc = fuzzy_performans_degerlendirme(
-            islem_sayisi, 
-            hata_orani, 
-            operator_id
+        # Dosyaya kaydet
+        with open(dosya_yolu, 'w', encoding='utf-8') as f:
+            f.write(rapor_metni)
+    print(f"\n✓ Rapor '{dosya_yolu}' dosyasına kaydedildi")
+
+# --- TOPLU (ÇOK DOSYALI) RAPOR ---
+
+def girdi_dosyalari(kaynak):
+    """Klasördeki *.csv dosyalarını ya da glob desenine uyan dosyaları sıralı döndürür"""
+    if os.path.isdir(kaynak):
+        kaynak = os.path.join(kaynak, '*.csv')
+    return sorted(yol for yol in glob.glob(kaynak) if os.path.isfile(yol))
+
+def _dosya_raporu(dosya_yolu, cikti_klasoru):
+    """
+    Süreç havuzunda çalışır: tek dosyayı özetler, raporunu yazar ve
+    (dosya, özet, süre, bayt, hata, ölçümler) döndürür. Ölçümler, ölçüm
+    açıksa bu dosyanın aşama süreleridir (kapalıysa None).
+    """
+    from depo_veri import akis_ozeti_oku
+    olcum.sifirla()
+    baslangic = time.perf_counter()
+    try:
+        ozet = akis_ozeti_oku(dosya_yolu)
+        en_verimli = verimlilik_raporu(ozet)
+        fuzzy_sonuc = operator_degerlendir(ozet, en_verimli.index[0]) if len(en_verimli) else None
+        ad = os.path.splitext(os.path.basename(dosya_yolu))[0]
+        rapor_metni = rapor_metni_olustur(
+            ozet, fuzzy_sonuc, baslik=f"BAG TECH DEPO ANALİZ RAPORU - {ad}"
         )
+        with open(os.path.join(cikti_klasoru, f"{ad}_analiz_raporu.txt"), 'w', encoding='utf-8') as f:
+            f.write(rapor_metni)
+        hata = None
+    except Exception as e:
+        ozet, hata = None, f"{type(e).__name__}: {e}"
+    sure = time.perf_counter() - baslangic
+    olcumler = olcum.anlik_goruntu() if olcum.acik() else None
+    return dosya_yolu, ozet, sure, os.path.getsize(dosya_yolu), hata, olcumler
+
+def toplu_rapor(kaynak, cikti_klasoru='raporlar', isci_sayisi=None):
+    """
+    Birden çok CSV dosyasını çekirdek sayısı kadar süreçte paralel işler.
+    Her dosya için ayrı rapor, tümü için birleşik bir özet yazar; sonunda
+    dosya başına süreyi ve toplam işlem hızını ekrana basar.
+    """
+    from depo_veri import HareketOzeti
+    dosyalar = girdi_dosyalari(kaynak)
+    if not dosyalar:
+        print(f"HATA: {kaynak} için CSV dosyası bulunamadı!")
+        return None
+    os.makedirs(cikti_klasoru, exist_ok=True)
+    isci_sayisi = min(isci_sayisi or os.cpu_count() or 1, len(dosyalar))
+    print(f"✓ {len(dosyalar)} dosya {isci_sayisi} süreçle işleniyor...\n")
+    
+    baslangic = time.perf_counter()
+    sonuclar = []
+    # Ölçüm açıksa işçi süreçlerde de açılır (spawn ile başlayan süreçler bayrağı devralmaz)
+    with ProcessPoolExecutor(max_workers=isci_sayisi,
+                             initializer=olcum.ac if olcum.acik() else None) as havuz:
+        isler = [havuz.submit(_dosya_raporu, dosya, cikti_klasoru) for dosya in dosyalar]
+        for is_ in as_completed(isler):
+            sonuclar.append(is_.result())
+    toplam_sure = time.perf_counter() - baslangic
+    sonuclar.sort(key=lambda sonuc: sonuc[0])
+    
+    # Dosya başına süre ve toplam hız
+    birlesik = HareketOzeti()
+    tablo = [f"{'Dosya':<40} {'Satır':>10} {'Süre (s)':>9} {'Satır/s':>12}", "-" * 74]
+    toplam_bayt = 0
+    for dosya, ozet, sure, bayt, hata, olcumler in sonuclar:
+        toplam_bayt += bayt
+        if olcumler is not None:
+            olcum.birlestir(olcumler)
+        ad = os.path.basename(dosya)
+        if hata is not None:
+            tablo.append(f"{ad:<40} HATA: {hata}")
+            continue
+        birlesik.birlestir(ozet)
+        tablo.append(f"{ad:<40} {ozet.satir_sayisi:>10} {sure:>9.3f} "
+                     f"{ozet.satir_sayisi / max(sure, 1e-9):>12,.0f}")
+    tablo.append("-" * 74)
+    tablo.append(f"Toplam: {birlesik.satir_sayisi} satır, {toplam_bayt / 1e6:.1f} MB, {toplam_sure:.2f} s "
+                 f"→ {birlesik.satir_sayisi / toplam_sure:,.0f} satır/s, "
+                 f"{toplam_bayt / 1e6 / toplam_sure:.1f} MB/s")
+    tablo_metni = "\n".join(tablo)
+    print(tablo_metni)
+    
+    # Birleşik özet (başarılı dosyaların toplamı + süre tablosu)
+    basarili = sum(1 for sonuc in sonuclar if sonuc[4] is None)
+    ozet_metni = rapor_metni_olustur(
+        birlesik, baslik=f"BAG TECH BİRLEŞİK ÖZET ({basarili}/{len(dosyalar)} dosya)"
+    )
+    ozet_yolu = os.path.join(cikti_klasoru, 'birlesik_ozet.txt')
+    with open(ozet_yolu, 'w', encoding='utf-8') as f:
+        f.write(ozet_metni + "\n\n" + tablo_metni + "\n")
+    print(f"\n✓ Raporlar '{cikti_klasoru}' klasörüne, birleşik özet '{ozet_yolu}' dosyasına kaydedildi")
+    return birlesik
+
+def calistir(args):
+    """Komut satırı argümanlarına göre toplu ya da tek dosya raporunu üretir"""
+    if args.toplu:
+        toplu_rapor(args.toplu, args.cikti, args.isci)
+        return
+    
+    if args.db:
+        # İndeksli SQLite deposu: yalnızca yeni satırlar eklenir, özet toplam tablolarından gelir
+        ozet = veri_oku_db(args.db, args.veri, args.gun, args.bitis)
+    elif args.gun:
+        # Tarih indeksinden yalnızca seçilen pencerenin satırları özetlenir
+        ozet = veri_oku_pencere(args.veri, args.gun, args.bitis)
+    else:
+        # Veriyi parça parça okuyup özetle (tüm tablo belleğe alınmaz)
+        ozet = veri_oku_akis(args.veri)
+    
+    if ozet is not None:
+        # Fuzzy Logic değerlendirmesi (hata oranı hareket kaydından)
+        fuzzy_sonuc = operator_degerlendir(ozet, 'Op-101')
         
         # Raporu oluştur
-        rapor_olustur(df, fuzzy_sonuc)
\ No newline at end of file
+        rapor_olustur(ozet, fuzzy_sonuc)
+
+# Ana program
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BAG Tech depo analiz raporu")
+    parser.add_argument('--veri', metavar='DOSYA', default='depo_verileri.csv',
+                        help="hareket verisi: CSV dosyası veya ikili hareket günlüğü (.hgl)")
+    parser.add_argument('--toplu', metavar='KLASOR_VEYA_DESEN',
+                        help="klasördeki veya glob desenine uyan tüm CSV dosyalarını paralel işler")
+    parser.add_argument('--cikti', default='raporlar', help="toplu raporların yazılacağı klasör")
+    parser.add_argument('--isci', type=int, default=None, help="süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--gun', type=int, default=None,
+                        help="raporu ve fuzzy işlem sayısını son N günle sınırlar")
+    parser.add_argument('--bitis', default=None,
+                        help="--gun penceresinin bitiş günü (YYYY-AA-GG, varsayılan: verideki son gün)")
+    parser.add_argument('--db', metavar='VERITABANI', default=None,
+                        help="veriyi indeksli SQLite deposuna ekleyip rapor sorgularını oradan yapar")
+    parser.add_argument('--profil', '--profile', action='store_true',
+                        help="sonunda aşama bazında süre ve sayaç dökümünü yazdırır")
+    parser.add_argument('--cprofil', metavar='PSTATS_DOSYASI', default=None,
+                        help="çalışmayı cProfile ile izler, istatistikleri dosyaya kaydeder (--profil içerir)")
+    args = parser.parse_args()
+    
+    if args.profil or args.cprofil:
+        olcum.ac()
+    profilci = None
+    if args.cprofil:
+        import cProfile
+        profilci = cProfile.Profile()
+        profilci.enable()
+    
+    calistir(args)
+    
+    if profilci is not None:
+        import pstats
+        profilci.disable()
+        profilci.dump_stats(args.cprofil)
+        print(f"\n⏱ cProfile (kümülatif süreye göre ilk 15, tümü '{args.cprofil}' dosyasında)")
+        pstats.Stats(profilci).sort_stats('cumulative').print_stats(15)
+    if olcum.acik():
+        print("\n⏱ AŞAMA DÖKÜMÜ")
+        print(olcum.rapor_metni())
@@ -0,0 +1,117 @@
+import threading
+import time
+from contextlib import nullcontext
+
+# Ölçüm kapalıyken bolum() bu tek nesneyi döndürür; giriş/çıkış hiçbir şey yapmaz
+_BOS_BOLUM = nullcontext()
+
+_acik = False
+_kilit = threading.Lock()
+_sureler = {}
+_cagrilar = {}
+_sayaclar = {}
+_baslangic = time.perf_counter()
+
+
+class _Bolum:
+    """Adlandırılmış bir aşamanın süresini ölçen bağlam yöneticisi"""
+
+    __slots__ = ('ad', 'bas')
+
+    def __init__(self, ad):
+        self.ad = ad
+
+    def __enter__(self):
+        self.bas = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        sure = time.perf_counter() - self.bas
+        with _kilit:
+            _sureler[self.ad] = _sureler.get(self.ad, 0.0) + sure
+            _cagrilar[self.ad] = _cagrilar.get(self.ad, 0) + 1
+        return False
+
+
+def bolum(ad):
+    """
+    'with olcum.bolum("csv_ayristirma"):' bloğunun süresini ad altında
+    biriktirir. Ölçüm kapalıysa paylaşılan boş bir bağlam döner; maliyet
+    tek bir bayrak kontrolüdür.
+    """
+    return _Bolum(ad) if _acik else _BOS_BOLUM
+
+
+def say(ad, adet=1):
+    """Ad altındaki sayacı artırır (ör. okunan satır, fuzzy çağrısı); kapalıyken bir şey yapmaz"""
+    if _acik:
+        with _kilit:
+            _sayaclar[ad] = _sayaclar.get(ad, 0) + adet
+
+
+def acik():
+    return _acik
+
+
+def ac():
+    """Ölçümü açar ve önceki değerleri sıfırlar"""
+    global _acik
+    sifirla()
+    _acik = True
+
+
+def kapat():
+    global _acik
+    _acik = False
+
+
+def sifirla():
+    """Biriken süre ve sayaçları siler; toplam süre bu andan itibaren sayılır"""
+    global _baslangic
+    with _kilit:
+        _sureler.clear()
+        _cagrilar.clear()
+        _sayaclar.clear()
+        _baslangic = time.perf_counter()
+
+
+def anlik_goruntu():
+    """Biriken değerlerin kopyası (süreçler arasında taşınabilir düz sözlük)"""
+    with _kilit:
+        return {
+            'sureler': dict(_sureler),
+            'cagrilar': dict(_cagrilar),
+            'sayaclar': dict(_sayaclar),
+            'toplam_sure': time.perf_counter() - _baslangic,
+        }
+
+
+def birlestir(goruntu):
+    """Başka bir süreçten gelen anlik_goruntu() değerlerini buradakilere ekler"""
+    with _kilit:
+        for hedef, kaynak in ((_sureler, goruntu['sureler']), (_cagrilar, goruntu['cagrilar']),
+                              (_sayaclar, goruntu['sayaclar'])):
+            for ad, deger in kaynak.items():
+                hedef[ad] = hedef.get(ad, 0) + deger
+
+
+def rapor_metni():
+    """Aşama bazında çağrı sayısı, toplam/ortalama süre ve pay; ardından sayaçlar"""
+    goruntu = anlik_goruntu()
+    toplam = goruntu['toplam_sure']
+    satirlar = [f"{'Aşama':<24} {'Çağrı':>9} {'Toplam (s)':>11} {'Ort. (ms)':>10} {'Pay':>7}",
+                "-" * 65]
+    for ad, sure in sorted(goruntu['sureler'].items(), key=lambda kayit: -kayit[1]):
+        cagri = goruntu['cagrilar'][ad]
+        satirlar.append(f"{ad:<24} {cagri:>9,} {sure:>11.4f} {sure / cagri * 1e3:>10.3f} "
+                        f"{sure / toplam if toplam else 0:>7.1%}")
+    satirlar.append("-" * 65)
+    satirlar.append(f"{'Toplam süre':<24} {'':>9} {toplam:>11.4f}")
+    satirlar.append("(İç içe aşamaların süreleri üst aşamada da sayılır; süreç havuzundaki "
+                    "süreler toplanır)")
+    if goruntu['sayaclar']:
+        satirlar.append("")
+        satirlar.append(f"{'Sayaç':<24} {'Değer':>15}")
+        for ad, deger in sorted(goruntu['sayaclar'].items()):
+            satirlar.append(f"{ad:<24} {deger:>15,}")
+    return "\n".join(satirlar)
@@ -0,0 +1,225 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from depo_veri import OZET_SUTUNLARI, csv_bayt_tablolari, csv_blogu
+
+# Üretim bu büyüklükte bloklar halinde yapılır; her blok kendi tohumuyla
+# üretildiği için aynı tohum her zaman aynı veriyi verir
+SENTETIK_PARCA_BOYUTU = 1 << 16
+
+HAREKET_TURLERI = ['GIRIS', 'CIKIS']
+BIRIMLER = ['KG', 'ADET']
+
+# Birim bazında miktar aralıkları (alt, üst dahil)
+MIKTAR_ARALIKLARI = {'KG': (5, 500), 'ADET': (1, 300)}
+
+
+# Çarpık seçimde kullanılan ters dağılım tablosunun boyutu; kodların
+# olasılıkları 1 / SECIM_TABLOSU_BOYUTU hassasiyetle temsil edilir
+SECIM_TABLOSU_BOYUTU = 1 << 20
+
+
+def _secim_tablosu(n, carpiklik, rng):
+    """
+    n kod için Zipf benzeri (1 / sıra^carpiklik) dağılımın ters dağılım
+    tablosu: tablodan eşit olasılıkla seçilen eleman bu dağılıma uyar.
+    Hangi kodun popüler olduğu tohuma bağlı rastgele bir sıralamayla belirlenir.
+    """
+    agirliklar = 1.0 / np.arange(1, n + 1) ** carpiklik
+    agirliklar = agirliklar[rng.permutation(n)]
+    kumulatif = np.cumsum(agirliklar) / agirliklar.sum()
+    orta_noktalar = (np.arange(SECIM_TABLOSU_BOYUTU) + 0.5) / SECIM_TABLOSU_BOYUTU
+    return np.minimum(np.searchsorted(kumulatif, orta_noktalar), n - 1).astype(np.int32)
+
+
+class SentetikVeri:
+    """
+    depo_verileri.csv şemasında (Tarih, Hareket_Turu, Urun_Kodu, Miktar,
+    Birim, Operator_ID) sentetik hareket kaydı üretir.
+
+    Satırlar gün sırasıyla ilerler; her ürünün sabit bir birimi vardır
+    (KG veya ADET). 'carpiklik' 0 ise operatör ve ürünler eşit sıklıkta,
+    büyüdükçe birkaç operatör/ürün hareketlerin çoğunu alacak şekilde
+    (Zipf) seçilir. Tablo bütün olarak belleğe alınmaz; parcalar() blok
+    blok DataFrame üretir, csv_yaz / sutunsal_yaz blok blok diske yazar.
+    """
+
+    def __init__(self, satir_sayisi, operator_sayisi=20, urun_sayisi=200, gun_sayisi=365,
+                 baslangic='2024-01-01', carpiklik=0.0, cikis_orani=0.55, tohum=0):
+        self.satir_sayisi = int(satir_sayisi)
+        self.operatorler = [f'Op-{101 + i}' for i in range(operator_sayisi)]
+        self.urunler = [f'Urun-{i + 1:04d}' for i in range(urun_sayisi)]
+        self.gun_sayisi = gun_sayisi
+        self.baslangic = np.datetime64(pd.Timestamp(baslangic).date(), 'D')
+        self.carpiklik = carpiklik
+        self.cikis_orani = cikis_orani
+        self.tohum = tohum
+
+        # Ürün birimleri ve popülerlik sıralaması da tohuma bağlıdır
+        rng = np.random.default_rng([tohum, 2 ** 32 - 1])
+        self.urun_birimleri = rng.integers(0, 2, urun_sayisi)
+        self._operator_tablosu = _secim_tablosu(operator_sayisi, carpiklik, rng)
+        self._urun_tablosu = _secim_tablosu(urun_sayisi, carpiklik, rng)
+
+    @property
+    def blok_sayisi(self):
+        return -(-self.satir_sayisi // SENTETIK_PARCA_BOYUTU)
+
+    def _sec(self, rng, secim_tablosu, kod_sayisi, n):
+        """Çarpıklığa göre n kod seçer (0 ise eşit dağılım)"""
+        if self.carpiklik == 0:
+            return rng.integers(0, kod_sayisi, n)
+        return secim_tablosu[rng.integers(0, SECIM_TABLOSU_BOYUTU, n)].astype(np.int64)
+
+    def _blok(self, blok_no):
+        """blok_no numaralı bloğun satırlarını kod dizileri olarak üretir"""
+        bas = blok_no * SENTETIK_PARCA_BOYUTU
+        son = min(bas + SENTETIK_PARCA_BOYUTU, self.satir_sayisi)
+        n = son - bas
+        rng = np.random.default_rng([self.tohum, blok_no])
+
+        gunler = np.arange(bas, son, dtype=np.int64) * self.gun_sayisi // max(self.satir_sayisi, 1)
+        urunler = self._sec(rng, self._urun_tablosu, len(self.urunler), n)
+        birimler = self.urun_birimleri[urunler]
+        turler = (rng.random(n) < self.cikis_orani).astype(np.int64)
+        (kg_alt, kg_ust), (adet_alt, adet_ust) = (MIKTAR_ARALIKLARI[b] for b in BIRIMLER)
+        miktarlar = np.where(birimler == 0, rng.integers(kg_alt, kg_ust + 1, n),
+                             rng.integers(adet_alt, adet_ust + 1, n))
+        operatorler = self._sec(rng, self._operator_tablosu, len(self.operatorler), n)
+        return {
+            'Tarih': gunler.astype(np.int32),
+            'Hareket_Turu': turler,
+            'Urun_Kodu': urunler,
+            'Miktar': miktarlar,
+            'Birim': birimler,
+            'Operator_ID': operatorler,
+        }
+
+    def _tablo(self, kodlar):
+        """Kod dizilerini kategorik sütunlu bir DataFrame'e çevirir"""
+        return pd.DataFrame({
+            'Tarih': (self.baslangic + kodlar['Tarih']).astype('datetime64[s]'),
+            'Hareket_Turu': pd.Categorical.from_codes(kodlar['Hareket_Turu'], HAREKET_TURLERI),
+            'Urun_Kodu': pd.Categorical.from_codes(kodlar['Urun_Kodu'], self.urunler),
+            'Miktar': kodlar['Miktar'],
+            'Birim': pd.Categorical.from_codes(kodlar['Birim'], BIRIMLER),
+            'Operator_ID': pd.Categorical.from_codes(kodlar['Operator_ID'], self.operatorler),
+        }, columns=OZET_SUTUNLARI)
+
+    def parcalar(self):
+        """Veriyi SENTETIK_PARCA_BOYUTU satırlık DataFrame'ler halinde üretir"""
+        for blok_no in range(self.blok_sayisi):
+            yield self._tablo(self._blok(blok_no))
+
+    def tablo(self):
+        """Tüm veriyi tek DataFrame olarak döndürür (küçük boyutlar için)"""
+        parcalar = list(self.parcalar())
+        if not parcalar:
+            return self._tablo({sutun: np.zeros(0, dtype=np.int64) for sutun in OZET_SUTUNLARI})
+        return pd.concat(parcalar, ignore_index=True)
+
+    # --- CSV ---
+
+    def _csv_tablolari(self):
+        """Sütun sırasıyla her kodun CSV metnini içeren bayt tabloları"""
+        gunler = np.datetime_as_string(self.baslangic + np.arange(self.gun_sayisi + 1), unit='D')
+        miktar_ust = max(ust for _, ust in MIKTAR_ARALIKLARI.values())
+        return csv_bayt_tablolari([
+            gunler.tolist(),
+            HAREKET_TURLERI,
+            self.urunler,
+            [str(m) for m in range(miktar_ust + 1)],
+            BIRIMLER,
+            self.operatorler,
+        ])
+
+    def csv_yaz(self, dosya_yolu):
+        """Veriyi blok blok CSV dosyasına yazar ve yazılan bayt sayısını döndürür"""
+        tablolar = self._csv_tablolari()
+        with open(dosya_yolu, 'wb') as f:
+            f.write((','.join(OZET_SUTUNLARI) + '\n').encode('utf-8'))
+            for blok_no in range(self.blok_sayisi):
+                kodlar = self._blok(blok_no)
+                csv_blogu([kodlar[sutun] for sutun in OZET_SUTUNLARI], tablolar).tofile(f)
+            return f.tell()
+
+    # --- SÜTUNSAL ---
+
+    def sutunsal_yaz(self, klasor):
+        """
+        Her sütunu klasörde ayrı bir .npy dosyasına (kod dizisi) yazar;
+        kod sözlükleri ve başlangıç günü sozluk.json dosyasına kaydedilir.
+        Dosyalar np.load(..., mmap_mode='r') ile kopyasız açılabilir.
+        Yazılan toplam bayt sayısını döndürür.
+        """
+        os.makedirs(klasor, exist_ok=True)
+        tipler = {'Tarih': np.int32, 'Hareket_Turu': np.uint8, 'Urun_Kodu': np.int32,
+                  'Miktar': np.int32, 'Birim': np.uint8, 'Operator_ID': np.int32}
+        diziler = {
+            sutun: np.lib.format.open_memmap(os.path.join(klasor, f'{sutun}.npy'), mode='w+',
+                                             dtype=tip, shape=(self.satir_sayisi,))
+            for sutun, tip in tipler.items()
+        }
+        for blok_no in range(self.blok_sayisi):
+            bas = blok_no * SENTETIK_PARCA_BOYUTU
+            for sutun, kod in self._blok(blok_no).items():
+                diziler[sutun][bas:bas + len(kod)] = kod
+        for dizi in diziler.values():
+            dizi.flush()
+        del diziler
+
+        with open(os.path.join(klasor, 'sozluk.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'satir_sayisi': self.satir_sayisi,
+                'baslangic': str(self.baslangic),
+                'Hareket_Turu': HAREKET_TURLERI,
+                'Urun_Kodu': self.urunler,
+                'Birim': BIRIMLER,
+                'Operator_ID': self.operatorler,
+            }, f, ensure_ascii=False)
+        return sum(os.path.getsize(os.path.join(klasor, ad)) for ad in os.listdir(klasor))
+
+
+def sutunsal_oku(klasor, mmap=True):
+    """sutunsal_yaz ile yazılmış klasörü şemaya uygun DataFrame olarak okur"""
+    with open(os.path.join(klasor, 'sozluk.json'), encoding='utf-8') as f:
+        sozluk = json.load(f)
+    diziler = {sutun: np.load(os.path.join(klasor, f'{sutun}.npy'), mmap_mode='r' if mmap else None)
+               for sutun in OZET_SUTUNLARI}
+    return pd.DataFrame({
+        'Tarih': (np.datetime64(sozluk['baslangic'], 'D') + diziler['Tarih']).astype('datetime64[s]'),
+        **{sutun: pd.Categorical.from_codes(diziler[sutun], sozluk[sutun])
+           for sutun in ('Hareket_Turu', 'Urun_Kodu', 'Birim', 'Operator_ID')},
+        'Miktar': np.asarray(diziler['Miktar']),
+    }, columns=OZET_SUTUNLARI)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="depo_verileri.csv şemasında sentetik hareket verisi üretir")
+    parser.add_argument('cikti', help="CSV dosyası veya (--bicim npy için) klasör")
+    parser.add_argument('--satir', type=int, default=1_000_000, help="satır sayısı")
+    parser.add_argument('--operator', type=int, default=20, help="operatör sayısı")
+    parser.add_argument('--urun', type=int, default=200, help="ürün sayısı")
+    parser.add_argument('--gun', type=int, default=365, help="gün sayısı")
+    parser.add_argument('--baslangic', default='2024-01-01', help="ilk gün (YYYY-AA-GG)")
+    parser.add_argument('--carpiklik', type=float, default=0.0,
+                        help="operatör/ürün seçimindeki Zipf üssü (0: eşit dağılım, ~1: gerçekçi)")
+    parser.add_argument('--tohum', type=int, default=0, help="rastgelelik tohumu")
+    parser.add_argument('--bicim', choices=['csv', 'npy'], default='csv', help="çıktı biçimi")
+    args = parser.parse_args()
+
+    uretici = SentetikVeri(args.satir, args.operator, args.urun, args.gun, args.baslangic,
+                           carpiklik=args.carpiklik, tohum=args.tohum)
+    baslangic = time.perf_counter()
+    if args.bicim == 'csv':
+        bayt = uretici.csv_yaz(args.cikti)
+    else:
+        bayt = uretici.sutunsal_yaz(args.cikti)
+    sure = time.perf_counter() - baslangic
+    print(f"✓ {args.satir:,} satır '{args.cikti}' hedefine yazıldı: {bayt / 1e6:.1f} MB, "
+          f"{sure:.2f} s ({bayt / 1e6 / max(sure, 1e-9):.0f} MB/s)")
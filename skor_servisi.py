@@ -0,0 +1,501 @@
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import olcum
+from fuzzy_system import (TOPLU_PARCA_BOYUTU, skor_onbellegini_ac, toplu_performans_degerlendirme,
+                          varsayilan_degerlendirici)
+
+VARSAYILAN_ADRES = '127.0.0.1'
+VARSAYILAN_PORT = 8765
+
+# İlk istek geldikten sonra aynı yığına girecek isteklerin bekleneceği süre
+MIKRO_PENCERE_MS = 2.0
+
+# Tek geçişte skorlanan en büyük yığın (toplu skorlamanın parça boyutu)
+EN_BUYUK_YIGIN = TOPLU_PARCA_BOYUTU
+
+# Gecikme yüzdelikleri son bu kadar istek üzerinden hesaplanır
+GECIKME_ORNEK_SAYISI = 10_000
+
+# Bu boyutun üzerindeki istek gövdeleri reddedilir (413)
+EN_BUYUK_GOVDE = 1 << 20
+
+_DURUM_METINLERI = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                    413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class IstekHatasi(ValueError):
+    """İstemcinin düzeltmesi gereken hatalı istek (400)"""
+
+
+def _girdi(kayit):
+    """İstek kaydından (islem_sayisi, hata_orani, operator_id) çıkarır ve doğrular"""
+    if not isinstance(kayit, dict):
+        raise IstekHatasi("kayıt bir JSON nesnesi olmalı")
+    try:
+        islem = float(kayit['islem_sayisi'])
+        hata = float(kayit['hata_orani'])
+    except KeyError as e:
+        raise IstekHatasi(f"eksik alan: {e.args[0]}") from None
+    except (TypeError, ValueError):
+        raise IstekHatasi("islem_sayisi ve hata_orani sayı olmalı") from None
+    if not (math.isfinite(islem) and math.isfinite(hata)):
+        raise IstekHatasi("islem_sayisi ve hata_orani sonlu olmalı")
+    return islem, hata, kayit.get('operator_id')
+
+
+class MikroYigin:
+    """
+    Eşzamanlı skor isteklerini kısa bir pencerede toplayıp tek
+    toplu_performans_degerlendirme çağrısıyla skorlar.
+
+    Yığın, içindeki en eski istek pencere kadar beklediğinde veya
+    en_buyuk isteğe ulaştığında kapanır. Skorlama ayrı bir iş parçacığında
+    yapılır; bu sırada gelen istekler bir sonraki yığında birikir ve
+    pencereyi zaten beklemiş olduklarından hemen skorlanır.
+    """
+
+    def __init__(self, pencere_ms=MIKRO_PENCERE_MS, en_buyuk=EN_BUYUK_YIGIN,
+                 degerlendir=toplu_performans_degerlendirme):
+        if en_buyuk < 1:
+            raise ValueError("en_buyuk en az 1 olmalı")
+        self.pencere = max(pencere_ms, 0.0) / 1e3
+        self.en_buyuk = en_buyuk
+        self.degerlendir = degerlendir
+        self._bekleyenler = deque()
+        self._yeni = asyncio.Event()
+        self._dolu = asyncio.Event()
+        self._yurutucu = ThreadPoolExecutor(max_workers=1, thread_name_prefix='skor')
+        self._gorev = None
+        self._gecikmeler = deque(maxlen=GECIKME_ORNEK_SAYISI)
+        self.istek_sayisi = 0
+        self.hatali_istek = 0
+        self.yigin_sayisi = 0
+        self.en_buyuk_gorulen_yigin = 0
+        self.en_yuksek_kuyruk = 0
+        self.skorlama_suresi = 0.0
+
+    def baslat(self):
+        if self._gorev is None:
+            self._gorev = asyncio.get_running_loop().create_task(self._dongu())
+
+    async def kapat(self):
+        if self._gorev is not None:
+            self._gorev.cancel()
+            try:
+                await self._gorev
+            except asyncio.CancelledError:
+                pass
+            self._gorev = None
+        for *_, gelecek in self._bekleyenler:
+            if not gelecek.done():
+                gelecek.cancel()
+        self._bekleyenler.clear()
+        self._yurutucu.shutdown(wait=False)
+
+    async def skorla(self, islem_sayisi, hata_orani):
+        """Tek bir (işlem sayısı, hata oranı) çiftini sıraya koyar; (skor, kategori) döndürür"""
+        loop = asyncio.get_running_loop()
+        gelecek = loop.create_future()
+        self._bekleyenler.append((islem_sayisi, hata_orani, loop.time(), gelecek))
+        derinlik = len(self._bekleyenler)
+        if derinlik > self.en_yuksek_kuyruk:
+            self.en_yuksek_kuyruk = derinlik
+        self._yeni.set()
+        if derinlik >= self.en_buyuk:
+            self._dolu.set()
+        return await gelecek
+
+    async def _dongu(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._bekleyenler:
+                self._yeni.clear()
+                await self._yeni.wait()
+                continue
+            kalan = self._bekleyenler[0][2] + self.pencere - loop.time()
+            if kalan > 0 and len(self._bekleyenler) < self.en_buyuk:
+                self._dolu.clear()
+                try:
+                    await asyncio.wait_for(self._dolu.wait(), kalan)
+                except asyncio.TimeoutError:
+                    pass
+            n = min(len(self._bekleyenler), self.en_buyuk)
+            yigin = [self._bekleyenler.popleft() for _ in range(n)]
+            await self._yigini_skorla(yigin, loop)
+
+    async def _yigini_skorla(self, yigin, loop):
+        islem = np.fromiter((kayit[0] for kayit in yigin), dtype=float, count=len(yigin))
+        hata = np.fromiter((kayit[1] for kayit in yigin), dtype=float, count=len(yigin))
+        baslangic = time.perf_counter()
+        try:
+            sonuc = await loop.run_in_executor(self._yurutucu, self.degerlendir, islem, hata)
+        except Exception as e:
+            for *_, gelecek in yigin:
+                if not gelecek.done():
+                    gelecek.set_exception(e)
+            return
+        finally:
+            self.skorlama_suresi += time.perf_counter() - baslangic
+            self.yigin_sayisi += 1
+            self.en_buyuk_gorulen_yigin = max(self.en_buyuk_gorulen_yigin, len(yigin))
+
+        skorlar = sonuc['performans'].tolist()
+        kategoriler = sonuc['kategori'].tolist()
+        simdi = loop.time()
+        for (_, _, zaman, gelecek), skor, kategori in zip(yigin, skorlar, kategoriler):
+            self._gecikmeler.append(simdi - zaman)
+            if not gelecek.done():
+                gelecek.set_result((skor, kategori))
+        self.istek_sayisi += len(yigin)
+
+    def istatistikler(self):
+        """İstek/yığın sayıları, kuyruk derinliği ve gecikme yüzdelikleri (ms)"""
+        gecikmeler = np.fromiter(self._gecikmeler, dtype=float) * 1e3
+        if len(gecikmeler):
+            p50, p95, p99 = np.percentile(gecikmeler, [50, 95, 99]).tolist()
+            gecikme = {'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99,
+                       'maks_ms': float(gecikmeler.max()), 'ornek': len(gecikmeler)}
+        else:
+            gecikme = {'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'maks_ms': None, 'ornek': 0}
+        return {
+            'istek_sayisi': self.istek_sayisi,
+            'hatali_istek': self.hatali_istek,
+            'yigin_sayisi': self.yigin_sayisi,
+            'ortalama_yigin': self.istek_sayisi / self.yigin_sayisi if self.yigin_sayisi else 0.0,
+            'en_buyuk_yigin': self.en_buyuk_gorulen_yigin,
+            'kuyruk_derinligi': len(self._bekleyenler),
+            'en_yuksek_kuyruk': self.en_yuksek_kuyruk,
+            'skorlama_suresi_s': self.skorlama_suresi,
+            'gecikme': gecikme,
+            'pencere_ms': self.pencere * 1e3,
+        }
+
+
+def _http_yaniti(durum, govde, kapat):
+    veri = json.dumps(govde, ensure_ascii=False).encode('utf-8')
+    basliklar = (f"HTTP/1.1 {durum} {_DURUM_METINLERI.get(durum, '')}\r\n"
+                 f"Content-Type: application/json; charset=utf-8\r\n"
+                 f"Content-Length: {len(veri)}\r\n"
+                 f"Connection: {'close' if kapat else 'keep-alive'}\r\n\r\n")
+    return basliklar.encode('latin-1') + veri
+
+
+async def _http_oku(reader):
+    """
+    Bir HTTP mesajının ilk satırını, başlıklarını ve gövdesini okur.
+    Bağlantı kapandıysa None döner.
+    """
+    ilk_satir = await reader.readline()
+    if not ilk_satir:
+        return None
+    basliklar = {}
+    while True:
+        satir = await reader.readline()
+        if satir in (b'\r\n', b'\n', b''):
+            break
+        ad, _, deger = satir.decode('latin-1').partition(':')
+        basliklar[ad.strip().lower()] = deger.strip()
+    try:
+        uzunluk = int(basliklar.get('content-length', 0))
+    except ValueError:
+        raise ValueError("geçersiz Content-Length") from None
+    if uzunluk > EN_BUYUK_GOVDE:
+        raise IstekHatasi("istek gövdesi çok büyük")
+    govde = await reader.readexactly(uzunluk) if uzunluk else b''
+    return ilk_satir.decode('latin-1').split(), basliklar, govde
+
+
+class SkorServisi:
+    """
+    Fuzzy skorlamayı yerel bir HTTP/JSON servisi olarak sunar (TCP veya
+    Unix soketi). Değerlendirici süreç başında bir kez kurulur.
+
+      POST /skor   {"islem_sayisi": 18, "hata_orani": 0.05, "operator_id": "Op-101"}
+                   veya {"kayitlar": [{...}, ...]}
+      GET  /durum  istek/yığın sayıları, kuyruk derinliği, gecikme yüzdelikleri
+    """
+
+    def __init__(self, adres=VARSAYILAN_ADRES, port=VARSAYILAN_PORT, unix_yolu=None,
+                 pencere_ms=MIKRO_PENCERE_MS, en_buyuk=EN_BUYUK_YIGIN):
+        self.adres = adres
+        self.port = port
+        self.unix_yolu = unix_yolu
+        self.pencere_ms = pencere_ms
+        self.en_buyuk = en_buyuk
+        self.yigin = None
+        self._sunucu = None
+        self._baslangic = None
+
+    async def baslat(self):
+        varsayilan_degerlendirici()
+        self.yigin = MikroYigin(self.pencere_ms, self.en_buyuk)
+        self.yigin.baslat()
+        if self.unix_yolu:
+            self._sunucu = await asyncio.start_unix_server(self._baglanti, path=self.unix_yolu)
+        else:
+            self._sunucu = await asyncio.start_server(self._baglanti, self.adres, self.port)
+            # port=0 verildiyse işletim sisteminin seçtiği port
+            self.port = self._sunucu.sockets[0].getsockname()[1]
+        self._baslangic = time.perf_counter()
+        return self
+
+    async def kapat(self):
+        if self._sunucu is not None:
+            self._sunucu.close()
+            await self._sunucu.wait_closed()
+            self._sunucu = None
+        if self.yigin is not None:
+            await self.yigin.kapat()
+
+    async def sonsuza_kadar(self):
+        async with self._sunucu:
+            await self._sunucu.serve_forever()
+
+    def durum(self):
+        istatistik = self.yigin.istatistikler()
+        istatistik['calisma_suresi_s'] = time.perf_counter() - self._baslangic
+        return istatistik
+
+    async def _skor(self, govde):
+        try:
+            istek = json.loads(govde)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise IstekHatasi("gövde geçerli bir JSON değil") from None
+        if isinstance(istek, dict) and 'kayitlar' in istek:
+            if not isinstance(istek['kayitlar'], list):
+                raise IstekHatasi("kayitlar bir liste olmalı")
+            girdiler = [_girdi(kayit) for kayit in istek['kayitlar']]
+            sonuclar = await asyncio.gather(*(self.yigin.skorla(i, h) for i, h, _ in girdiler))
+            return {'sonuclar': [{'operator_id': op, 'performans': skor, 'kategori': kategori}
+                                 for (_, _, op), (skor, kategori) in zip(girdiler, sonuclar)]}
+        islem, hata, operator_id = _girdi(istek)
+        skor, kategori = await self.yigin.skorla(islem, hata)
+        return {'operator_id': operator_id, 'performans': skor, 'kategori': kategori}
+
+    async def _isle(self, yontem, yol, govde):
+        """İsteği yönlendirir; (HTTP durumu, JSON gövdesi) döndürür"""
+        yol = yol.split('?', 1)[0]
+        if yol == '/skor':
+            if yontem != 'POST':
+                return 405, {'hata': "/skor yalnızca POST kabul eder"}
+            try:
+                return 200, await self._skor(govde)
+            except IstekHatasi as e:
+                self.yigin.hatali_istek += 1
+                return 400, {'hata': str(e)}
+        if yol == '/durum':
+            if yontem != 'GET':
+                return 405, {'hata': "/durum yalnızca GET kabul eder"}
+            return 200, self.durum()
+        return 404, {'hata': f"bilinmeyen yol: {yol}"}
+
+    async def _baglanti(self, reader, writer):
+        """Bir bağlantıdaki istekleri sırayla yanıtlar (keep-alive)"""
+        try:
+            while True:
+                try:
+                    mesaj = await _http_oku(reader)
+                except (IstekHatasi, ValueError) as e:
+                    durum = 413 if isinstance(e, IstekHatasi) else 400
+                    writer.write(_http_yaniti(durum, {'hata': str(e)}, kapat=True))
+                    await writer.drain()
+                    break
+                if mesaj is None:
+                    break
+                ilk_satir, basliklar, govde = mesaj
+                if len(ilk_satir) != 3:
+                    writer.write(_http_yaniti(400, {'hata': "geçersiz istek satırı"}, kapat=True))
+                    await writer.drain()
+                    break
+                yontem, yol, surum = ilk_satir
+                kapat = (basliklar.get('connection', '').lower() == 'close'
+                         or surum == 'HTTP/1.0')
+                try:
+                    durum, yanit = await self._isle(yontem, yol, govde)
+                except Exception as e:
+                    durum, yanit = 500, {'hata': f"{type(e).__name__}: {e}"}
+                writer.write(_http_yaniti(durum, yanit, kapat))
+                await writer.drain()
+                if kapat:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+class SkorIstemcisi:
+    """Servise tek bir keep-alive bağlantı üzerinden istek gönderen asyncio istemcisi"""
+
+    def __init__(self, adres=VARSAYILAN_ADRES, port=VARSAYILAN_PORT, unix_yolu=None):
+        self.adres = adres
+        self.port = port
+        self.unix_yolu = unix_yolu
+        self._reader = self._writer = None
+
+    async def baglan(self):
+        if self.unix_yolu:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.unix_yolu)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.adres, self.port)
+        return self
+
+    async def kapat(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
+
+    async def istek(self, yontem, yol, govde=None):
+        """Ham istek; (HTTP durumu, çözülmüş JSON) döndürür"""
+        veri = b'' if govde is None else json.dumps(govde).encode('utf-8')
+        self._writer.write(
+            f"{yontem} {yol} HTTP/1.1\r\nHost: {self.adres}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(veri)}\r\n\r\n"
+            .encode('latin-1') + veri
+        )
+        await self._writer.drain()
+        mesaj = await _http_oku(self._reader)
+        if mesaj is None:
+            raise ConnectionError("servis bağlantıyı kapattı")
+        ilk_satir, _, yanit = mesaj
+        return int(ilk_satir[1]), json.loads(yanit)
+
+    async def skor(self, islem_sayisi, hata_orani, operator_id=None):
+        durum, yanit = await self.istek('POST', '/skor', {
+            'islem_sayisi': islem_sayisi, 'hata_orani': hata_orani, 'operator_id': operator_id,
+        })
+        if durum != 200:
+            raise RuntimeError(f"skor isteği başarısız ({durum}): {yanit.get('hata')}")
+        return yanit
+
+    async def durum(self):
+        return (await self.istek('GET', '/durum'))[1]
+
+
+async def yuk_testi(istek_sayisi=20_000, eszamanli=64, adres=VARSAYILAN_ADRES, port=VARSAYILAN_PORT,
+                    unix_yolu=None, tohum=0):
+    """
+    eszamanli sayıda bağlantıdan toplam istek_sayisi skor isteği gönderir.
+    İstemci tarafı gecikme yüzdelikleri, istek/s ve servisin /durum çıktısını
+    döndürür.
+    """
+    rng = np.random.default_rng(tohum)
+    islem = rng.integers(0, 51, istek_sayisi).tolist()
+    hata = np.round(rng.random(istek_sayisi), 3).tolist()
+    gecikmeler = np.empty(istek_sayisi)
+    sira = iter(range(istek_sayisi))
+
+    async def calisan():
+        istemci = await SkorIstemcisi(adres, port, unix_yolu).baglan()
+        try:
+            for i in sira:
+                bas = time.perf_counter()
+                await istemci.skor(islem[i], hata[i], f'Op-{i % 1000}')
+                gecikmeler[i] = time.perf_counter() - bas
+        finally:
+            await istemci.kapat()
+
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(calisan() for _ in range(max(1, min(eszamanli, istek_sayisi)))))
+    sure = time.perf_counter() - baslangic
+
+    istemci = await SkorIstemcisi(adres, port, unix_yolu).baglan()
+    try:
+        servis = await istemci.durum()
+    finally:
+        await istemci.kapat()
+
+    p50, p95, p99 = (np.percentile(gecikmeler, [50, 95, 99]) * 1e3).tolist()
+    return {
+        'istek_sayisi': istek_sayisi,
+        'eszamanli': eszamanli,
+        'sure_s': sure,
+        'saniyede': istek_sayisi / sure if sure > 0 else None,
+        'istemci_gecikme': {'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99,
+                            'maks_ms': float(gecikmeler.max() * 1e3)},
+        'servis': servis,
+    }
+
+
+async def _yerel_yuk_testi(args):
+    """Servisi aynı süreçte (boş bir portta) başlatıp yük testini ona karşı çalıştırır"""
+    servis = await SkorServisi(args.adres, 0, args.unix, args.pencere, args.yigin).baslat()
+    try:
+        return await yuk_testi(args.istek, args.eszamanli, servis.adres, servis.port, args.unix)
+    finally:
+        await servis.kapat()
+
+
+def _yuk_testi_yazdir(sonuc):
+    istemci, servis = sonuc['istemci_gecikme'], sonuc['servis']
+    print(f"{sonuc['istek_sayisi']:,} istek, {sonuc['eszamanli']} bağlantı: "
+          f"{sonuc['sure_s']:.2f} s ({sonuc['saniyede']:,.0f} istek/s)")
+    print(f"İstemci gecikmesi  p50 {istemci['p50_ms']:.2f} ms  p95 {istemci['p95_ms']:.2f} ms  "
+          f"p99 {istemci['p99_ms']:.2f} ms  maks {istemci['maks_ms']:.2f} ms")
+    gecikme = servis['gecikme']
+    if gecikme['ornek']:
+        print(f"Servis (kuyruk+skor) p50 {gecikme['p50_ms']:.2f} ms  p95 {gecikme['p95_ms']:.2f} ms  "
+              f"p99 {gecikme['p99_ms']:.2f} ms")
+    print(f"{servis['yigin_sayisi']:,} yığın, ortalama {servis['ortalama_yigin']:.1f} istek "
+          f"(en büyük {servis['en_buyuk_yigin']}), en yüksek kuyruk derinliği "
+          f"{servis['en_yuksek_kuyruk']}, skorlama {servis['skorlama_suresi_s']:.3f} s")
+
+
+async def _sun(args):
+    servis = await SkorServisi(args.adres, args.port, args.unix, args.pencere, args.yigin).baslat()
+    hedef = args.unix or f"http://{servis.adres}:{servis.port}"
+    print(f"✓ Skor servisi {hedef} adresinde (pencere {args.pencere} ms, en büyük yığın {args.yigin})")
+    try:
+        await servis.sonsuza_kadar()
+    finally:
+        await servis.kapat()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mikro yığınlı yerel fuzzy skor servisi ve yük testi")
+    parser.add_argument('--adres', default=VARSAYILAN_ADRES, help="dinlenecek/bağlanılacak adres")
+    parser.add_argument('--port', type=int, default=VARSAYILAN_PORT, help="TCP portu")
+    parser.add_argument('--unix', metavar='SOKET_YOLU', default=None, help="TCP yerine Unix soketi")
+    parser.add_argument('--pencere', type=float, default=MIKRO_PENCERE_MS,
+                        help="yığın toplama penceresi (ms)")
+    parser.add_argument('--yigin', type=int, default=EN_BUYUK_YIGIN, help="en büyük yığın boyutu")
+    parser.add_argument('--onbellek', action='store_true', help="fuzzy skor önbelleğini açar")
+    parser.add_argument('--yuk-testi', action='store_true',
+                        help="yük testi istemcisini çalıştırır (--hedef yoksa servis aynı süreçte başlatılır)")
+    parser.add_argument('--hedef', action='store_true',
+                        help="yük testini --adres/--port (veya --unix) üzerindeki çalışan servise yapar")
+    parser.add_argument('--istek', type=int, default=20_000, help="yük testindeki istek sayısı")
+    parser.add_argument('--eszamanli', type=int, default=64, help="yük testindeki bağlantı sayısı")
+    parser.add_argument('--profil', action='store_true', help="fuzzy aşama sürelerini sonunda yazdırır")
+    args = parser.parse_args()
+
+    if args.onbellek:
+        skor_onbellegini_ac()
+    if args.profil:
+        olcum.ac()
+    try:
+        if args.yuk_testi:
+            if args.hedef:
+                sonuc = asyncio.run(yuk_testi(args.istek, args.eszamanli, args.adres, args.port, args.unix))
+            else:
+                sonuc = asyncio.run(_yerel_yuk_testi(args))
+            _yuk_testi_yazdir(sonuc)
+        else:
+            asyncio.run(_sun(args))
+    except KeyboardInterrupt:
+        pass
+    if args.profil:
+        print()
+        print(olcum.rapor_metni())
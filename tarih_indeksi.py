@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+
+import olcum
+from analiz import tum_operatorleri_skorla
+from depo_veri import HareketOzeti, stok_bayraklari, tipli_veri_oku
+
+
+class TarihIndeksi:
+    """
+    Hareket tablosu üzerinde tarihe göre sorgu katmanı.
+
+    Tarih bir kez ayrıştırılır ve tablo güne göre sıralanır; bir tarih
+    aralığının satırları np.searchsorted ile (ikili arama) bulunur, tablo
+    yeniden taranmaz. ÇIKIŞ KG/ADET toplamları kümülatif dizilerden O(log n)
+    sürede, operatör sayıları ise yalnızca aralıktaki satırlar sayılarak
+    hesaplanır. Aralık sınırları (bas, son) gün olarak dahildir; None tüm
+    veriyi kapsar.
+
+    Hata oranı için yürüyen stok tüm tablo üzerinde bir kez hesaplanır;
+    bir pencerenin hata oranı, pencere öncesinden devreden stokla bulunan
+    satır bayraklarından sayılır (HareketVeritabani ile aynı kural: stok
+    pencere başında sıfırlanmaz).
+
+    Tarihi boş (NaT) satırlar sıralı tablonun sonunda tutulur ve gün
+    indeksine girmez: sınırsız sorgu (bas ve son None) onları da sayar,
+    sınırı olan hiçbir pencereye girmezler.
+    """
+
+    def __init__(self, df):
+        with olcum.bolum('tarih_indeksi'):
+            self._kur(df)
+
+    def _kur(self, df):
+        """Tabloyu güne göre sıralar ve kümülatif toplamları hazırlar"""
+        gun = df['Tarih'].to_numpy().astype('datetime64[D]')
+        # argsort NaT'leri (dosya sırasıyla) sona koyar; gün indeksi yalnızca tarihli satırlardır
+        sira = np.argsort(gun, kind='stable')
+        self.df = df.iloc[sira].reset_index(drop=True)
+        tarihli = len(gun) - int(np.isnat(gun).sum())
+        self.gunler = gun[sira][:tarihli].astype(np.int64)
+
+        # Satır bazında ÇIKIŞ miktarlarının kümülatif toplamları (başta 0)
+        tip = np.int64 if pd.api.types.is_integer_dtype(self.df['Miktar'].dtype) else np.float64
+        cikis = (self.df['Hareket_Turu'] == 'CIKIS').to_numpy()
+        miktar = self.df['Miktar'].to_numpy(dtype=tip, na_value=0)
+        birim = self.df['Birim']
+        self._kumulatif = {}
+        for ad in ('KG', 'ADET'):
+            secili = np.where(cikis & (birim == ad).to_numpy(), miktar, 0)
+            self._kumulatif[ad] = np.concatenate([np.zeros(1, dtype=tip), np.cumsum(secili)])
+
+        operatorler = self.df['Operator_ID'].astype('category')
+        self._operator_kodlari = operatorler.cat.codes.to_numpy()
+        self._operator_adlari = operatorler.cat.categories
+        # Stoku eksiye düşüren ÇIKIŞ satırları (tüm geçmişin yürüyen stokuyla)
+        self._cikis_satiri, self._eksi, _ = stok_bayraklari(self.df)
+        self._gunluk_tablo = None
+
+    @classmethod
+    def dosyadan(cls, dosya_yolu):
+        """CSV dosyasını (varsa önbellekten) tipli okuyup indeksler"""
+        return cls(tipli_veri_oku(dosya_yolu))
+
+    @property
+    def satir_sayisi(self):
+        return len(self.df)
+
+    @property
+    def ilk_gun(self):
+        return pd.Timestamp(self.gunler[0], unit='D') if len(self.gunler) else None
+
+    @property
+    def son_gun(self):
+        return pd.Timestamp(self.gunler[-1], unit='D') if len(self.gunler) else None
+
+    def aralik(self, bas=None, son=None):
+        """[bas, son] gün aralığının sıralı tablodaki satır dilimini (i, j) döndürür"""
+        if bas is None and son is None:
+            return 0, len(self.df)
+        i = 0 if bas is None else np.searchsorted(self.gunler, _gun(bas), side='left')
+        j = len(self.gunler) if son is None else np.searchsorted(self.gunler, _gun(son), side='right')
+        return int(i), int(max(i, j))
+
+    def son_gunler(self, n_gun, bitis=None):
+        """Bitiş günü dahil son n_gun günü kapsayan (bas, son) tarihlerini döndürür"""
+        bitis = self.son_gun if bitis is None else pd.Timestamp(bitis).normalize()
+        return bitis - pd.Timedelta(days=n_gun - 1), bitis
+
+    def gunluk_ozet(self, bas=None, son=None):
+        """Aralıktaki toplam ÇIKIŞ miktarlarını (KG, ADET) döndürür"""
+        i, j = self.aralik(bas, son)
+        return tuple(self._kumulatif[ad][j] - self._kumulatif[ad][i] for ad in ('KG', 'ADET'))
+
+    def operator_sayilari(self, bas=None, son=None):
+        """Aralıktaki operatör işlem sayılarını (yalnızca aralık satırlarını sayarak) döndürür"""
+        i, j = self.aralik(bas, son)
+        kodlar = self._operator_kodlari[i:j]
+        sayilar = np.bincount(kodlar[kodlar >= 0], minlength=len(self._operator_adlari))
+        seri = pd.Series(sayilar, index=self._operator_adlari.copy())
+        return seri[seri > 0]
+
+    def pencere_ozeti(self, bas=None, son=None):
+        """Aralığın tam özetini (HareketOzeti) döndürür; rapor ve analiz_et ile kullanılır"""
+        with olcum.bolum('filtreleme'):
+            i, j = self.aralik(bas, son)
+            pencere = self.df.iloc[i:j]
+        ozet = HareketOzeti()
+        with olcum.bolum('ozetleme'):
+            ozet.parca_ekle(pencere)
+            # Hata sayıları pencere öncesinden devreden stokla hesaplanmış bayraklardan
+            kodlar = self._operator_kodlari[i:j]
+            cikis = self._cikis_satiri[i:j] & (kodlar >= 0)
+            n_operator = len(self._operator_adlari)
+            cikis_sayilari = np.bincount(kodlar[cikis], minlength=n_operator)
+            hatali = np.bincount(kodlar[cikis & self._eksi[i:j]], minlength=n_operator)
+            cikan = cikis_sayilari > 0
+            ozet.cikis_sayilari = pd.Series(cikis_sayilari, index=self._operator_adlari.copy())[cikan]
+            ozet.hatali_cikislar = pd.Series(hatali, index=self._operator_adlari.copy())[cikan]
+        return ozet
+
+    def pencere_skorlari(self, bas=None, son=None, hata_oranlari=None):
+        """Aralıktaki işlem sayılarıyla tüm operatörleri puanlar (analiz.tum_operatorleri_skorla)"""
+        return tum_operatorleri_skorla(self.pencere_ozeti(bas, son), hata_oranlari)
+
+    def gunluk_tablo(self):
+        """
+        Gün başına ÇIKIŞ KG/ADET toplamı ve işlem sayısı (veri olmayan günler 0,
+        tarihsiz satırlar hariç). Bir kez hesaplanıp saklanır.
+        """
+        if self._gunluk_tablo is None:
+            if len(self.gunler) == 0:
+                return pd.DataFrame(columns=['KG', 'ADET', 'Islem_Sayisi'])
+            # Gün sınırları sıralı dizide ikili aramayla bulunur
+            gunler = np.arange(self.gunler[0], self.gunler[-1] + 1)
+            sinirlar = np.searchsorted(self.gunler, np.append(gunler, gunler[-1] + 1))
+            tablo = pd.DataFrame({
+                ad: np.diff(self._kumulatif[ad][sinirlar]) for ad in ('KG', 'ADET')
+            }, index=pd.DatetimeIndex(gunler.astype('datetime64[D]'), name='Tarih'))
+            tablo['Islem_Sayisi'] = np.diff(sinirlar)
+            self._gunluk_tablo = tablo
+        return self._gunluk_tablo
+
+    def kayan_toplamlar(self, n_gun):
+        """Her gün için o gün dahil son n_gun günün ÇIKIŞ toplamları ve işlem sayısı"""
+        tablo = self.gunluk_tablo()
+        return tablo.rolling(n_gun, min_periods=1).sum().astype(tablo.dtypes)
+
+
+def _gun(tarih):
+    """Tarihi, indeksteki gün numarasıyla karşılaştırılabilir tam sayıya çevirir"""
+    return np.datetime64(pd.Timestamp(tarih), 'D').astype(np.int64)
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analiz import KUCUK_PARCA_SINIRI, ArtimliAnaliz, analiz_et, tum_operatorleri_skorla
+from depo_veri import OZET_SUTUNLARI, tipleri_uygula
+
+
+@pytest.fixture(scope='module')
+def hareketler():
+    """
+    Tarih sırasıyla eklenen hareket kaydı. Op-1, Op-2, Op-5 ve Op-9 eşit
+    sayıda işlem yapar (liderlik tablosunda eşitlik kimlikle bozulur) ve ilk
+    satır Op-9'undur; eksik miktar, ürün ve operatör içeren satırlar da vardır.
+    """
+    rng = np.random.default_rng(11)
+    n = N
+    operatorler = rng.permutation(np.array(['Op-9', 'Op-5', 'Op-2', 'Op-1'] * 900 + ['Op-7'] * 400,
+                                           dtype=object))
+    operatorler[[0, int(np.flatnonzero(operatorler == 'Op-9')[0])]] = ['Op-9', operatorler[0]]
+    df = pd.DataFrame({
+        'Tarih': (pd.Timestamp('2024-01-01')
+                  + pd.to_timedelta(np.sort(rng.integers(0, 60, n)), unit='D')).strftime('%Y-%m-%d'),
+        'Hareket_Turu': rng.choice(['GIRIS', 'CIKIS'], n, p=[0.4, 0.6]),
+        'Urun_Kodu': rng.choice(['Urun-A', 'Urun-B', 'Urun-C'], n),
+        'Miktar': rng.integers(1, 40, n).astype(float),
+        'Birim': rng.choice(['KG', 'ADET'], n),
+        'Operator_ID': operatorler,
+    }, columns=OZET_SUTUNLARI)
+    df.loc[[5, 1500], 'Miktar'] = np.nan
+    df.loc[[9, 2500], 'Urun_Kodu'] = None
+    df.loc[np.flatnonzero(operatorler == 'Op-7')[[3, -3]], 'Operator_ID'] = None
+    return tipleri_uygula(df)
+
+
+def _ekle(hareketler, sinirlar):
+    artimli = ArtimliAnaliz()
+    for bas, son in zip(sinirlar[:-1], sinirlar[1:]):
+        artimli.satir_ekle(hareketler.iloc[bas:son].reset_index(drop=True))
+    return artimli
+
+
+def _sinirlar(n, *boyutlar):
+    """Sırayla verilen boyutlarda (sonuncusu tekrarlanarak) parça sınırlarını üretir"""
+    sinirlar = [0]
+    for boyut in boyutlar[:-1]:
+        sinirlar.append(sinirlar[-1] + boyut)
+    sinirlar += list(range(sinirlar[-1] + boyutlar[-1], n, boyutlar[-1])) + [n]
+    return sinirlar
+
+
+N = 4 * KUCUK_PARCA_SINIRI
+
+
+@pytest.mark.parametrize('sinirlar', [
+    pytest.param(_sinirlar(N, 37), id='kucuk'),
+    pytest.param(_sinirlar(N, KUCUK_PARCA_SINIRI + 200, 1800, KUCUK_PARCA_SINIRI), id='buyuk'),
+    pytest.param(_sinirlar(N, *[7] * 40, KUCUK_PARCA_SINIRI + 1), id='karisik'),
+])
+def test_artimli_sonuc_tam_hesapla_ayni(hareketler, sinirlar):
+    artimli = _ekle(hareketler, sinirlar)
+    artimli_sonuc, tam = analiz_et(artimli), analiz_et(hareketler)
+
+    assert artimli_sonuc.satir_sayisi == tam.satir_sayisi
+    assert (artimli_sonuc.kg_toplam, artimli_sonuc.adet_toplam) == (tam.kg_toplam, tam.adet_toplam)
+    assert (artimli_sonuc.tarih_min, artimli_sonuc.tarih_max) == (tam.tarih_min, tam.tarih_max)
+    pd.testing.assert_series_equal(artimli_sonuc.operator_sayilari, tam.operator_sayilari,
+                                   check_names=False, check_index_type=False)
+    pd.testing.assert_series_equal(artimli_sonuc.hata_oranlari, tam.hata_oranlari,
+                                   check_names=False, check_index_type=False)
+    pd.testing.assert_frame_equal(artimli_sonuc.urun_siralamasi, tam.urun_siralamasi,
+                                  check_names=False, check_index_type=False, check_dtype=False)
+
+    pd.testing.assert_frame_equal(tum_operatorleri_skorla(artimli), tum_operatorleri_skorla(hareketler),
+                                  check_index_type=False)
+
+
+def test_liderlik_esitligi_kimlikle_bozulur(hareketler):
+    tam = analiz_et(hareketler, n=4)
+    assert list(tam.en_verimli.index) == ['Op-1', 'Op-2', 'Op-5', 'Op-9']
+    assert tam.en_verimli.nunique() == 1
+
+    # Op-9 önce gelir ve eşitlikte yerini küçük kimliklere bırakmalıdır
+    for sinirlar in (_sinirlar(N, 3, 3, 3, 3, N), _sinirlar(N, 5)):
+        artimli = _ekle(hareketler, sinirlar)
+        for n in (1, 3, 4, 6):
+            pd.testing.assert_series_equal(artimli.verimlilik_raporu(n),
+                                           analiz_et(hareketler, n=n).en_verimli,
+                                           check_names=False, check_index_type=False)
@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+
+from depo_veri import OZET_SUTUNLARI, akis_ozeti_oku
+from depo_veritabani import HareketVeritabani
+
+HAREKETLER = [
+    ('2024-01-01', 'GIRIS', 'Urun-A', 100, 'KG', 'Op-1'),
+    ('2024-01-01', 'CIKIS', 'Urun-A', 40, 'KG', 'Op-2'),
+    ('2024-01-02', 'GIRIS', 'Urun-B', 12, 'ADET', 'Op-1'),
+    ('2024-01-02', 'CIKIS', 'Urun-B', 15, 'ADET', 'Op-2'),
+    ('2024-01-03', 'CIKIS', 'Urun-A', 30, 'KG', 'Op-1'),
+]
+
+
+def _ozetler(tmp_path, hareketler):
+    csv = tmp_path / 'hareketler.csv'
+    pd.DataFrame(hareketler, columns=OZET_SUTUNLARI).to_csv(csv, index=False)
+    with HareketVeritabani(str(tmp_path / 'depo.sqlite')) as db:
+        db.ice_aktar(str(csv))
+        return db.ozet(), akis_ozeti_oku(str(csv), onbellek=False)
+
+
+@pytest.mark.parametrize('kesirli', [False, True])
+def test_veritabani_ozeti_akis_ozetiyle_ayni(tmp_path, kesirli):
+    hareketler = list(HAREKETLER)
+    if kesirli:
+        # 50.5 KG: miktar toplamları float64 kalmalı, int64'e zorlanmamalı
+        hareketler[1] = hareketler[1][:3] + (50.5,) + hareketler[1][4:]
+    veritabani, akis = _ozetler(tmp_path, hareketler)
+    beklenen_tip = 'float64' if kesirli else 'int64'
+
+    assert veritabani.cikis_toplamlari.dtype == beklenen_tip
+    assert veritabani.urun_ozeti['Miktar'].dtype == beklenen_tip
+    assert veritabani.gunluk_ozet() == akis.gunluk_ozet()
+    pd.testing.assert_series_equal(veritabani.cikis_toplamlari, akis.cikis_toplamlari,
+                                   check_names=False, check_index_type=False)
+    pd.testing.assert_frame_equal(veritabani.urun_ozeti, akis.urun_ozeti,
+                                  check_names=False, check_index_type=False)
+    pd.testing.assert_series_equal(veritabani.hata_oranlari(), akis.hata_oranlari(),
+                                   check_names=False, check_index_type=False)
+
+
+def test_tarihsiz_satirlar_toplamlarda_kalir(tmp_path):
+    # Tarihi boş ÇIKIŞ: tüm geçmiş toplamlarına girer, tarih aralıklarına girmez
+    hareketler = list(HAREKETLER) + [(None, 'CIKIS', 'Urun-A', 25, 'KG', 'Op-2')]
+    veritabani, akis = _ozetler(tmp_path, hareketler)
+
+    assert veritabani.satir_sayisi == akis.satir_sayisi == len(hareketler)
+    assert veritabani.gunluk_ozet() == akis.gunluk_ozet()
+    pd.testing.assert_series_equal(veritabani.operator_sayilari, akis.operator_sayilari,
+                                   check_names=False, check_index_type=False)
+    pd.testing.assert_frame_equal(veritabani.urun_ozeti, akis.urun_ozeti,
+                                  check_names=False, check_index_type=False)
+    pd.testing.assert_series_equal(veritabani.hata_oranlari(), akis.hata_oranlari(),
+                                   check_names=False, check_index_type=False)
+    assert veritabani.ilk_satirlar['Tarih'].isna().sum() == 0  # ilk 5 satır tarihli
+
+    with HareketVeritabani(str(tmp_path / 'depo.sqlite')) as db:
+        satirlar = db.operator_hareketleri('Op-2')
+        assert len(satirlar) == 3 and satirlar['Tarih'].isna().sum() == 1
+        for bas, son in [('2024-01-01', '2024-01-03'), (None, '2024-01-03'), ('2024-01-01', None)]:
+            aralik = db.ozet(bas, son)
+            assert aralik.satir_sayisi == len(HAREKETLER)
+            assert aralik.gunluk_ozet() == (70, 15)
+            assert aralik.operator_sayilari.to_dict() == {'Op-1': 3, 'Op-2': 2}
+
+
+def test_salt_okunur_acilis_dosyayi_degistirmez(tmp_path):
+    veritabani, _ = _ozetler(tmp_path, HAREKETLER)
+    yol = tmp_path / 'depo.sqlite'
+    icerik = yol.read_bytes()
+    with HareketVeritabani(str(yol), salt_okunur=True) as db:
+        ozet = db.ozet()
+    # Özet bağlantı kapandıktan sonra da kullanılabilir
+    assert ozet.operator_ozeti('Op-2') == veritabani.operator_ozeti('Op-2')
+    assert ozet.gunluk_ozet() == veritabani.gunluk_ozet()
+    assert yol.read_bytes() == icerik
+
+
+def test_salt_okunur_baska_veritabanini_reddeder(tmp_path):
+    import sqlite3
+    yol = tmp_path / 'baska.db'
+    baglanti = sqlite3.connect(yol)
+    baglanti.execute('CREATE TABLE notlar (metin TEXT)')
+    baglanti.commit()
+    baglanti.close()
+    icerik = yol.read_bytes()
+    with pytest.raises(ValueError, match='hareket veritabanı değil'):
+        HareketVeritabani(str(yol), salt_okunur=True)
+    assert yol.read_bytes() == icerik
+
+    metin = tmp_path / 'metin.db'
+    metin.write_text('sqlite değil')
+    with pytest.raises(ValueError, match='SQLite veritabanı değil'):
+        HareketVeritabani(str(metin), salt_okunur=True)
+    with pytest.raises(FileNotFoundError):
+        HareketVeritabani(str(tmp_path / 'yok.db'), salt_okunur=True)
+    assert not (tmp_path / 'yok.db').exists()
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from fuzzy_system import FuzzyDegerlendirici, varsayilan_degerlendirici
+
+# scikit-fuzzy 0.5.0 ile (yerleşik motordan önceki skfuzzy.control
+# uygulaması) hesaplanmış referans skorlar. Noktalar üyelik fonksiyonlarının
+# kırılma noktalarını, evren sınırlarını (0, 50 / 0, 1) ve evren dışındaki
+# 100 işlem sayısını kapsar (anahtarlar işlem sayısı, listeler HATA_NOKTALARI sırasıyla).
+HATA_NOKTALARI = [0.0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 1.0]
+REFERANS_SKORLAR = {
+    0: [50.0, 48.4946236559, 43.8095238095, 13.3333333333, 13.3333333333, 13.3333333333, 13.3333333333, 13.3333333333, 13.3333333333],
+    4: [50.9659863946, 49.4606938955, 44.7719298246, 13.7777777778, 13.7777777778, 13.7777777778, 13.7777777778, 13.3333333333, 13.3333333333],
+    10: [56.1904761905, 54.6913580247, 50.0, 15.5555555556, 15.5555555556, 15.5555555556, 15.5555555556, 13.3333333333, 13.3333333333],
+    18: [75.8655462185, 74.7124907613, 71.219858156, 44.0920810313, 44.2951985774, 44.0920810313, 15.5555555556, 13.3333333333, 13.3333333333],
+    20: [86.6666666667, 86.0, 84.4444444444, 50.0, 50.0, 50.0, 15.5555555556, 13.3333333333, 13.3333333333],
+    25: [86.6666666667, 86.0, 84.4444444444, 50.0, 50.0, 50.0, 15.5555555556, 13.3333333333, 13.3333333333],
+    30: [86.6666666667, 86.0, 84.4444444444, 50.0, 50.0, 50.0, 15.5555555556, 13.3333333333, 13.3333333333],
+    40: [86.6666666667, 86.0, 84.4444444444, 0.0, 0.0, 0.0, 15.5555555556, 13.3333333333, 13.3333333333],
+    50: [86.6666666667, 86.0, 84.4444444444, 0.0, 0.0, 0.0, 15.5555555556, 13.3333333333, 13.3333333333],
+    100: [86.6666666667, 86.0, 84.4444444444, 0.0, 0.0, 0.0, 15.5555555556, 13.3333333333, 13.3333333333],
+}
+
+TOLERANS = 1e-9
+
+
+def _noktalar():
+    for islem, skorlar in REFERANS_SKORLAR.items():
+        for hata, skor in zip(HATA_NOKTALARI, skorlar):
+            yield islem, hata, skor
+
+
+@pytest.fixture(scope='module')
+def degerlendirici():
+    return varsayilan_degerlendirici()
+
+
+@pytest.mark.parametrize('islem, hata, beklenen', list(_noktalar()))
+def test_tekil_skor_referansla_ayni(degerlendirici, islem, hata, beklenen):
+    sonuc = degerlendirici.degerlendir(islem, hata, 'Op-101')
+    assert sonuc['performans'] == pytest.approx(beklenen, abs=TOLERANS)
+
+
+def test_toplu_skorlar_referansla_ayni(degerlendirici):
+    islem, hata, beklenen = map(np.array, zip(*_noktalar()))
+    toplu = degerlendirici.toplu_degerlendir(islem, hata)
+    np.testing.assert_allclose(toplu['performans'], beklenen, rtol=0, atol=TOLERANS)
+    np.testing.assert_allclose(degerlendirici.toplu_skorlar(islem, hata), beklenen, rtol=0, atol=TOLERANS)
+
+
+def test_kategoriler_tekil_ve_toplu_ayni(degerlendirici):
+    islem, hata, _ = map(np.array, zip(*_noktalar()))
+    toplu = degerlendirici.toplu_degerlendir(islem, hata)['kategori']
+    tekil = [degerlendirici.degerlendir(i, h, 'Op-101')['kategori'] for i, h in zip(islem, hata)]
+    assert list(toplu) == tekil
+
+
+def test_kural_dosyasindan_kurulan_motor_ayni_sonucu_verir():
+    yeni = FuzzyDegerlendirici()
+    for islem, hata, beklenen in _noktalar():
+        assert yeni.skor_hesapla(islem, hata) == pytest.approx(beklenen, abs=TOLERANS)
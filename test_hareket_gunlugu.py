@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+
+from depo_veri import OZET_SUTUNLARI, akis_ozeti_oku
+from hareket_gunlugu import HareketGunlugu, csv_den_donustur
+
+# Dosya sırası tarih sırası değil; eksik miktar, operatör, ürün ve tarih içerir
+HAREKETLER = [
+    ('2024-01-01', 'GIRIS', 'Urun-A', 10, 'KG', 'Op-1'),
+    ('2024-01-01', 'CIKIS', 'Urun-A', 4, 'KG', 'Op-1'),
+    ('2024-01-02', 'CIKIS', 'Urun-B', 1, 'ADET', 'Op-1'),
+    ('2024-01-03', 'GIRIS', 'Urun-A', 5, 'KG', 'Op-3'),
+    ('2024-01-02', 'CIKIS', 'Urun-A', 8, 'KG', 'Op-2'),
+    ('2024-01-03', 'CIKIS', 'Urun-A', None, 'KG', 'Op-2'),
+    ('2024-01-04', 'CIKIS', 'Urun-B', 2, 'ADET', None),
+    ('2024-01-04', 'CIKIS', None, 3, 'ADET', 'Op-2'),
+    (None, 'GIRIS', 'Urun-C', 7, 'ADET', 'Op-3'),
+    ('2024-01-05', 'CIKIS', 'Urun-C', 9, None, 'Op-1'),
+]
+
+
+def _ozetler(tmp_path, hareketler, parca_boyutu):
+    csv = tmp_path / 'hareketler.csv'
+    pd.DataFrame(hareketler, columns=OZET_SUTUNLARI).to_csv(csv, index=False)
+    gunluk = str(tmp_path / 'hareketler.hgl')
+    csv_den_donustur(str(csv), gunluk)
+    return (HareketGunlugu(gunluk).ozet(parca_boyutu),
+            akis_ozeti_oku(str(csv), parca_boyutu=parca_boyutu, onbellek=False))
+
+
+@pytest.mark.parametrize('eksik_miktar', [False, True])
+@pytest.mark.parametrize('parca_boyutu', [3, 100])
+def test_gunluk_ozeti_csv_ozetiyle_ayni(tmp_path, parca_boyutu, eksik_miktar):
+    hareketler = HAREKETLER if eksik_miktar else [h for h in HAREKETLER if h[3] is not None]
+    gunluk, csv = _ozetler(tmp_path, hareketler, parca_boyutu)
+
+    assert gunluk.satir_sayisi == csv.satir_sayisi
+    assert (gunluk.tarih_min, gunluk.tarih_max) == (csv.tarih_min, csv.tarih_max)
+    for alan in ('cikis_toplamlari', 'operator_sayilari', 'stok', 'cikis_sayilari', 'hatali_cikislar'):
+        pd.testing.assert_series_equal(getattr(gunluk, alan), getattr(csv, alan), obj=alan)
+    pd.testing.assert_frame_equal(gunluk.urun_ozeti, csv.urun_ozeti)
+    pd.testing.assert_series_equal(gunluk.hata_oranlari(), csv.hata_oranlari())
+    # Günlükte kategoriler tüm sözlüktür, CSV'de ilk parçanınkiler
+    pd.testing.assert_frame_equal(gunluk.ilk_satirlar, csv.ilk_satirlar, check_categorical=False, check_dtype=False)
+
+
+def test_bos_gunluk_ozeti(tmp_path):
+    gunluk = HareketGunlugu(str(tmp_path / 'bos.hgl'))
+    gunluk.olustur()
+    ozet = gunluk.ozet()
+    assert ozet.satir_sayisi == 0
+    assert ozet.tarih_min is None and ozet.ilk_satirlar is None
+    assert ozet.gunluk_ozet() == (0, 0)
+
+
+def test_kesirli_miktar_acik_hatayla_reddedilir(tmp_path):
+    hareketler = list(HAREKETLER[:3])
+    hareketler[1] = hareketler[1][:3] + (50.5,) + hareketler[1][4:]
+    csv = tmp_path / 'kesirli.csv'
+    pd.DataFrame(hareketler, columns=OZET_SUTUNLARI).to_csv(csv, index=False)
+    with pytest.raises(ValueError, match=r'yalnızca tam sayı miktar.*50\.5.*--db'):
+        csv_den_donustur(str(csv), str(tmp_path / 'kesirli.hgl'))
@@ -0,0 +1,102 @@
+import copy
+import json
+
+import numpy as np
+import pytest
+
+from fuzzy_system import VARSAYILAN_KURAL_DOSYASI, FuzzyDegerlendirici, KuralTabani, varsayilan_degerlendirici
+
+
+@pytest.fixture(scope='module')
+def tanim():
+    with open(VARSAYILAN_KURAL_DOSYASI, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _degistir(tanim, degisiklik):
+    yeni = copy.deepcopy(tanim)
+    degisiklik(yeni)
+    return yeni
+
+
+@pytest.mark.parametrize('degisiklik, mesaj', [
+    pytest.param(lambda t: t['degiskenler'].pop('hata_orani'),
+                 "'hata_orani' değişkeni tanımlı değil", id='eksik-girdi'),
+    pytest.param(lambda t: t['degiskenler'].pop('performans'),
+                 "'performans' değişkeni tanımlı değil", id='eksik-cikti'),
+    pytest.param(lambda t: t['kurallar'][1]['kosullar'].append(['hata_orani', 'cok_yuksek']),
+                 "Kural 2: tanımsız terim 'hata_orani.cok_yuksek'", id='tanimsiz-terim'),
+    pytest.param(lambda t: t['kurallar'][0]['kosullar'].append(['stok', 'dusuk']),
+                 "Kural 1: tanımsız terim 'stok.dusuk'", id='tanimsiz-degisken'),
+    pytest.param(lambda t: t['kurallar'][2].update(sonuc='mukemmel'),
+                 "Kural 3: tanımsız sonuç terimi 'mukemmel'", id='tanimsiz-sonuc'),
+    pytest.param(lambda t: t['kurallar'][0].update(operator='xor'),
+                 "Kural 1: bilinmeyen operatör 'xor'", id='bilinmeyen-operator'),
+    pytest.param(lambda t: t['kurallar'][3].update(kosullar=[]),
+                 'Kural 4: en az bir koşul gerekli', id='kosulsuz-kural'),
+    pytest.param(lambda t: t['kurallar'][1].update(agirlik=1.5),
+                 r'Kural 2: ağırlık 0 ile 1 arasında bir sayı olmalı \(1\.5\)', id='agirlik-buyuk'),
+    pytest.param(lambda t: t['kurallar'][1].update(agirlik=-0.1),
+                 'Kural 2: ağırlık 0 ile 1 arasında', id='agirlik-negatif'),
+    pytest.param(lambda t: t['kurallar'][0].update(agirlik='0.5'),
+                 "Kural 1: ağırlık 0 ile 1 arasında bir sayı olmalı \\('0.5'\\)", id='agirlik-metin'),
+    pytest.param(lambda t: t['kurallar'][0].update(agirlik=True),
+                 'Kural 1: ağırlık', id='agirlik-bool'),
+    pytest.param(lambda t: t['kurallar'][0].update(agirlik=float('nan')),
+                 'Kural 1: ağırlık', id='agirlik-nan'),
+    pytest.param(lambda t: t.update(kurallar=[]),
+                 'Kural tabanında hiç kural yok', id='bos-kural-listesi'),
+    pytest.param(lambda t: t.pop('kurallar'),
+                 'Kural tabanında hiç kural yok', id='kural-listesi-yok'),
+])
+def test_gecersiz_tanim_reddedilir(tanim, degisiklik, mesaj):
+    with pytest.raises(ValueError, match=mesaj):
+        KuralTabani(_degistir(tanim, degisiklik))
+
+
+def test_gecersiz_dosya_reddedilir(tanim, tmp_path):
+    yol = tmp_path / 'kurallar.json'
+    yol.write_text(json.dumps(_degistir(tanim, lambda t: t.update(kurallar=[]))), encoding='utf-8')
+    with pytest.raises(ValueError, match='hiç kural yok'):
+        KuralTabani.dosyadan(str(yol))
+
+
+def _izgara():
+    islem, hata = np.meshgrid(np.arange(0, 51, 2.5), np.linspace(0, 1, 41), indexing='ij')
+    return islem.ravel(), hata.ravel()
+
+
+def test_birim_agirlik_skorlari_degistirmez(tanim):
+    def bir(t):
+        for kural in t['kurallar']:
+            kural['agirlik'] = 1
+    degerlendirici = FuzzyDegerlendirici(KuralTabani(_degistir(tanim, bir)))
+    assert degerlendirici.kural_tabani.agirliklar is None
+    islem, hata = _izgara()
+    np.testing.assert_array_equal(degerlendirici.toplu_skorlar(islem, hata),
+                                  varsayilan_degerlendirici().toplu_skorlar(islem, hata))
+
+
+def test_agirlik_aktivasyonu_olcekler(tanim):
+    agirlikli = FuzzyDegerlendirici(KuralTabani(
+        _degistir(tanim, lambda t: t['kurallar'][3].update(agirlik=0.25))))
+    islem, hata = _izgara()
+    toplu = agirlikli.toplu_degerlendir(islem, hata)
+    ham = varsayilan_degerlendirici().toplu_degerlendir(islem, hata)
+    np.testing.assert_allclose(toplu['kural_aktivasyonlari']['kural4'],
+                               ham['kural_aktivasyonlari']['kural4'] * 0.25)
+    np.testing.assert_array_equal(toplu['kural_aktivasyonlari']['kural1'],
+                                  ham['kural_aktivasyonlari']['kural1'])
+    assert np.any(toplu['performans'] != ham['performans'])
+
+    # Tekil ve toplu motor aynı ağırlıklı planı kullanır
+    for i in range(0, len(islem), 37):
+        sonuc = agirlikli.degerlendir(islem[i], hata[i], 'Op-1')
+        assert sonuc['performans'] == pytest.approx(toplu['performans'][i], abs=1e-9)
+        assert sonuc['debug']['kural_aktivasyonlari']['kural4'] == pytest.approx(
+            toplu['kural_aktivasyonlari']['kural4'][i])
+
+    # Sıfır ağırlık kuralı devre dışı bırakır
+    sifir = FuzzyDegerlendirici(KuralTabani(_degistir(tanim, lambda t: t['kurallar'][3].update(agirlik=0))))
+    cikarilmis = FuzzyDegerlendirici(KuralTabani(_degistir(tanim, lambda t: t['kurallar'].pop(3))))
+    np.testing.assert_allclose(sifir.toplu_skorlar(islem, hata), cikarilmis.toplu_skorlar(islem, hata))
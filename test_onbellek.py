@@ -0,0 +1,138 @@
+import os
+
+import pandas as pd
+import pytest
+
+import depo_veri
+from depo_veri import (ONBELLEK_KLASORU, OZET_SUTUNLARI, akis_ozeti_oku, onbellek_gecerli,
+                       onbellekten_oku, tipli_veri_oku)
+
+SATIRLAR = [
+    ('2024-01-01', 'GIRIS', 'Urun-A', 100, 'KG', 'Op-101'),
+    ('2024-01-01', 'CIKIS', 'Urun-A', 40, 'KG', 'Op-102'),
+    ('2024-01-02', 'GIRIS', 'Urun-B', 12, 'ADET', 'Op-101'),
+    ('2024-01-02', 'CIKIS', 'Urun-B', 15, 'ADET', 'Op-103'),
+    ('2024-01-03', 'CIKIS', 'Urun-A', 30, 'KG', 'Op-102'),
+]
+
+
+def _csv_yaz(yol, satirlar=SATIRLAR, **ek_sutunlar):
+    df = pd.DataFrame(satirlar, columns=OZET_SUTUNLARI)
+    for sutun, degerler in ek_sutunlar.items():
+        df[sutun] = degerler
+    df.to_csv(yol, index=False)
+    return str(yol)
+
+
+def _onbellek_klasorleri(klasor):
+    yol = klasor / ONBELLEK_KLASORU
+    return sorted(os.listdir(yol)) if yol.exists() else []
+
+
+@pytest.fixture
+def csv_yolu(tmp_path):
+    return _csv_yaz(tmp_path / 'hareketler.csv')
+
+
+def test_ilk_okuma_onbellegi_yazar_ikinci_okuma_ayni_tabloyu_verir(csv_yolu):
+    assert not onbellek_gecerli(csv_yolu)
+    csvden = tipli_veri_oku(csv_yolu)
+    assert onbellek_gecerli(csv_yolu, tum_sutunlar=True)
+
+    onbellekten = onbellekten_oku(csv_yolu)
+    pd.testing.assert_frame_equal(onbellekten, csvden)
+    pd.testing.assert_frame_equal(tipli_veri_oku(csv_yolu, mmap=True), csvden)
+
+
+def test_akis_ozeti_onbellekten_ayni(csv_yolu):
+    csvden = akis_ozeti_oku(csv_yolu, parca_boyutu=2)
+    assert onbellek_gecerli(csv_yolu)
+    onbellekten = akis_ozeti_oku(csv_yolu, parca_boyutu=2)
+    assert onbellekten.satir_sayisi == csvden.satir_sayisi
+    assert onbellekten.gunluk_ozet() == csvden.gunluk_ozet()
+    pd.testing.assert_series_equal(onbellekten.operator_sayilari, csvden.operator_sayilari)
+    pd.testing.assert_series_equal(onbellekten.hata_oranlari(), csvden.hata_oranlari())
+    pd.testing.assert_frame_equal(onbellekten.urun_ozeti, csvden.urun_ozeti)
+
+
+def test_boyut_degisince_onbellek_gecersiz(csv_yolu):
+    tipli_veri_oku(csv_yolu)
+    _csv_yaz(csv_yolu, SATIRLAR + [('2024-01-04', 'GIRIS', 'Urun-C', 7, 'ADET', 'Op-104')])
+    assert not onbellek_gecerli(csv_yolu)
+    df = tipli_veri_oku(csv_yolu)
+    assert len(df) == len(SATIRLAR) + 1
+    assert 'Urun-C' in df['Urun_Kodu'].cat.categories
+    assert onbellek_gecerli(csv_yolu)
+
+
+def test_degisim_zamani_degisince_onbellek_gecersiz(csv_yolu):
+    tipli_veri_oku(csv_yolu)
+    # Aynı boyutta, farklı içerik: yalnızca değişiklik zamanı ayırt eder
+    satirlar = [SATIRLAR[0][:3] + (900,) + SATIRLAR[0][4:]] + SATIRLAR[1:]
+    durum = os.stat(csv_yolu)
+    _csv_yaz(csv_yolu, satirlar)
+    os.utime(csv_yolu, ns=(durum.st_atime_ns, durum.st_mtime_ns + 1_000_000_000))
+    assert os.path.getsize(csv_yolu) == durum.st_size
+    assert not onbellek_gecerli(csv_yolu)
+    assert tipli_veri_oku(csv_yolu)['Miktar'].iloc[0] == 900
+
+
+def test_ek_metin_sutunu_okumayi_bozmaz(tmp_path):
+    yol = _csv_yaz(tmp_path / 'ekli.csv', Aciklama=['not 1', None, 'a, b', 'not 4', 'not 5'])
+    beklenen = pd.read_csv(yol)
+
+    ilk = tipli_veri_oku(yol)
+    ikinci = tipli_veri_oku(yol)
+    assert list(ilk.columns) == list(beklenen.columns)
+    pd.testing.assert_frame_equal(ikinci, ilk)
+    pd.testing.assert_series_equal(ilk['Aciklama'], beklenen['Aciklama'])
+
+    # Önbellek yalnızca şema sütunlarını tutar; akış özeti onu kullanabilir, tam okuma kullanmaz
+    assert onbellek_gecerli(yol)
+    assert not onbellek_gecerli(yol, tum_sutunlar=True)
+    assert onbellekten_oku(yol) is None
+    assert akis_ozeti_oku(yol).satir_sayisi == len(SATIRLAR)
+
+
+def test_akis_yazdigi_onbellek_tam_okumada_ek_sutunlari_kaybetmez(tmp_path):
+    yol = _csv_yaz(tmp_path / 'ekli.csv', Aciklama=['a', 'b', 'c', 'd', 'e'])
+    akis_ozeti_oku(yol)
+    assert list(tipli_veri_oku(yol).columns) == OZET_SUTUNLARI + ['Aciklama']
+
+
+def test_yazma_hatasi_okumayi_bozmaz_ve_yarim_onbellek_kalmaz(csv_yolu, tmp_path, monkeypatch):
+    def bozuk_yaz(self, df):
+        raise ValueError("yazılamadı")
+
+    monkeypatch.setattr(depo_veri.OnbellekYazici, 'parca_yaz', bozuk_yaz)
+    df = tipli_veri_oku(csv_yolu)
+    assert len(df) == len(SATIRLAR)
+    assert akis_ozeti_oku(csv_yolu, parca_boyutu=2).satir_sayisi == len(SATIRLAR)
+    assert not onbellek_gecerli(csv_yolu)
+    assert _onbellek_klasorleri(tmp_path) == []
+
+
+def test_iptal_edilen_akis_yarim_onbellek_birakmaz(csv_yolu, tmp_path):
+    def iptal(oran):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        akis_ozeti_oku(csv_yolu, parca_boyutu=2, ilerleme=iptal)
+    assert not onbellek_gecerli(csv_yolu)
+    assert _onbellek_klasorleri(tmp_path) == []
+
+
+def test_eszamanli_yazicilar_ayri_gecici_klasor_kullanir(csv_yolu, tmp_path):
+    df = tipli_veri_oku(csv_yolu, onbellek=False)
+    birinci = depo_veri.OnbellekYazici(csv_yolu)
+    ikinci = depo_veri.OnbellekYazici(csv_yolu)
+    assert birinci.gecici != ikinci.gecici
+    assert os.path.dirname(birinci.gecici) == os.path.dirname(birinci.hedef)
+
+    birinci.parca_yaz(df)
+    ikinci.parca_yaz(df)
+    birinci.iptal()
+    ikinci.bitir()
+    assert not os.path.exists(birinci.gecici) and not os.path.exists(ikinci.gecici)
+    assert _onbellek_klasorleri(tmp_path) == [os.path.basename(ikinci.hedef)]
+    pd.testing.assert_frame_equal(onbellekten_oku(csv_yolu), df)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from fuzzy_system import TOPLU_PARCA_BOYUTU, ParalelSkorlayici, paralel_skorla, varsayilan_degerlendirici
+
+
+@pytest.fixture(scope='module')
+def skorlayici():
+    with ParalelSkorlayici(2) as skorlayici:
+        yield skorlayici
+
+
+def _girdiler(n, tohum=0):
+    rng = np.random.default_rng(tohum)
+    return rng.integers(0, 60, n).astype(float), rng.uniform(0, 1, n)
+
+
+# Büyükten küçüğe: sonraki çağrılar önceki bloğu yeniden kullanır, eski veri sızmamalı
+@pytest.mark.parametrize('n', [
+    3 * TOPLU_PARCA_BOYUTU * 4 + 17,   # dilimlere tam bölünmez
+    TOPLU_PARCA_BOYUTU + 1,
+    TOPLU_PARCA_BOYUTU,
+    5,
+    1,
+    0,
+])
+def test_paralel_toplu_skorlarla_ayni(skorlayici, n):
+    islem, hata = _girdiler(n, tohum=n)
+    beklenen = varsayilan_degerlendirici().toplu_skorlar(islem, hata)
+    sonuc = skorlayici.skorla(islem, hata)
+    assert sonuc.shape == (n,)
+    np.testing.assert_array_equal(sonuc, beklenen)
+
+
+@pytest.mark.parametrize('n', [0, 1, 17, TOPLU_PARCA_BOYUTU - 1, 10 * TOPLU_PARCA_BOYUTU + 3])
+def test_dilimler_araligi_parca_katlariyla_kaplar(skorlayici, n):
+    dilimler = skorlayici._dilimler(n)
+    sinirlar = [0] + [son for _, son in dilimler]
+    assert [bas for bas, _ in dilimler] == sinirlar[:-1]
+    assert sinirlar[-1] == n
+    assert all(bas % TOPLU_PARCA_BOYUTU == 0 for bas, _ in dilimler)
+
+
+def test_paralel_skorla_tek_seferlik():
+    islem, hata = _girdiler(TOPLU_PARCA_BOYUTU + 7)
+    np.testing.assert_array_equal(paralel_skorla(islem, hata, isci_sayisi=2),
+                                  varsayilan_degerlendirici().toplu_skorlar(islem, hata))
+    with pytest.raises(ValueError):
+        paralel_skorla([1, 2], [0.1], isci_sayisi=1)
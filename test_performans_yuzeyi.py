@@ -0,0 +1,79 @@
+import json
+
+import numpy as np
+import pytest
+
+from fuzzy_system import (VARSAYILAN_KURAL_DOSYASI, FuzzyDegerlendirici, KuralTabani, PerformansYuzeyi,
+                          varsayilan_degerlendirici)
+
+
+@pytest.fixture(scope='module')
+def yuzey():
+    return PerformansYuzeyi.olustur()
+
+
+def _degisik_kurallar():
+    with open(VARSAYILAN_KURAL_DOSYASI, encoding='utf-8') as f:
+        tanim = json.load(f)
+    tanim['kurallar'][-1]['sonuc'] = 'orta'
+    return FuzzyDegerlendirici(KuralTabani(tanim))
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_kaydet_yukle_ayni_yuzey(yuzey, tmp_path, mmap):
+    yol = tmp_path / 'yuzey.npy'
+    yuzey.kaydet(yol)
+    yuklenen = PerformansYuzeyi.yukle(yol, mmap=mmap)
+
+    np.testing.assert_array_equal(yuklenen.tablo, yuzey.tablo)
+    assert (yuklenen.maks_hata, yuklenen.p99_hata) == (yuzey.maks_hata, yuzey.p99_hata)
+    rng = np.random.default_rng(1)
+    islem, hata = rng.uniform(-5, 55, 1000), rng.uniform(-0.1, 1.1, 1000)
+    np.testing.assert_array_equal(yuklenen.skor(islem, hata), yuzey.skor(islem, hata))
+
+    # Uzantısız yol da aynı dosya çiftini gösterir
+    assert PerformansYuzeyi.yukle(tmp_path / 'yuzey').tablo.shape == yuzey.tablo.shape
+
+
+def test_enterpolasyon_hatasi_sinirlari(yuzey):
+    tam = varsayilan_degerlendirici()
+    # Izgara düğümlerinde tablo tam motorun kendisidir
+    islem, hata = np.meshgrid(yuzey.islem_ekseni, yuzey.hata_ekseni, indexing='ij')
+    np.testing.assert_allclose(yuzey.skor(islem.ravel(), hata.ravel()),
+                               tam.toplu_skorlar(islem.ravel(), hata.ravel()), rtol=0, atol=1e-9)
+
+    # Ölçülen p99 sınırı bağımsız bir örneklemde de geçerlidir
+    rng = np.random.default_rng(99)
+    islem, hata = rng.uniform(0, 50, 50000), rng.uniform(0, 1, 50000)
+    fark = np.abs(yuzey.skor(islem, hata) - tam.toplu_skorlar(islem, hata))
+    assert yuzey.p99_hata < 1.0
+    assert yuzey.p99_hata <= yuzey.maks_hata
+    assert np.mean(fark > yuzey.p99_hata) <= 0.02
+    # Süreksizlik (hiç kural ateşlenmeyen bölge) kenarındaki büyük hata da raporlanır
+    assert yuzey.maks_hata > 10
+
+
+def test_eski_kurallarla_uretilmis_yuzey_reddedilir(yuzey, tmp_path):
+    yol = tmp_path / 'yuzey.npy'
+    yuzey.kaydet(yol)
+    degisik = _degisik_kurallar()
+    assert degisik.kural_tabani.imza != yuzey.degerlendirici.kural_tabani.imza
+    with pytest.raises(ValueError, match='başka bir kural tanımıyla'):
+        PerformansYuzeyi.yukle(yol, degerlendirici=degisik)
+
+    PerformansYuzeyi.olustur(21, 101, degerlendirici=degisik).kaydet(yol)
+    with pytest.raises(ValueError, match='başka bir kural tanımıyla'):
+        PerformansYuzeyi.yukle(yol)
+
+
+def test_uyumsuz_yuzey_dosyasi_reddedilir(yuzey, tmp_path):
+    yol = tmp_path / 'yuzey.npy'
+    yuzey.kaydet(yol)
+    np.save(yol, np.zeros((21, 101)))   # tablo meta verisi olmadan değiştirilmiş
+    with pytest.raises(ValueError, match='meta veriyle uyuşmuyor'):
+        PerformansYuzeyi.yukle(yol)
+
+    yalniz_tablo = tmp_path / 'yalniz.npy'
+    np.save(yalniz_tablo, yuzey.tablo)
+    with pytest.raises(ValueError, match='meta dosyası'):
+        PerformansYuzeyi.yukle(yalniz_tablo)
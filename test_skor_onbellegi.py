@@ -0,0 +1,121 @@
+import json
+
+import numpy as np
+import pytest
+
+import fuzzy_system
+from fuzzy_system import (VARSAYILAN_KURAL_DOSYASI, SkorOnbellegi, kurallari_yukle,
+                          skor_onbellegini_ac, skor_onbellegini_kapat, varsayilan_degerlendirici)
+
+# Kural kenarına yakın ve çok basamaklı girdiler: nicemleme bu noktalarda sonucu değiştirir
+NOKTALAR = [(40, 0.1999), (12, 0.1234567), (18, 0.05), (25, 0.3), (3.5, 0.6)]
+
+
+@pytest.fixture
+def degerlendirici():
+    return varsayilan_degerlendirici()
+
+
+@pytest.fixture
+def acik_onbellek():
+    onbellek = skor_onbellegini_ac(kapasite=8)
+    yield onbellek
+    skor_onbellegini_kapat()
+    kurallari_yukle()
+
+
+def test_varsayilan_anahtar_onbelleksizle_ayni(degerlendirici):
+    islem, hata = np.array(NOKTALAR).T
+    beklenen = degerlendirici.toplu_degerlendir(islem, hata)
+
+    tekil = SkorOnbellegi(degerlendirici=degerlendirici)
+    toplu = SkorOnbellegi(degerlendirici=degerlendirici)
+    for _ in range(2):   # ilk tur ıskalama, ikinci tur isabet
+        for islem_val, hata_val in NOKTALAR:
+            assert (tekil.degerlendir(islem_val, hata_val, 'Op-1')
+                    == degerlendirici.degerlendir(islem_val, hata_val, 'Op-1'))
+        sonuc = toplu.toplu_degerlendir(islem, hata)
+        np.testing.assert_array_equal(sonuc['performans'], beklenen['performans'])
+        for ad, aktivasyon in beklenen['kural_aktivasyonlari'].items():
+            np.testing.assert_array_equal(sonuc['kural_aktivasyonlari'][ad], aktivasyon)
+
+    # Tekil yoldan dolan kayıtlar toplu çağrıya da döner: fark yalnızca motor yuvarlaması
+    np.testing.assert_allclose(tekil.toplu_degerlendir(islem, hata)['performans'],
+                               beklenen['performans'], rtol=0, atol=1e-12)
+    assert tekil.iskalama == len(NOKTALAR)
+
+
+def test_nicemleme_yaklasiklik_farki(degerlendirici):
+    onbellek = SkorOnbellegi(islem_basamak=0, hata_basamak=3, degerlendirici=degerlendirici)
+    assert onbellek.anahtar(40, 0.1999) == (40, 200)
+
+    # Kural kenarı: 0.1999 -> 0.2 başka bir kural bölgesine düşer
+    assert degerlendirici.skor_hesapla(40, 0.1999) == pytest.approx(80.005, abs=1e-3)
+    assert onbellek.degerlendir(40, 0.1999, 'Op-1')['performans'] == 0
+    # Kenardan uzakta fark, yarım basamaklık kaymanın etkisi kadardır
+    assert onbellek.degerlendir(12, 0.1234567, 'Op-1')['performans'] == pytest.approx(
+        degerlendirici.skor_hesapla(12, 0.123))
+    assert degerlendirici.skor_hesapla(12, 0.1234567) != degerlendirici.skor_hesapla(12, 0.123)
+
+    toplu = onbellek.toplu_degerlendir([40, 12], [0.1999, 0.1234567])
+    np.testing.assert_allclose(toplu['performans'],
+                               [0, degerlendirici.skor_hesapla(12, 0.123)])
+
+
+def test_isabet_ve_iskalama_sayilari(degerlendirici):
+    onbellek = SkorOnbellegi(degerlendirici=degerlendirici)
+    onbellek.degerlendir(10, 0.1, 'Op-1')
+    onbellek.degerlendir(10, 0.1, 'Op-2')
+    onbellek.degerlendir(20, 0.1, 'Op-1')
+    assert (onbellek.isabet, onbellek.iskalama) == (1, 2)
+
+    # Toplu çağrıda tekrarlanan anahtarlar bir kez aranır
+    onbellek.toplu_degerlendir([10, 10, 30, 30, 30], [0.1, 0.1, 0.2, 0.2, 0.2])
+    istatistik = onbellek.istatistikler()
+    assert (istatistik['isabet'], istatistik['iskalama']) == (2, 3)
+    assert istatistik['boyut'] == len(onbellek) == 3
+    assert istatistik['isabet_orani'] == pytest.approx(2 / 5)
+
+
+def test_lru_tahliye_sirasi(degerlendirici):
+    onbellek = SkorOnbellegi(kapasite=2, degerlendirici=degerlendirici)
+    a, b, c = (10, 0.1), (20, 0.2), (30, 0.3)
+    onbellek.degerlendir(*a, 'Op-1')
+    onbellek.degerlendir(*b, 'Op-1')
+    onbellek.degerlendir(*a, 'Op-1')   # a en yeni, b en eski
+    onbellek.degerlendir(*c, 'Op-1')   # b atılır
+    assert onbellek.tahliye == 1
+    assert list(onbellek._kayitlar) == [onbellek.anahtar(*a), onbellek.anahtar(*c)]
+
+    iskalama = onbellek.iskalama
+    onbellek.degerlendir(*a, 'Op-1')
+    assert onbellek.iskalama == iskalama
+    onbellek.degerlendir(*b, 'Op-1')   # yeniden hesaplanır, şimdi c atılır
+    assert onbellek.iskalama == iskalama + 1
+    assert onbellek.tahliye == 2
+    assert list(onbellek._kayitlar) == [onbellek.anahtar(*a), onbellek.anahtar(*b)]
+
+
+def test_kurallari_yukle_onbellegi_bosaltir(acik_onbellek, tmp_path):
+    eski = acik_onbellek.degerlendirici
+    onceki = fuzzy_system.fuzzy_performans_degerlendirme(40, 0.05, 'Op-1')['performans']
+    fuzzy_system.toplu_performans_degerlendirme([10, 25], [0.1, 0.3])
+    assert len(acik_onbellek) == 3
+
+    with open(VARSAYILAN_KURAL_DOSYASI, encoding='utf-8') as f:
+        tanim = json.load(f)
+    for kural in tanim['kurallar']:
+        if kural['sonuc'] == 'yuksek':
+            kural['sonuc'] = 'orta'
+    yol = tmp_path / 'kurallar.json'
+    yol.write_text(json.dumps(tanim), encoding='utf-8')
+
+    yeni = kurallari_yukle(str(yol))
+    assert fuzzy_system.skor_onbellegi() is acik_onbellek
+    assert acik_onbellek.degerlendirici is yeni and yeni is not eski
+    assert len(acik_onbellek) == 0
+    assert acik_onbellek.istatistikler()['gecersiz_kilma'] == 1
+
+    sonraki = fuzzy_system.fuzzy_performans_degerlendirme(40, 0.05, 'Op-1')['performans']
+    assert sonraki == yeni.skor_hesapla(40, 0.05)
+    assert sonraki != onceki
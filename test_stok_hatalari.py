@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from depo_veri import (OZET_SUTUNLARI, akis_ozeti_oku, hata_orani_hesapla, stok_bayraklari,
+                       stok_hatalari, tipleri_uygula)
+
+# Dosya sırasıyla hareketler. 4. satır (03.01 GİRİŞ) 5. satırdan (02.01 ÇIKIŞ)
+# önce gelir; tarih sıralaması yapılmazsa Urun-A hiç eksiye düşmez.
+#   Urun-A: 10 → 6 → (02.01) -2 ✗ → (03.01) 3 → 0
+#   Urun-B: (02.01) -1 ✗ → (04.01) -3 ✗
+HAREKETLER = [
+    ('2024-01-01', 'GIRIS', 'Urun-A', 10, 'KG', 'Op-1'),
+    ('2024-01-01', 'CIKIS', 'Urun-A', 4, 'KG', 'Op-1'),
+    ('2024-01-02', 'CIKIS', 'Urun-B', 1, 'ADET', 'Op-1'),
+    ('2024-01-03', 'GIRIS', 'Urun-A', 5, 'KG', 'Op-3'),
+    ('2024-01-02', 'CIKIS', 'Urun-A', 8, 'KG', 'Op-2'),
+    ('2024-01-03', 'CIKIS', 'Urun-A', 3, 'KG', 'Op-2'),
+    ('2024-01-04', 'CIKIS', 'Urun-B', 2, 'ADET', 'Op-2'),
+]
+
+BEKLENEN_CIKIS = {'Op-1': 2, 'Op-2': 3}
+BEKLENEN_HATALI = {'Op-1': 1, 'Op-2': 2}
+BEKLENEN_ORAN = {'Op-1': 0.5, 'Op-2': 2 / 3, 'Op-3': 0.0}
+BEKLENEN_STOK = {'Urun-A': 0.0, 'Urun-B': -3.0}
+
+
+@pytest.fixture
+def hareketler():
+    return tipleri_uygula(pd.DataFrame(HAREKETLER, columns=OZET_SUTUNLARI))
+
+
+def test_stok_hatalari_sayilari(hareketler):
+    cikis, hatali, son_stok = stok_hatalari(hareketler)
+    assert cikis.to_dict() == BEKLENEN_CIKIS
+    assert hatali.to_dict() == BEKLENEN_HATALI
+    assert son_stok.to_dict() == BEKLENEN_STOK
+
+
+def test_hata_oranlari(hareketler):
+    cikis, hatali, _ = stok_hatalari(hareketler)
+    oran = hata_orani_hesapla(cikis, hatali, pd.Index(['Op-1', 'Op-2', 'Op-3']))
+    assert oran.to_dict() == pytest.approx(BEKLENEN_ORAN)
+
+
+def test_devreden_stok_hatalari_onler(hareketler):
+    # Urun-A için 5 birim başlangıç stoku: 02.01 ÇIKIŞ'ı stoku 3'e indirir, eksiye düşürmez
+    cikis, hatali, son_stok = stok_hatalari(hareketler, pd.Series({'Urun-A': 5.0}))
+    assert cikis.to_dict() == BEKLENEN_CIKIS
+    assert hatali.to_dict() == {'Op-1': 1, 'Op-2': 1}
+    assert son_stok['Urun-A'] == 5.0
+
+
+def test_stok_bayraklari_dosya_sirasiyla(hareketler):
+    cikis_satiri, eksi, son_stok = stok_bayraklari(hareketler)
+    np.testing.assert_array_equal(cikis_satiri, [False, True, True, False, True, True, True])
+    np.testing.assert_array_equal(eksi, [False, False, True, False, True, False, True])
+    assert son_stok.to_dict() == BEKLENEN_STOK
+
+
+# Parçalar dosya sırasıyla işlenir (HareketOzeti); sırası bozuk 4. ve 5. satırlar
+# aynı parçada kalacak boyutlar seçilmiştir
+@pytest.mark.parametrize('parca_boyutu', [3, 100])
+def test_akis_ozeti_parcalar_arasinda_stok_devreder(tmp_path, parca_boyutu):
+    dosya = tmp_path / 'hareketler.csv'
+    pd.DataFrame(HAREKETLER, columns=OZET_SUTUNLARI).to_csv(dosya, index=False)
+    ozet = akis_ozeti_oku(str(dosya), parca_boyutu=parca_boyutu, onbellek=False)
+    assert ozet.cikis_sayilari.to_dict() == BEKLENEN_CIKIS
+    assert ozet.hatali_cikislar[ozet.hatali_cikislar > 0].to_dict() == BEKLENEN_HATALI
+    assert ozet.hata_oranlari().to_dict() == pytest.approx(BEKLENEN_ORAN)
+    assert ozet.operator_ozeti('Op-2') == (3, pytest.approx(2 / 3))
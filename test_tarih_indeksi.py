@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from depo_veri import OZET_SUTUNLARI, tipleri_uygula
+from tarih_indeksi import TarihIndeksi
+
+
+@pytest.fixture
+def hareketler():
+    """Dosya sırası karışık, birkaç günü boş ve tarihi eksik satırları olan tablo"""
+    rng = np.random.default_rng(7)
+    n = 400
+    gunler = pd.Timestamp('2024-03-01') + pd.to_timedelta(rng.choice([0, 1, 2, 4, 5, 9, 10], n), unit='D')
+    df = pd.DataFrame({
+        'Tarih': gunler.strftime('%Y-%m-%d'),
+        'Hareket_Turu': rng.choice(['GIRIS', 'CIKIS'], n),
+        'Urun_Kodu': rng.choice(['Urun-A', 'Urun-B', 'Urun-C'], n),
+        'Miktar': rng.integers(1, 50, n),
+        'Birim': rng.choice(['KG', 'ADET'], n),
+        'Operator_ID': rng.choice(['Op-1', 'Op-2', 'Op-3', 'Op-4'], n),
+    }, columns=OZET_SUTUNLARI)
+    df.loc[[0, 57, 399], 'Tarih'] = None
+    return tipleri_uygula(df)
+
+
+def _maske(df, bas, son):
+    maske = df['Tarih'].notna()
+    if bas is not None:
+        maske &= df['Tarih'] >= pd.Timestamp(bas)
+    if son is not None:
+        maske &= df['Tarih'] <= pd.Timestamp(son)
+    if bas is None and son is None:
+        maske[:] = True
+    return df[maske]
+
+
+def _cikis_toplamlari(df):
+    cikis = df[df['Hareket_Turu'] == 'CIKIS']
+    return tuple(int(cikis.loc[cikis['Birim'] == birim, 'Miktar'].sum()) for birim in ('KG', 'ADET'))
+
+
+PENCERELER = [
+    (None, None),
+    ('2024-03-01', '2024-03-01'),
+    ('2024-03-02', '2024-03-05'),
+    ('2024-03-03', '2024-03-03'),   # veri olmayan gün
+    ('2024-03-06', None),
+    (None, '2024-03-04'),
+    ('2024-02-01', '2024-02-10'),   # verinin dışında
+]
+
+
+@pytest.mark.parametrize('bas, son', PENCERELER)
+def test_pencere_toplamlari_maskeyle_ayni(hareketler, bas, son):
+    indeks = TarihIndeksi(hareketler)
+    beklenen = _maske(hareketler, bas, son)
+
+    assert indeks.gunluk_ozet(bas, son) == _cikis_toplamlari(beklenen)
+    sayilar = beklenen['Operator_ID'].value_counts()
+    assert indeks.operator_sayilari(bas, son).to_dict() == sayilar[sayilar > 0].to_dict()
+    ozet = indeks.pencere_ozeti(bas, son)
+    assert ozet.satir_sayisi == len(beklenen)
+    assert ozet.gunluk_ozet() == _cikis_toplamlari(beklenen)
+
+
+def test_tarihsiz_satirlar_yalnizca_sinirsiz_sorguda(hareketler):
+    indeks = TarihIndeksi(hareketler)
+    assert indeks.satir_sayisi == len(hareketler)
+    assert indeks.ilk_gun == pd.Timestamp('2024-03-01')
+    assert indeks.son_gun == pd.Timestamp('2024-03-11')
+    assert np.all(np.diff(indeks.gunler) >= 0)
+
+    tarihli = hareketler[hareketler['Tarih'].notna()]
+    assert indeks.pencere_ozeti('2024-03-01', '2024-03-11').satir_sayisi == len(tarihli)
+    assert indeks.pencere_ozeti().satir_sayisi == len(hareketler)
+
+    bas, son = indeks.son_gunler(3)
+    assert (bas, son) == (pd.Timestamp('2024-03-09'), pd.Timestamp('2024-03-11'))
+    assert indeks.pencere_ozeti(bas, son).satir_sayisi == len(_maske(hareketler, bas, son))
+
+
+def test_gunluk_tablo_ve_kayan_toplamlar(hareketler):
+    indeks = TarihIndeksi(hareketler)
+    tablo = indeks.gunluk_tablo()
+    assert tablo.index[0] == pd.Timestamp('2024-03-01') and tablo.index[-1] == pd.Timestamp('2024-03-11')
+    for gun, satir in tablo.iterrows():
+        beklenen = _maske(hareketler, gun, gun)
+        assert (satir['KG'], satir['ADET']) == _cikis_toplamlari(beklenen)
+        assert satir['Islem_Sayisi'] == len(beklenen)
+
+    kayan = indeks.kayan_toplamlar(3)
+    gun = pd.Timestamp('2024-03-06')
+    beklenen = _maske(hareketler, gun - pd.Timedelta(days=2), gun)
+    assert kayan.loc[gun, 'Islem_Sayisi'] == len(beklenen)
+    assert (kayan.loc[gun, 'KG'], kayan.loc[gun, 'ADET']) == _cikis_toplamlari(beklenen)
+
+
+def test_tumu_tarihsiz(hareketler):
+    indeks = TarihIndeksi(hareketler.assign(Tarih=pd.NaT).head(5))
+    assert indeks.son_gun is None
+    assert indeks.pencere_ozeti().satir_sayisi == 5
+    assert indeks.pencere_ozeti('2024-03-01', '2024-03-31').satir_sayisi == 0
+    assert indeks.gunluk_tablo().empty
+
+
+def test_pencere_hata_orani_devreden_stokla():
+    # Pencere öncesinde giren stok pencere içindeki ÇIKIŞ'ı karşılar (stok sıfırlanmaz)
+    df = tipleri_uygula(pd.DataFrame([
+        ('2024-01-01', 'GIRIS', 'Urun-A', 10, 'KG', 'Op-1'),
+        ('2024-01-05', 'CIKIS', 'Urun-A', 4, 'KG', 'Op-2'),
+        ('2024-01-06', 'CIKIS', 'Urun-A', 8, 'KG', 'Op-2'),
+    ], columns=OZET_SUTUNLARI))
+    ozet = TarihIndeksi(df).pencere_ozeti('2024-01-05', '2024-01-06')
+    assert ozet.cikis_sayilari.to_dict() == {'Op-2': 2}
+    assert ozet.hatali_cikislar.to_dict() == {'Op-2': 1}
+
+
+@pytest.mark.parametrize('n_gun', [1, 3, 6])
+def test_pencere_hata_orani_veritabaniyla_ayni(hareketler, tmp_path, n_gun):
+    from depo_veritabani import HareketVeritabani
+    csv = tmp_path / 'hareketler.csv'
+    hareketler.to_csv(csv, index=False, date_format='%Y-%m-%d')
+    indeks = TarihIndeksi(hareketler)
+    bas, son = indeks.son_gunler(n_gun)
+    with HareketVeritabani(str(tmp_path / 'depo.sqlite')) as db:
+        db.ice_aktar(str(csv))
+        beklenen = db.ozet(bas, son).hata_oranlari()
+    pd.testing.assert_series_equal(indeks.pencere_ozeti(bas, son).hata_oranlari(), beklenen,
+                                   check_names=False, check_index_type=False)